@@ -0,0 +1,7 @@
+"""
+SYMBI Framework - Python toolkit
+
+Python counterparts of the TypeScript modules in ``src/lib/symbi-framework``
+and ``src/lib/audit``: audit bundle storage and the batch/streaming tooling
+used around the detector scripts.
+"""
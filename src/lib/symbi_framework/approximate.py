@@ -0,0 +1,201 @@
+"""
+Approximate Scoring
+
+Triage scores for very long documents from a stratified sample of windows,
+with bootstrap error bounds. Exact scoring (``ScoringSpec.score``,
+``LargeDocumentScorer``) stays the default; this is an opt-in entry point.
+
+The UTF-8 document is cut into ``window_size`` byte slots and the slots into
+contiguous strata. Each round scans the next slots of a random order within
+every stratum, using the windowed scanner of ``large_document`` (so matches
+crossing a slot edge are still counted once). Then:
+
+- count features are extrapolated per stratum by bytes
+  (``stratum bytes * sampled count / sampled bytes``) and summed
+- presence features are present when any sampled window has them
+
+Windows only get ``_LEFT_CONTEXT`` bytes before their core (for ``\b`` and
+similar look-behind) instead of the full overlap: matches are attributed to
+the window they start in, so only the right side needs the full reach.
+
+Error bounds come from resampling the sampled windows within each stratum
+and re-scoring the resampled counts (``confidence.score_rows``). A presence
+feature seen in few windows widens the bounds this way; one seen in none
+would not, yet by the rule of three it may still be in about ``3 / n`` of
+the windows after ``n`` misses, i.e. in several unsampled windows whenever
+less than ``EXACT_SHARE`` is sampled. So unseen presence features are never
+ruled out: the upper bound takes every one as present in the components it
+raises and the lower bound in those it lowers (``finalize`` steps are
+non-decreasing in component values, as the balanced one is).
+
+Each round doubles the windows per stratum, until the ``target_error`` on
+``target_dimension`` is met or the ``time_budget`` would be exceeded. Once a
+round would sample more than ``EXACT_SHARE`` of the windows, the document is
+scored exactly instead (always the case for short documents).
+"""
+
+import mmap
+import os
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .confidence import DOCUMENT_DIMENSIONS, component_arrays, score_components, score_rows
+from .large_document import Buffer, LargeDocumentScorer, _snap
+from .spec import ScoringSpec
+
+_LEFT_CONTEXT = 16
+# Sampled share of the windows above which an exact pass is used instead (per byte,
+# scanning separate windows costs about twice as much as one exact pass)
+EXACT_SHARE = 0.25
+# Fewest strata sampled (two windows each), so the bounds have some spread to go on
+MIN_STRATA = 4
+
+
+class ApproximateScorer(LargeDocumentScorer):
+    """Stratified window sampling over a spec's features"""
+
+    def __init__(self, variant: str = 'balanced', fraction: float = 0.02,
+                 target_error: Optional[float] = None, target_dimension: str = 'overallScore',
+                 time_budget: Optional[float] = None, window_size: int = 2048, max_reach: int = 64,
+                 confidence: float = 0.95, resamples: int = 100, seed: Optional[int] = None,
+                 spec: Optional[ScoringSpec] = None):
+        """``fraction`` is the share of the document scanned in the first round"""
+        super().__init__(variant, window_size, max_reach, spec)
+        if not 0 < fraction <= 1:
+            raise ValueError('fraction must be in (0, 1]')
+        if target_dimension not in DOCUMENT_DIMENSIONS:
+            raise ValueError(f"Unknown dimension '{target_dimension}'. Available: {', '.join(DOCUMENT_DIMENSIONS)}")
+        self.fraction = fraction
+        self.target_error = target_error
+        self.target_dimension = target_dimension
+        self.time_budget = time_budget
+        self.confidence = confidence
+        self.resamples = resamples
+        self.seed = seed
+        self._presence = np.array([not feature.count for feature in self.spec.features])
+
+    def _window_counts(self, data: Buffer, start: int, end: int) -> List[int]:
+        counts = [0] * len(self.spec.features)
+        left = _snap(data, max(0, start - _LEFT_CONTEXT))
+        right = _snap(data, min(len(data), end + self.overlap))
+        self._scan(data, left, start, end, right, counts)
+        return counts
+
+    def _estimate(self, counts: np.ndarray, sizes: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Document counts from ``(..., strata, windows, features)`` samples"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rates = counts.sum(axis=-2) / sizes.sum(axis=-1)[..., None]
+        estimate = (np.nan_to_num(rates) * totals[:, None]).sum(axis=-2)
+        present = (counts > 0).any(axis=(-3, -2))
+        return np.where(self._presence, present, estimate)
+
+    def _bounds(self, sample: np.ndarray, sizes: np.ndarray, totals: np.ndarray,
+                rng: np.random.Generator) -> np.ndarray:
+        """``(2, DOCUMENT_DIMENSIONS)`` percentile bounds from resampling windows within strata"""
+        strata, taken = sizes.shape
+        picks = rng.integers(0, taken, size=(self.resamples, strata, taken))
+        strata_index = np.arange(strata)[None, :, None]
+        resampled = self._estimate(sample[strata_index, picks], sizes[strata_index, picks], totals)
+        arrays = component_arrays(self.spec, resampled)
+        unseen = self._presence & ~(sample > 0).any(axis=(0, 1))
+        lower = score_components(self.spec, self._shift(arrays, unseen, np.minimum))
+        upper = score_components(self.spec, self._shift(arrays, unseen, np.maximum))
+        return np.array([np.quantile(lower, (1 - self.confidence) / 2, axis=0),
+                         np.quantile(upper, (1 + self.confidence) / 2, axis=0)])
+
+    def _shift(self, arrays: Dict[str, Dict[str, np.ndarray]], unseen: np.ndarray,
+               side: np.ufunc) -> Dict[str, Dict[str, np.ndarray]]:
+        """Component values with the ``unseen`` features present where ``side`` picks their weights
+
+        Shifting the already clamped values and clamping again never narrows the range.
+        """
+        shifted: Dict[str, Dict[str, np.ndarray]] = {}
+        for dimension, components in self.spec.dimensions.items():
+            for component in components:
+                value = arrays[dimension][component.name]
+                shift = sum(side(rule.contribution(1), 0) for rule in component.rules if unseen[rule.feature])
+                if shift:
+                    value = value + shift
+                    if component.high is not None:
+                        value = np.minimum(value, component.high)
+                    if component.low is not None:
+                        value = np.maximum(value, component.low)
+                shifted.setdefault(dimension, {})[component.name] = value
+        return shifted
+
+    def score(self, content: Union[str, Buffer]) -> Dict[str, Any]:
+        """Approximate result with an ``approximation`` entry holding the bounds"""
+        data = content.encode('utf-8', errors='surrogatepass') if isinstance(content, str) else content
+        began = time.perf_counter()
+        size = len(data)
+        slots = max(1, -(-size // self.window_size))
+        bounds = np.array([_snap(data, min(size, k * self.window_size)) for k in range(slots)] + [size])
+        slot_sizes = np.diff(bounds)
+
+        # Two windows per stratum in the first round
+        strata_count = max(MIN_STRATA, round(slots * self.fraction / 2))
+        strata = np.array_split(np.arange(slots), max(1, min(slots // 2, strata_count)))
+        rng = np.random.default_rng(self.seed)
+        orders = [rng.permutation(stratum) for stratum in strata]
+        totals = np.array([slot_sizes[stratum].sum() for stratum in strata], dtype=np.float64)
+        scanned: Dict[int, List[int]] = {}
+        per_stratum, rounds, exact = 2, 0, False
+
+        while True:
+            if per_stratum * len(orders) > slots * EXACT_SHARE:
+                # Sampling this much costs more than a plain exact pass
+                estimate = np.array(self.counts(data), dtype=np.float64)
+                lower = upper = score_rows(self.spec, estimate[None])[0]
+                exact = True
+                break
+            round_began = time.perf_counter()
+            for order in orders:
+                for slot in order[:per_stratum].tolist():
+                    if slot not in scanned:
+                        scanned[slot] = self._window_counts(data, int(bounds[slot]), int(bounds[slot + 1]))
+            rounds += 1
+            # array_split strata differ by one slot at most; all use the same number of windows
+            taken = min(per_stratum, min(len(order) for order in orders))
+            sample = np.array([[scanned[slot] for slot in order[:taken].tolist()] for order in orders],
+                              dtype=np.float64)
+            sizes = np.array([slot_sizes[order[:taken]] for order in orders], dtype=np.float64)
+            estimate = self._estimate(sample, sizes, totals)
+            lower, upper = self._bounds(sample, sizes, totals, rng)
+            if self.target_error is None and self.time_budget is None:
+                break
+            target = DOCUMENT_DIMENSIONS.index(self.target_dimension)
+            if self.target_error is not None and (upper[target] - lower[target]) / 2 <= self.target_error:
+                break
+            now = time.perf_counter()
+            # The next round scans as many new windows as all rounds so far
+            if self.time_budget is not None and (now - began) + 2 * (now - round_began) > self.time_budget:
+                break
+            per_stratum *= 2
+
+        results = self.spec.evaluate(estimate.tolist())
+        sampled = float(slot_sizes[list(scanned)].sum()) / size if size and not exact else 1.0
+        results['approximation'] = {
+            'exact': exact,
+            'windows': len(scanned),
+            'sampled_fraction': round(sampled, 4),
+            'rounds': rounds,
+            'confidence': self.confidence,
+            'intervals': {dim: [float(lower[i]), float(upper[i])] for i, dim in enumerate(DOCUMENT_DIMENSIONS)},
+            'error': {dim: float(upper[i] - lower[i]) / 2 for i, dim in enumerate(DOCUMENT_DIMENSIONS)},
+            'seconds': round(time.perf_counter() - began, 6)
+        }
+        return results
+
+    def score_file(self, path: str) -> Dict[str, Any]:
+        if os.path.getsize(path) == 0:
+            return self.score(b'')
+        with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return self.score(data)
+
+
+def score_approximate(content: Union[str, Buffer], variant: str = 'balanced', fraction: float = 0.02,
+                      target_error: Optional[float] = None, time_budget: Optional[float] = None,
+                      seed: Optional[int] = None) -> Dict[str, Any]:
+    return ApproximateScorer(variant, fraction, target_error, time_budget=time_budget, seed=seed).score(content)
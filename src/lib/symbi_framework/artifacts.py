@@ -0,0 +1,204 @@
+"""
+Matcher Artifacts
+
+Precompiled regex programs for the scoring specs and multilingual automata,
+serialized to a versioned cache file so short-lived processes (CLI calls,
+fresh pool workers) skip pattern parsing and compilation:
+
+    ~/.cache/symbi/matchers-cp311.bin    marshal of runtime key + pattern programs
+
+``re.compile`` parses and compiles in Python; an artifact stores the
+resulting ``_sre`` program per ``(source, flags)`` and ``compile_pattern``
+hands it straight to ``_sre.compile``, which is about 20x faster. Programs
+are only valid for the interpreter that produced them, so the file is keyed
+by Python version and ``_sre.MAGIC``; on any mismatch or error the cache is
+ignored and ``re.compile`` is used. Sources missing from the artifact (a
+pattern edited since it was built) are simply compiled normally.
+
+Only spec consumers (``ScoringSpec``, ``MultilingualScorer``) compile through
+``compile_pattern``; the tester variants use ``re`` directly and gain nothing
+from an artifact. ``warm_process`` is therefore called by spec entry points
+(``symbi-score score --approximate`` and its workers), at most once per
+process; set ``SYMBI_NO_ARTIFACTS`` to skip it.
+
+Trust: an artifact is loaded with ``marshal`` and its programs run in the
+regex engine unchecked, so the cache directory must only be writable by the
+user running the scorer. ``load_artifact`` refuses files (and directories)
+owned by another user or writable by group or others, and new cache
+directories are created ``0700``. Point ``SYMBI_CACHE_DIR`` elsewhere, or set
+``SYMBI_NO_ARTIFACTS``, where that cannot be guaranteed.
+
+This module only imports the standard library, so loading it does not pull
+in NumPy.
+"""
+
+import marshal
+import os
+import re
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import _sre
+
+try:
+    from re import _compiler as _sre_compiler, _parser as _sre_parser
+except ImportError:  # Python < 3.11
+    import sre_compile as _sre_compiler
+    import sre_parse as _sre_parser
+
+ARTIFACT_FORMAT = 'symbi-matchers'
+ARTIFACT_VERSION = 1
+RUNTIME = (tuple(sys.version_info[:2]), _sre.MAGIC, _sre.CODESIZE)
+DISABLE_ENV = 'SYMBI_NO_ARTIFACTS'
+
+_warmed = False
+
+_CODE_TYPE = {2: 'H', 4: 'I'}[_sre.CODESIZE]
+
+Source = Union[str, bytes]
+# (source, flags) -> (flags, code, groups, groupindex, indexgroup)
+_programs: Dict[Tuple[Source, int], Tuple[int, bytes, int, Dict[str, int], tuple]] = {}
+
+
+def default_path() -> str:
+    directory = os.environ.get('SYMBI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'symbi')
+    return os.path.join(directory, f'matchers-cp{sys.version_info[0]}{sys.version_info[1]}.bin')
+
+
+def compile_pattern(source: Source, flags: int = 0) -> 're.Pattern':
+    """``re.compile``, using a loaded artifact program when there is one"""
+    program = _programs.get((source, flags))
+    if program is not None:
+        final_flags, code, groups, groupindex, indexgroup = program
+        try:
+            return _sre.compile(source, final_flags, array(_CODE_TYPE, code).tolist(),
+                                groups, groupindex, indexgroup)
+        except Exception:
+            del _programs[(source, flags)]
+    return re.compile(source, flags)
+
+
+def _program(source: Source, flags: int) -> Tuple[int, bytes, int, Dict[str, int], tuple]:
+    """What ``re.compile`` hands to ``_sre.compile`` for a source"""
+    parsed = _sre_parser.parse(source, flags)
+    code = _sre_compiler._code(parsed, flags)
+    groupindex = dict(parsed.state.groupdict)
+    indexgroup = [None] * parsed.state.groups
+    for name, index in groupindex.items():
+        indexgroup[index] = name
+    return (flags | parsed.state.flags, array(_CODE_TYPE, [int(op) for op in code]).tobytes(),
+            parsed.state.groups - 1, groupindex, tuple(indexgroup))
+
+
+def spec_digest(spec) -> str:
+    """Digest of a spec's feature table (what its artifact entries depend on)"""
+    import hashlib  # Deferred: loading OpenSSL costs more than a warm artifact load
+
+    digest = hashlib.sha256(spec.version.encode('utf-8'))
+    for feature in spec.features:
+        digest.update(feature.key.encode('utf-8') + b'\0')
+    return digest.hexdigest()[:16]
+
+
+def spec_sources(spec, languages: Optional[Iterable[str]] = None) -> List[Source]:
+    """Regex sources a spec compiles: features (str and bytes forms) and multilingual automata"""
+    from .multilingual import TERM_TABLES, MultilingualScorer
+    from .spec import TERM
+
+    sources: List[Source] = []
+    for feature in spec.features:
+        if feature.kind != TERM:
+            sources.append(feature.source)
+            if feature.source.isascii():
+                sources.append(feature.source.encode('ascii'))
+    scorer = MultilingualScorer(spec=spec)
+    for language in TERM_TABLES if languages is None else languages:
+        sources.append(scorer.automaton(language).pattern.pattern)
+    return sources
+
+
+def build_artifact(path: Optional[str] = None, specs: Optional[List[Any]] = None) -> str:
+    """Compile every pattern of ``specs`` (default: all) and write the artifact"""
+    from .spec import SPECS
+
+    path = path or default_path()
+    specs = list(SPECS.values()) if specs is None else specs
+    programs = []
+    for spec in specs:
+        for source in dict.fromkeys(spec_sources(spec)):
+            try:
+                programs.append((source, 0) + _program(source, 0))
+            except Exception:
+                continue  # Left to re.compile at run time
+    artifact = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'runtime': RUNTIME,
+        'specs': {spec.name: spec_digest(spec) for spec in specs},
+        'programs': programs
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        marshal.dump(artifact, f)
+    os.replace(temporary, path)
+    return path
+
+
+def _trusted(path: str) -> bool:
+    """Whether only the current user can have written ``path`` and its directory"""
+    if not hasattr(os, 'getuid'):
+        return True  # No POSIX ownership to check
+    for target in (path, os.path.dirname(os.path.abspath(path))):
+        stat = os.stat(target)
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+            return False
+    return True
+
+
+def load_artifact(path: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """Register an artifact's programs; returns its spec digests, or None if unusable or untrusted"""
+    path = path or default_path()
+    try:
+        if not _trusted(path):
+            return None
+        with open(path, 'rb') as f:
+            artifact = marshal.load(f)  # nosec B302 - own cache file, ownership and mode checked above
+        if (artifact.get('format') != ARTIFACT_FORMAT or artifact.get('version') != ARTIFACT_VERSION
+                or tuple(artifact.get('runtime', ())) != RUNTIME):
+            return None
+        for source, flags, final_flags, code, groups, groupindex, indexgroup in artifact['programs']:
+            _programs[(source, flags)] = (final_flags, code, groups, groupindex, indexgroup)
+    except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    return artifact['specs']
+
+
+def warm(path: Optional[str] = None, specs: Optional[List[Any]] = None) -> bool:
+    """Load the artifact, rebuilding it first if missing, stale or for another runtime
+
+    Call before the specs compile anything. Returns True when an existing
+    artifact was used as is.
+    """
+    from .spec import SPECS
+
+    specs = list(SPECS.values()) if specs is None else specs
+    digests = load_artifact(path)
+    if digests is not None and all(digests.get(spec.name) == spec_digest(spec) for spec in specs):
+        return True
+    try:
+        build_artifact(path, specs)
+    except OSError:
+        return False  # Unwritable cache directory: compile as usual
+    # Patterns compiled while building already live in the specs; new ones load from the file
+    load_artifact(path)
+    return False
+
+
+def warm_process() -> None:
+    """``warm`` once per process unless ``SYMBI_NO_ARTIFACTS`` is set; for spec entry points"""
+    global _warmed
+    if not _warmed and not os.environ.get(DISABLE_ENV):
+        _warmed = True
+        warm()
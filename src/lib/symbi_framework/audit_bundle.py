@@ -0,0 +1,262 @@
+"""
+Audit Bundle Container
+
+Stores Context Bridge tickets in a chunked, compressed container so that very
+large exports can be written as a stream and read selectively.
+
+Layout (all integers little-endian):
+
+    header   MAGIC (8 bytes) + format version (uint16)
+    chunks   zlib-compressed blocks, one JSON ticket per line
+    pages    zlib-compressed JSON id index pages: ``[id, chunk, position]``
+             rows sorted by id, ``index_page_size`` rows per page
+    footer   zlib-compressed JSON (chunk table + first id and location of
+             every index page)
+    trailer  footer offset (uint64) + footer length (uint32) + MAGIC
+
+A reader only touches the trailer, the footer, one index page and the chunks
+it needs, so fetching one ticket out of a multi-gigabyte bundle decompresses a
+single page and a single chunk. A writer whose ``with`` block raises stops
+without the index and trailer, so a failed export is rejected as incomplete
+rather than read as a shorter bundle.
+"""
+
+import bisect
+import json
+import os
+import struct
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+MAGIC = b'SYMBIBDL'
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct('<8sH')
+_TRAILER = struct.Struct('<QI8s')
+
+
+class BundleFormatError(ValueError):
+    """Raised when a file is not a valid audit bundle"""
+
+
+class AuditBundleWriter:
+    """Streaming writer for audit bundles"""
+
+    def __init__(self, target: Union[str, BinaryIO], chunk_size: int = 256,
+                 chunk_bytes: int = 4 * 1024 * 1024, compression_level: int = 6,
+                 index_page_size: int = 4096):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        if index_page_size < 1:
+            raise ValueError('index_page_size must be at least 1')
+        self._owns_file = isinstance(target, (str, os.PathLike))
+        self._fh = open(target, 'wb') if self._owns_file else target
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
+        self.compression_level = compression_level
+        self.index_page_size = index_page_size
+
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._chunks: List[List[int]] = []  # [offset, length, first_ordinal, count]
+        self._ids: Dict[str, List[int]] = {}  # ticket id -> [chunk, position]
+        self._count = 0
+        self._closed = False
+
+        self._fh.write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+        self._offset = _HEADER.size
+
+    def add(self, ticket_id: str, ticket: Dict[str, Any]) -> None:
+        """Append a ticket to the bundle"""
+        if self._closed:
+            raise ValueError('Cannot add tickets to a closed bundle')
+        if ticket_id in self._ids:
+            raise ValueError(f'Duplicate ticket id: {ticket_id}')
+
+        line = json.dumps(ticket, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        self._ids[ticket_id] = [len(self._chunks), len(self._pending)]
+        self._pending.append(line)
+        self._pending_bytes += len(line) + 1
+        self._count += 1
+
+        if len(self._pending) >= self.chunk_size or self._pending_bytes >= self.chunk_bytes:
+            self._flush_chunk()
+
+    def _flush_chunk(self) -> None:
+        """Compress and write the buffered tickets as one chunk"""
+        if not self._pending:
+            return
+        block = zlib.compress(b'\n'.join(self._pending), self.compression_level)
+        self._fh.write(block)
+        first_ordinal = self._count - len(self._pending)
+        self._chunks.append([self._offset, len(block), first_ordinal, len(self._pending)])
+        self._offset += len(block)
+        self._pending = []
+        self._pending_bytes = 0
+
+    def _write_pages(self) -> List[List[Any]]:
+        """Write the sorted id index pages; returns ``[first_id, offset, length]`` per page"""
+        rows = sorted([ticket_id, chunk, position] for ticket_id, (chunk, position) in self._ids.items())
+        pages = []
+        for start in range(0, len(rows), self.index_page_size):
+            page = rows[start:start + self.index_page_size]
+            block = zlib.compress(json.dumps(page, separators=(',', ':')).encode('utf-8'),
+                                  self.compression_level)
+            self._fh.write(block)
+            pages.append([page[0][0], self._offset, len(block)])
+            self._offset += len(block)
+        return pages
+
+    def close(self) -> None:
+        """Flush remaining tickets and write the id index pages and footer"""
+        if self._closed:
+            return
+        self._flush_chunk()
+        pages = self._write_pages()
+        footer = zlib.compress(json.dumps({
+            'version': FORMAT_VERSION,
+            'count': self._count,
+            'chunks': self._chunks,
+            'pages': pages
+        }, separators=(',', ':')).encode('utf-8'), self.compression_level)
+        self._fh.write(footer)
+        self._fh.write(_TRAILER.pack(self._offset, len(footer), MAGIC))
+        self._fh.flush()
+        if self._owns_file:
+            self._fh.close()
+        self._closed = True
+
+    def abort(self) -> None:
+        """Stop without writing the index: readers reject the bundle as incomplete"""
+        if self._closed:
+            return
+        if self._owns_file:
+            self._fh.close()
+        self._closed = True
+
+    def __enter__(self) -> 'AuditBundleWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class AuditBundleReader:
+    """Random-access reader for audit bundles"""
+
+    def __init__(self, source: Union[str, BinaryIO]):
+        self._owns_file = isinstance(source, (str, os.PathLike))
+        self._fh = open(source, 'rb') if self._owns_file else source
+        self._cached_chunk: Optional[Tuple[int, List[bytes]]] = None
+        self._cached_page: Optional[Tuple[int, List[List[Any]]]] = None
+        self._read_index()
+
+    def _read_index(self) -> None:
+        """Load the footer index via the fixed-size trailer"""
+        self._fh.seek(0)
+        header = self._fh.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise BundleFormatError('File too short to be an audit bundle')
+        magic, version = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise BundleFormatError('Bad bundle header')
+        if version != FORMAT_VERSION:
+            raise BundleFormatError(f'Unsupported bundle version: {version}')
+
+        if self._fh.seek(0, os.SEEK_END) < _HEADER.size + _TRAILER.size:
+            raise BundleFormatError('Bad bundle trailer (incomplete write?)')
+        self._fh.seek(-_TRAILER.size, os.SEEK_END)
+        footer_offset, footer_length, magic = _TRAILER.unpack(self._fh.read(_TRAILER.size))
+        if magic != MAGIC:
+            raise BundleFormatError('Bad bundle trailer (incomplete write?)')
+
+        self._fh.seek(footer_offset)
+        index = json.loads(zlib.decompress(self._fh.read(footer_length)))
+        self.version = index['version']
+        self._count = index['count']
+        self._chunks = index['chunks']
+        self._pages = index['pages']
+        self._page_firsts = [page[0] for page in self._pages]
+        self._chunk_starts = [chunk[2] for chunk in self._chunks]
+
+    def _load_chunk(self, chunk_index: int) -> List[bytes]:
+        """Read and decompress one chunk, keeping the last one cached"""
+        if self._cached_chunk and self._cached_chunk[0] == chunk_index:
+            return self._cached_chunk[1]
+        offset, length, _, _ = self._chunks[chunk_index]
+        self._fh.seek(offset)
+        lines = zlib.decompress(self._fh.read(length)).split(b'\n')
+        self._cached_chunk = (chunk_index, lines)
+        return lines
+
+    def _load_page(self, page_index: int) -> List[List[Any]]:
+        """Read and decompress one id index page, keeping the last one cached"""
+        if self._cached_page and self._cached_page[0] == page_index:
+            return self._cached_page[1]
+        _, offset, length = self._pages[page_index]
+        self._fh.seek(offset)
+        rows = json.loads(zlib.decompress(self._fh.read(length)))
+        self._cached_page = (page_index, rows)
+        return rows
+
+    def _locate(self, ticket_id: str) -> Optional[Tuple[int, int]]:
+        """``(chunk, position)`` of a ticket, reading at most one index page"""
+        page_index = bisect.bisect_right(self._page_firsts, ticket_id) - 1
+        if page_index < 0:
+            return None
+        rows = self._load_page(page_index)
+        i = bisect.bisect_left(rows, [ticket_id])
+        if i < len(rows) and rows[i][0] == ticket_id:
+            return rows[i][1], rows[i][2]
+        return None
+
+    def get(self, ticket_id: str) -> Dict[str, Any]:
+        """Fetch a single ticket by id"""
+        location = self._locate(ticket_id)
+        if location is None:
+            raise KeyError(f'Ticket not found in bundle: {ticket_id}')
+        chunk_index, position = location
+        return json.loads(self._load_chunk(chunk_index)[position])
+
+    def iter_range(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate tickets by write order in [start, stop), touching only the chunks needed"""
+        stop = self._count if stop is None else min(stop, self._count)
+        start = max(0, start)
+        if start >= stop:
+            return
+        chunk_index = bisect.bisect_right(self._chunk_starts, start) - 1
+        ordinal = start
+        while ordinal < stop:
+            _, _, first_ordinal, count = self._chunks[chunk_index]
+            lines = self._load_chunk(chunk_index)
+            for position in range(ordinal - first_ordinal, min(count, stop - first_ordinal)):
+                yield json.loads(lines[position])
+            ordinal = first_ordinal + count
+            chunk_index += 1
+
+    def ids(self) -> List[str]:
+        """Ticket ids in write order (reads every index page)"""
+        rows = [row for page_index in range(len(self._pages)) for row in self._load_page(page_index)]
+        return [row[0] for row in sorted(rows, key=lambda row: (row[1], row[2]))]
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._fh.close()
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return self._locate(ticket_id) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_range()
+
+    def __enter__(self) -> 'AuditBundleReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
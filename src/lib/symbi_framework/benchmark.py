@@ -0,0 +1,247 @@
+"""
+Incremental Benchmark Runner
+
+Scores a directory of ``<model>_<prompt>.md`` responses and keeps the
+per-file results in a cache directory, so a re-run only scores what changed:
+
+    cache/
+      manifest.json    scorer versions, per-file stat/hash/results, leaderboards
+      journal.ndjson   changes since manifest.json was last written, one run per line
+
+A run appends only the entries it changed to the journal; loading replays it
+over the manifest. Once the journal outgrows the manifest, the two are
+compacted into a new manifest.
+
+A file is rescored when its content hash changes; ``size`` and
+``mtime_ns`` are checked first, so unchanged files are not even read. A
+variant's results are all dropped when its ``variant_version`` (a digest of
+the tester script and the shared modules it imports) changes. Leaderboards
+are rebuilt from the cached per-file results and are themselves cached under
+a digest of their inputs.
+
+Pending files are read and scored as a stream and their results enter the
+manifest as they arrive; every ``CHECKPOINT`` results are journaled, so an
+interrupted cold run keeps most of its work.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .comparison import ComparisonMatrix, response_keys
+from .evaluation import score_stream
+from .variants import DEFAULT_VARIANT, variant_version
+
+MANIFEST_NAME = 'manifest.json'
+JOURNAL_NAME = 'journal.ndjson'
+BENCHMARK_FORMAT = 'symbi-benchmark'
+BENCHMARK_VERSION = 1
+# Results scored between journal writes
+CHECKPOINT = 1024
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BenchmarkRun:
+    """Outcome of one ``BenchmarkRunner.run``"""
+
+    def __init__(self, files: int, scored: Dict[str, int], reused: Dict[str, int], removed: int,
+                 leaderboards: Dict[str, List[Dict[str, Any]]]):
+        self.files = files
+        self.scored = scored
+        self.reused = reused
+        self.removed = removed
+        self.leaderboards = leaderboards
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'files': self.files,
+            'scored': self.scored,
+            'reused': self.reused,
+            'removed': self.removed,
+            'leaderboards': self.leaderboards
+        }
+
+
+class BenchmarkRunner:
+    """Scores changed response files only and caches results and leaderboards"""
+
+    def __init__(self, responses_dir: str, cache_dir: str,
+                 variants: Sequence[str] = (DEFAULT_VARIANT,), pattern: str = '*.md',
+                 workers: Optional[int] = None, batch_size: int = 64):
+        self.responses_dir = responses_dir
+        self.cache_dir = cache_dir
+        self.variants = list(variants)
+        self.pattern = pattern
+        self.workers = workers
+        self.batch_size = batch_size
+        self.manifest = self._load_manifest()
+        # File entries changed (or removed) and scorers/leaderboards as of the last save
+        self._changed: set = set()
+        self._saved = {key: dict(self.manifest[key]) for key in ('scorers', 'leaderboards')}
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.cache_dir, MANIFEST_NAME)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.cache_dir, JOURNAL_NAME)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        empty = {'format': BENCHMARK_FORMAT, 'version': BENCHMARK_VERSION,
+                 'scorers': {}, 'files': {}, 'leaderboards': {}}
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return empty
+        if manifest.get('format') != BENCHMARK_FORMAT or manifest.get('version') != BENCHMARK_VERSION:
+            return empty
+        try:
+            with open(self.journal_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        change = json.loads(line)
+                    except ValueError:
+                        break  # a run interrupted mid-write; later lines cannot follow
+                    self._apply(manifest, change)
+        except FileNotFoundError:
+            pass
+        return manifest
+
+    @staticmethod
+    def _apply(manifest: Dict[str, Any], change: Dict[str, Any]) -> None:
+        for name, entry in change.get('files', {}).items():
+            if entry is None:
+                manifest['files'].pop(name, None)
+            else:
+                manifest['files'][name] = entry
+        manifest['scorers'].update(change.get('scorers', {}))
+        manifest['leaderboards'].update(change.get('leaderboards', {}))
+
+    def _save_manifest(self) -> None:
+        """Append this run's changes to the journal, compacting when it outgrows the manifest"""
+        files = self.manifest['files']
+        change: Dict[str, Any] = {'files': {name: files.get(name) for name in sorted(self._changed)}}
+        for key in ('scorers', 'leaderboards'):
+            updates = {name: value for name, value in self.manifest[key].items()
+                       if self._saved[key].get(name) != value}
+            if updates:
+                change[key] = updates
+        self._changed = set()
+        self._saved = {key: dict(self.manifest[key]) for key in ('scorers', 'leaderboards')}
+        if len(change) == 1 and not change['files']:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if os.path.exists(self.manifest_path):
+            journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+            if journal_size <= os.path.getsize(self.manifest_path):
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(change, separators=(',', ':')) + '\n')
+                return
+        temporary = self.manifest_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, separators=(',', ':'))
+        os.replace(temporary, self.manifest_path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _refresh_files(self) -> int:
+        """Sync file entries with the directory; changed files lose their results"""
+        files = self.manifest['files']
+        present = set()
+        for path in sorted(glob.glob(os.path.join(self.responses_dir, self.pattern))):
+            name = os.path.relpath(path, self.responses_dir)
+            present.add(name)
+            stat = os.stat(path)
+            entry = files.get(name)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                continue
+            digest = _file_digest(path)
+            if entry is None or entry['sha256'] != digest:
+                entry = files[name] = {'sha256': digest, 'results': {}}
+            entry['size'], entry['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+            self._changed.add(name)
+        removed = [name for name in files if name not in present]
+        for name in removed:
+            del files[name]
+        self._changed.update(removed)
+        return len(removed)
+
+    def _leaderboard(self, variant: str, version: str) -> List[Dict[str, Any]]:
+        files = self.manifest['files']
+        inputs = hashlib.sha256(version.encode('utf-8'))
+        for name in sorted(files):
+            inputs.update(f"{name}\0{files[name]['sha256']}\0".encode('utf-8'))
+        key = inputs.hexdigest()
+        cached = self.manifest['leaderboards'].get(variant)
+        if cached and cached['inputs'] == key:
+            return cached['rows']
+        rows = self.matrix(variant).leaderboard() if files else []
+        self.manifest['leaderboards'][variant] = {'inputs': key, 'rows': rows}
+        return rows
+
+    def _read(self, names: List[str]) -> Iterator[str]:
+        for name in names:
+            with open(os.path.join(self.responses_dir, name), encoding='utf-8') as f:
+                yield f.read()
+
+    def run(self) -> BenchmarkRun:
+        """Bring cached results up to date and return leaderboards per variant"""
+        removed = self._refresh_files()
+        files = self.manifest['files']
+        scored, reused, leaderboards = {}, {}, {}
+        for variant in self.variants:
+            version = variant_version(variant)
+            if self.manifest['scorers'].get(variant) != version:
+                for name, entry in files.items():
+                    if entry['results'].pop(variant, None) is not None:
+                        self._changed.add(name)
+                self.manifest['scorers'][variant] = version
+            pending = [name for name, entry in files.items() if variant not in entry['results']]
+            results = score_stream(self._read(pending), variant, workers=self.workers, batch_size=self.batch_size)
+            for count, (name, result) in enumerate(zip(pending, results), 1):
+                files[name]['results'][variant] = result
+                self._changed.add(name)
+                if count % CHECKPOINT == 0:
+                    self._save_manifest()
+            scored[variant] = len(pending)
+            reused[variant] = len(files) - len(pending)
+            leaderboards[variant] = self._leaderboard(variant, version)
+        self._save_manifest()
+        return BenchmarkRun(len(files), scored, reused, removed, leaderboards)
+
+    def results(self, variant: str = DEFAULT_VARIANT) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Cached dimension results keyed by ``(model, prompt)``"""
+        files = self.manifest['files']
+        keys = response_keys(files)
+        return {keys[name]: entry['results'][variant] for name, entry in files.items() if variant in entry['results']}
+
+    def matrix(self, variant: str = DEFAULT_VARIANT) -> ComparisonMatrix:
+        return ComparisonMatrix.from_predictions(self.results(variant))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    default_dir = os.path.join(os.getcwd(), 'test', 'sample_responses')
+    parser = argparse.ArgumentParser(description='Incrementally benchmark a directory of response files')
+    parser.add_argument('directory', nargs='?', default=default_dir)
+    parser.add_argument('--cache', default='.symbi-benchmark')
+    parser.add_argument('--variant', action='append', dest='variants')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    runner = BenchmarkRunner(args.directory, args.cache, args.variants or [DEFAULT_VARIANT], workers=args.workers)
+    print(json.dumps(runner.run().to_dict(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Confidence Calibration
+
+Reliability histograms for trust receipts. Each histogram is three
+fixed-size arrays (count, confidence sum, correct sum) over bucket edges,
+so updates are O(batch) with no per-sample state, histograms from different
+workers merge by addition, and ECE/MCE are computed on demand. Bucket
+assignment for a batch is a single ``np.searchsorted`` over the inner edges.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class ReliabilityHistogram:
+    """Incremental reliability histogram over confidence buckets in [0, 1]"""
+
+    def __init__(self, n_buckets: int = 10, edges: Optional[Sequence[float]] = None,
+                 label_decimals: int = 1):
+        self.edges = np.asarray(edges if edges is not None else np.linspace(0.0, 1.0, n_buckets + 1),
+                                dtype=np.float64)
+        if self.edges.ndim != 1 or self.edges.size < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError('edges must be a strictly increasing 1-D sequence')
+        self.label_decimals = label_decimals
+        self._inner = self.edges[1:-1]
+        n = self.edges.size - 1
+        self.counts = np.zeros(n, dtype=np.int64)
+        self.confidence_sum = np.zeros(n, dtype=np.float64)
+        self.correct_sum = np.zeros(n, dtype=np.float64)
+
+    @property
+    def n_buckets(self) -> int:
+        return self.counts.size
+
+    def assign(self, confidences) -> np.ndarray:
+        """Bucket index per confidence; the top edge belongs to the last bucket"""
+        return np.searchsorted(self._inner, np.asarray(confidences, dtype=np.float64), side='right')
+
+    def bucket_label(self, index: int) -> str:
+        return (f'{self.edges[index]:.{self.label_decimals}f}-'
+                f'{self.edges[index + 1]:.{self.label_decimals}f}')
+
+    def update(self, confidences, correct) -> 'ReliabilityHistogram':
+        """Accumulate a batch of confidences and 0/1 correctness outcomes"""
+        confidences = np.asarray(confidences, dtype=np.float64).ravel()
+        correct = np.asarray(correct, dtype=np.float64).ravel()
+        if confidences.shape != correct.shape:
+            raise ValueError('confidences and correct must have the same shape')
+        buckets = self.assign(confidences)
+        n = self.n_buckets
+        self.counts += np.bincount(buckets, minlength=n)
+        self.confidence_sum += np.bincount(buckets, weights=confidences, minlength=n)
+        self.correct_sum += np.bincount(buckets, weights=correct, minlength=n)
+        return self
+
+    def merge(self, other: 'ReliabilityHistogram') -> 'ReliabilityHistogram':
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError('Cannot merge histograms with different bucket edges')
+        self.counts += other.counts
+        self.confidence_sum += other.confidence_sum
+        self.correct_sum += other.correct_sum
+        return self
+
+    def _gaps(self) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gaps = np.abs(self.correct_sum - self.confidence_sum) / self.counts
+        return np.where(self.counts > 0, gaps, 0.0)
+
+    def ece(self) -> float:
+        """Expected calibration error (count-weighted mean bucket gap)"""
+        total = self.counts.sum()
+        return float((self._gaps() * self.counts).sum() / total) if total else 0.0
+
+    def mce(self) -> float:
+        """Maximum calibration error over non-empty buckets"""
+        return float(self._gaps().max()) if self.counts.any() else 0.0
+
+    def reliability(self) -> Dict[str, List[Any]]:
+        """Per-bucket mean confidence and accuracy (None for empty buckets)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            confidence = self.confidence_sum / self.counts
+            accuracy = self.correct_sum / self.counts
+        empty = self.counts == 0
+        return {
+            'buckets': [self.bucket_label(i) for i in range(self.n_buckets)],
+            'count': self.counts.tolist(),
+            'confidence': [None if e else float(c) for e, c in zip(empty, confidence)],
+            'accuracy': [None if e else float(a) for e, a in zip(empty, accuracy)]
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'edges': self.edges.tolist(),
+            'label_decimals': self.label_decimals,
+            'counts': self.counts.tolist(),
+            'confidence_sum': self.confidence_sum.tolist(),
+            'correct_sum': self.correct_sum.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'ReliabilityHistogram':
+        histogram = cls(edges=state['edges'], label_decimals=state.get('label_decimals', 1))
+        histogram.counts = np.asarray(state['counts'], dtype=np.int64)
+        histogram.confidence_sum = np.asarray(state['confidence_sum'], dtype=np.float64)
+        histogram.correct_sum = np.asarray(state['correct_sum'], dtype=np.float64)
+        return histogram
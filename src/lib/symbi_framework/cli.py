@@ -0,0 +1,342 @@
+"""
+symbi-score Command Line
+
+Bulk scoring over files, directories, NDJSON and stdin:
+
+    symbi-score score responses/ extra.md -v balanced -v original -f ndjson
+    symbi-score score transcript.txt --approximate --target-error 3
+    cat batch.ndjson | symbi-score score --ndjson --field input.content
+    symbi-score compare test/sample_responses -f json
+    symbi-score bench test/sample_responses --cache .symbi-benchmark
+    symbi-score profile responses/ --top 15
+
+Inputs: a directory contributes every file matching ``--pattern``; ``.ndjson``
+and ``.jsonl`` files (or stdin with ``--ndjson``) contribute one document per
+line; any other file is one document; ``-`` or no input reads stdin.
+Scoring uses every core unless ``--workers`` says otherwise; ``score`` reads,
+scores and writes documents as a stream, so NDJSON rows appear as they are
+scored and memory stays bounded however long the input is. Subcommand
+modules are imported on use, so a single-document run does not load NumPy.
+``--approximate`` scores through a scoring spec, so it warms the matcher
+artifacts first (``artifacts.warm_process``); the tester variants compile
+through ``re`` and skip them.
+
+Run as ``python symbi_score.py`` from the repository root or as
+``python -m src.lib.symbi_framework.cli``.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .variants import DEFAULT_VARIANT, VARIANTS, score_dimensions
+
+FORMATS = ('table', 'json', 'ndjson', 'columnar')
+SCORE_COLUMNS = ('overallScore', 'realityIndex', 'trustProtocol', 'canvasParity')
+_RECORD_SUFFIXES = ('.ndjson', '.jsonl')
+_ID_FIELDS = ('id', 'name')
+
+
+class Document:
+    """One input response"""
+
+    __slots__ = ('id', 'content', 'model', 'prompt', 'path')
+
+    def __init__(self, id: str, content: str, model: Optional[str] = None, prompt: Optional[str] = None,
+                 path: Optional[str] = None):
+        self.id = id
+        self.content = content
+        self.model = model
+        self.prompt = prompt
+        self.path = path
+
+
+def _field(record: Dict[str, Any], field: Optional[str]) -> Any:
+    if field is None:
+        for candidate in ('content', 'input.content'):
+            try:
+                return _field(record, candidate)
+            except (KeyError, TypeError):
+                continue
+        raise KeyError('content')
+    value: Any = record
+    for key in field.split('.'):
+        value = value[key]
+    return value
+
+
+def _records(lines: Iterator[str], origin: str, field: Optional[str]) -> Iterator[Document]:
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        location = f'{origin}:{number}'
+        try:
+            record = json.loads(line)
+            content = _field(record, field)
+        except (ValueError, KeyError, TypeError) as exc:
+            raise SystemExit(f'{location}: no content ({exc})') from None
+        record_id = next((str(record[key]) for key in _ID_FIELDS if key in record), location)
+        yield Document(record_id, content, record.get('model'), record.get('prompt'))
+
+
+def _file_document(path: str) -> Document:
+    with open(path, encoding='utf-8') as f:
+        return Document(path, f.read(), path=path)
+
+
+def iter_documents(inputs: Sequence[str], pattern: str = '*.md', ndjson: bool = False,
+                   field: Optional[str] = None, stdin: Optional[TextIO] = None) -> Iterator[Document]:
+    """Documents from paths, directories, NDJSON files and ``-`` (stdin), read as they are consumed"""
+    for source in inputs or ['-']:
+        if source == '-':
+            stream = stdin or sys.stdin
+            if ndjson:
+                yield from _records(stream, '<stdin>', field)
+            else:
+                yield Document('<stdin>', stream.read())
+        elif os.path.isdir(source):
+            paths = sorted(glob.glob(os.path.join(source, '**', pattern), recursive=True))
+            yield from (_file_document(path) for path in paths if os.path.isfile(path))
+        elif ndjson or source.endswith(_RECORD_SUFFIXES):
+            with open(source, encoding='utf-8') as f:
+                yield from _records(f, source, field)
+        else:
+            yield _file_document(source)
+
+
+def read_documents(inputs: Sequence[str], pattern: str = '*.md', ndjson: bool = False,
+                   field: Optional[str] = None, stdin: Optional[TextIO] = None) -> List[Document]:
+    """Documents from paths, directories, NDJSON files and ``-`` (stdin)"""
+    return list(iter_documents(inputs, pattern, ndjson, field, stdin))
+
+
+def _table(rows: List[Dict[str, Any]], columns: Sequence[str]) -> str:
+    cells = [[str(column) for column in columns]]
+    for row in rows:
+        cells.append(['' if row.get(c) is None else
+                      (f'{row[c]:.2f}' if isinstance(row[c], float) else str(row[c])) for c in columns])
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in cells]
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+def write_rows(rows: List[Dict[str, Any]], columns: Sequence[str], output_format: str, out: TextIO) -> None:
+    """Rows as an aligned table, a JSON array, NDJSON or column lists"""
+    if output_format == 'table':
+        out.write(_table(rows, columns) + '\n')
+    elif output_format == 'json':
+        json.dump(rows, out, indent=2)
+        out.write('\n')
+    elif output_format == 'ndjson':
+        for row in rows:
+            out.write(json.dumps(row, separators=(',', ':')) + '\n')
+    else:
+        json.dump({column: [row.get(column) for row in rows] for column in columns}, out,
+                  separators=(',', ':'))
+        out.write('\n')
+
+
+def _variants(args: argparse.Namespace) -> List[str]:
+    variants = args.variants or [DEFAULT_VARIANT]
+    unknown = [variant for variant in variants if variant not in VARIANTS]
+    if unknown:
+        raise SystemExit(f"Unknown variant '{unknown[0]}'. Available: {', '.join(VARIANTS)}")
+    return variants
+
+
+Scorer = Callable[[str], Dict[str, Dict[str, Any]]]
+
+
+def _exact_variants(content: str, variants: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+    """Worker scorer: each variant's dimensions"""
+    return {variant: score_dimensions(content, variant) for variant in variants}
+
+
+def _approximate_variants(content: str, variants: Tuple[str, ...],
+                          target_error: Optional[float]) -> Dict[str, Dict[str, Any]]:
+    """Worker scorer: each variant's approximate dimensions with the overall error"""
+    from .approximate import ApproximateScorer
+    from .artifacts import warm_process
+    from .variants import to_dimensions
+
+    warm_process()
+
+    results = {}
+    for variant in variants:
+        result = ApproximateScorer(variant, target_error=target_error).score(content)
+        results[variant] = {**to_dimensions(result), 'error': result['approximation']['error']['overallScore']}
+    return results
+
+
+def _score_stream(documents: Iterator[Document], scorer: Scorer,
+                  workers: Optional[int]) -> Iterator[Tuple[Document, Dict[str, Dict[str, Any]]]]:
+    """(document, results) pairs in input order, scored as the documents are read"""
+    head = list(islice(documents, 2))
+    if len(head) < 2:
+        # One document: score in-process without loading the batch machinery
+        for document in head:
+            yield document, scorer(document.content)
+        return
+    from .evaluation import score_stream
+
+    # score_stream keeps input order and reads ahead boundedly, so this queue stays short
+    pending: Deque[Document] = deque()
+
+    def contents() -> Iterator[str]:
+        for document in chain(head, documents):
+            pending.append(document)
+            yield document.content
+
+    for results in score_stream(contents(), scorer=scorer, workers=workers):
+        yield pending.popleft(), results
+
+
+def command_score(args: argparse.Namespace, out: TextIO) -> int:
+    variants = tuple(_variants(args))
+    columns = SCORE_COLUMNS + ('error',) if args.approximate else SCORE_COLUMNS
+    if args.approximate:
+        from .approximate import ApproximateScorer
+        from .artifacts import warm_process
+
+        warm_process()
+        try:
+            for variant in variants:
+                ApproximateScorer(variant, target_error=args.target_error)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from None
+        scorer: Scorer = partial(_approximate_variants, variants=variants, target_error=args.target_error)
+    else:
+        scorer = partial(_exact_variants, variants=variants)
+    documents = iter_documents(args.inputs, args.pattern, args.ndjson, args.field)
+    rows = ({'id': document.id, 'variant': variant, **{c: results[variant][c] for c in columns}}
+            for document, results in _score_stream(documents, scorer, args.workers) for variant in variants)
+    if args.format == 'ndjson':
+        for row in rows:
+            write_rows([row], ('id', 'variant') + columns, args.format, out)
+    else:
+        write_rows(list(rows), ('id', 'variant') + columns, args.format, out)
+    return 0
+
+
+def command_compare(args: argparse.Namespace, out: TextIO) -> int:
+    from .comparison import (
+        DIMENSIONS, compare, find_benchmark_prompts, load_benchmark_prompts, match_prompt_texts, response_keys
+    )
+
+    if args.dimension not in DIMENSIONS:
+        raise SystemExit(f"Unknown dimension '{args.dimension}'. Available: {', '.join(DIMENSIONS)}")
+    documents = read_documents(args.inputs, args.pattern, args.ndjson, args.field)
+    keys = response_keys(document.path for document in documents if document.path is not None)
+    table: Dict[Tuple[str, str], str] = {}
+    for document in documents:
+        if document.path is not None:
+            table[keys[document.path]] = document.content
+        elif document.model is None or document.prompt is None:
+            raise SystemExit(f'{document.id}: compare needs <model>_<prompt> file names or model/prompt fields')
+        else:
+            table[(document.model, document.prompt)] = document.content
+    prompts_path = args.prompts
+    if prompts_path is None:
+        directories = [path for path in args.inputs if os.path.isdir(path)]
+        prompts_path = find_benchmark_prompts(directories[0]) if directories else None
+    texts = None
+    if prompts_path:
+        texts = match_prompt_texts((prompt for _, prompt in table), load_benchmark_prompts(prompts_path))
+    for variant in _variants(args):
+        matrix = compare(table, variant, texts, workers=args.workers)
+        if args.format in ('json', 'columnar'):
+            out.write(json.dumps({'variant': variant, **matrix.to_dict(args.dimension)}, indent=2) + '\n')
+        else:
+            rows = [{'variant': variant, **row} for row in matrix.leaderboard(args.dimension)]
+            write_rows(rows, ('variant', 'model', 'prompts', 'mean', 'mean_rank', 'wins'), args.format, out)
+    return 0
+
+
+def command_bench(args: argparse.Namespace, out: TextIO) -> int:
+    from .benchmark import BenchmarkRunner
+
+    run = BenchmarkRunner(args.directory, args.cache, _variants(args), args.pattern, args.workers).run()
+    if args.format == 'json':
+        out.write(json.dumps(run.to_dict(), indent=2) + '\n')
+        return 0
+    rows = [{'variant': variant, **row} for variant, board in run.leaderboards.items() for row in board]
+    write_rows(rows, ('variant', 'model', 'prompts', 'mean', 'mean_rank', 'wins'), args.format, out)
+    if args.format == 'table':
+        out.write(f'{run.files} files; scored {run.scored}, reused {run.reused}, removed {run.removed}\n')
+    return 0
+
+
+def command_profile(args: argparse.Namespace, out: TextIO) -> int:
+    from .profiling import profile_contents
+
+    documents = read_documents(args.inputs, args.pattern, args.ndjson, args.field)
+    for variant in _variants(args):
+        profiler = profile_contents([document.content for document in documents], variant, workers=args.workers)
+        if args.collapsed:
+            out.write(profiler.to_collapsed() + '\n')
+        elif args.format == 'json':
+            out.write(profiler.to_json(indent=2) + '\n')
+        else:
+            rows = [{'variant': variant, **row} for row in profiler.top(args.top)]
+            write_rows(rows, ('variant', 'frame', 'calls', 'seconds', 'bytes'), args.format, out)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='symbi-score', description='Bulk SYMBI detector scoring')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-v', '--variant', action='append', dest='variants', metavar='NAME',
+                        help=f"detector variant, repeatable ({', '.join(VARIANTS)}; default {DEFAULT_VARIANT})")
+    common.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: all cores)')
+    common.add_argument('-f', '--format', choices=FORMATS, default='table')
+    common.add_argument('--pattern', default='*.md', help='file pattern for directory inputs')
+
+    documents = argparse.ArgumentParser(add_help=False)
+    documents.add_argument('inputs', nargs='*', help="files, directories, NDJSON files or '-' for stdin")
+    documents.add_argument('--ndjson', action='store_true', help='treat stdin and files as NDJSON records')
+    documents.add_argument('--field', default=None,
+                           help="dotted record field holding the content (default: content, input.content)")
+
+    score = commands.add_parser('score', parents=[common, documents], help='score documents')
+    score.add_argument('--approximate', action='store_true',
+                       help='sample long documents instead of scanning them fully (adds an error column)')
+    score.add_argument('--target-error', type=float, default=None,
+                       help='with --approximate: sample until the overall score is within this many points')
+    compare = commands.add_parser('compare', parents=[common, documents], help='compare models per prompt')
+    compare.add_argument('--dimension', default='overallScore')
+    compare.add_argument('--prompts', default=None,
+                         help='prompts file for promptCoverage (default: benchmark_prompts.md near the input)')
+    bench = commands.add_parser('bench', parents=[common], help='incremental benchmark of a response directory')
+    bench.add_argument('directory')
+    bench.add_argument('--cache', default='.symbi-benchmark')
+    profile = commands.add_parser('profile', parents=[common, documents], help='profile detector cost')
+    profile.add_argument('--top', type=int, default=10)
+    profile.add_argument('--collapsed', action='store_true', help='collapsed stacks for flame graphs')
+    return parser
+
+
+COMMANDS = {'score': command_score, 'compare': command_compare, 'bench': command_bench, 'profile': command_profile}
+
+
+def main(argv: Optional[List[str]] = None, out: Optional[TextIO] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return COMMANDS[args.command](args, out or sys.stdout)
+    except BrokenPipeError:
+        # Output piped into head & co.: send the exit-time flush to devnull instead
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
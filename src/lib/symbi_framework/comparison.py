@@ -0,0 +1,340 @@
+"""
+Model Comparison Matrix
+
+Scores an N-model x M-prompt response table and compares models pairwise.
+Responses are keyed by ``(model, prompt)``; identical responses are scored
+once, and everything is scored in parallel with ``score_contents``.
+
+Prompt-level work is done once per prompt and shared by every model's
+response to it: the prompt's content words are tokenized into a cached
+``TermSet`` that yields each response's ``promptCoverage`` (share of the
+prompt's content words the response uses). Prompt texts come from
+``benchmark_prompts.md``; ``match_prompt_texts`` maps response prompt names
+such as ``transformer_explanation`` to its entries.
+
+File names are ``<model>_<prompt>.md``. Model names may contain ``_``: a
+stem is split before the longest prompt name it ends with, taken from an
+explicit list or inferred as the ``_`` suffixes several files share.
+
+Results are NumPy arrays over ``(model, prompt, dimension)`` with NaN for
+missing responses:
+
+- ``deltas``: mean paired difference between every two models
+- ``significance``: paired t statistics and two-sided Student t p-values
+  (``shared prompts - 1`` degrees of freedom) for those differences
+- ``ranks``: per-prompt model ranks (1 = best, ties averaged)
+
+Run ``python -m src.lib.symbi_framework.comparison <responses_dir>`` for a
+leaderboard over ``<model>_<prompt>.md`` files (``--prompts`` defaults to a
+``benchmark_prompts.md`` next to or above the directory).
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+from typing import Any, Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from .confidence import student_t_sf2
+from .evaluation import score_contents
+from .tokens import TermSet, TokenStream, Vocabulary
+from .variants import DEFAULT_VARIANT, TRUST_SCORES
+
+BENCHMARK_PROMPTS = 'benchmark_prompts.md'
+
+# Numeric comparison dimensions (trust status mapped like the overall score)
+DIMENSIONS = ('overallScore', 'realityIndex', 'canvasParity', 'trustProtocol', 'promptCoverage')
+
+_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'for', 'with', 'how', 'what', 'is', 'are',
+    'be', 'by', 'as', 'it', 'its', 'their', 'your', 'you', 'would', 'should', 'might', 'that', 'this',
+    'these', 'both', 'all', 'between', 'over', 'about', 'into'
+})
+_WORD = re.compile(r'\w+')
+_CATEGORY = re.compile(r'^##\s+(.+?)\s*$')
+_ITEM = re.compile(r'^(\d+)\.\s+\*\*(.+?)\*\*:?\s*$')
+
+Responses = Union[Dict[Tuple[str, str], str], Iterable[Dict[str, str]]]
+
+
+def _slug(text: str) -> str:
+    return '_'.join(_WORD.findall(text.lower()))
+
+
+def load_benchmark_prompts(path: str) -> Dict[str, Dict[str, str]]:
+    """Prompts from ``benchmark_prompts.md``, keyed ``<category>-<n>``"""
+    prompts: Dict[str, Dict[str, str]] = {}
+    category, item = None, None
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            line = line.rstrip('\n')
+            heading = _CATEGORY.match(line)
+            if heading:
+                category = _slug(re.sub(r'\s+Prompts$', '', heading.group(1)))
+                continue
+            numbered = _ITEM.match(line)
+            if numbered and category:
+                item = {'category': category, 'title': numbered.group(2)}
+                prompts[f'{category}-{numbered.group(1)}'] = item
+                continue
+            if item is not None and line.strip().startswith('"'):
+                item['text'] = line.strip().strip('"')
+                item = None
+    return prompts
+
+
+def match_prompt_texts(names: Iterable[str], prompts: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    """Benchmark prompt text for each response prompt name that can be matched
+
+    A name matches a ``<category>-<n>`` key or a title slug directly. Otherwise
+    the prompt whose category, title and text use the name's words most often
+    is taken, when it is the single best and shares at least one word.
+    """
+    by_title = {_slug(prompt['title']): prompt for prompt in prompts.values()}
+    words = {key: _WORD.findall(' '.join((prompt['category'].replace('_', ' '), prompt['title'],
+                                          prompt.get('text', ''))).lower())
+             for key, prompt in prompts.items()}
+    texts = {}
+    for name in dict.fromkeys(names):
+        prompt = prompts.get(name) or by_title.get(_slug(name))
+        if prompt is None:
+            wanted = set(_WORD.findall(name.lower().replace('_', ' '))) - _STOPWORDS
+            scores = {key: sum(word in wanted for word in prompt_words) for key, prompt_words in words.items()}
+            ranked = sorted(scores.values(), reverse=True)
+            if ranked and ranked[0] > 0 and (len(ranked) == 1 or ranked[0] > ranked[1]):
+                prompt = prompts[max(scores, key=scores.get)]
+        if prompt is not None and prompt.get('text'):
+            texts[name] = prompt['text']
+    return texts
+
+
+def find_benchmark_prompts(directory: str) -> Optional[str]:
+    """``benchmark_prompts.md`` in a response directory or its parent, if any"""
+    for folder in (directory, os.path.dirname(os.path.abspath(directory))):
+        path = os.path.join(folder, BENCHMARK_PROMPTS)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _stem(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def shared_prompt_names(paths: Iterable[str]) -> Set[str]:
+    """Prompt names inferred from file names: ``_`` suffixes of more than one stem"""
+    counts: Dict[str, int] = {}
+    for path in paths:
+        parts = _stem(path).split('_')
+        for i in range(1, len(parts)):
+            suffix = '_'.join(parts[i:])
+            counts[suffix] = counts.get(suffix, 0) + 1
+    return {suffix for suffix, count in counts.items() if count > 1}
+
+
+def response_key(path: str, prompts: Optional[Collection[str]] = None) -> Tuple[str, str]:
+    """``(model, prompt)`` from a ``<model>_<prompt>.md`` file name
+
+    The stem splits before the longest name in ``prompts`` it ends with, and
+    at its first ``_`` when none matches.
+    """
+    stem = _stem(path)
+    if prompts:
+        parts = stem.split('_')
+        for i in range(1, len(parts)):
+            prompt = '_'.join(parts[i:])
+            if prompt in prompts:
+                return '_'.join(parts[:i]), prompt
+    model, _, prompt = stem.partition('_')
+    return model, prompt or stem
+
+
+def response_keys(paths: Iterable[str], prompts: Optional[Collection[str]] = None) -> Dict[str, Tuple[str, str]]:
+    """``response_key`` for many files, with prompt names inferred from them by default"""
+    paths = list(paths)
+    prompts = shared_prompt_names(paths) if prompts is None else set(prompts)
+    return {path: response_key(path, prompts) for path in paths}
+
+
+def load_responses(directory: str, pattern: str = '*.md',
+                   prompts: Optional[Collection[str]] = None) -> Dict[Tuple[str, str], str]:
+    """``<model>_<prompt>.md`` files as a ``(model, prompt) -> content`` table"""
+    responses = {}
+    for path, key in response_keys(sorted(glob.glob(os.path.join(directory, pattern))), prompts).items():
+        with open(path, encoding='utf-8') as handle:
+            responses[key] = handle.read()
+    return responses
+
+
+def _table(responses: Responses) -> Dict[Tuple[str, str], str]:
+    if isinstance(responses, dict):
+        return responses
+    return {(record['model'], record['prompt']): record['content'] for record in responses}
+
+
+class ComparisonMatrix:
+    """Scores indexed by (model, prompt, dimension) with pairwise statistics"""
+
+    def __init__(self, models: List[str], prompts: List[str], scores: np.ndarray):
+        self.models = models
+        self.prompts = prompts
+        self.scores = scores
+        self._dim_index = {dim: i for i, dim in enumerate(DIMENSIONS)}
+
+    @classmethod
+    def from_predictions(cls, predictions: Dict[Tuple[str, str], Dict[str, Any]],
+                         coverage: Optional[Dict[Tuple[str, str], float]] = None) -> 'ComparisonMatrix':
+        """Matrix from per-response dimension results keyed by ``(model, prompt)``"""
+        coverage = coverage or {}
+        models = sorted({model for model, _ in predictions})
+        prompts = sorted({prompt for _, prompt in predictions})
+        model_index = {model: i for i, model in enumerate(models)}
+        prompt_index = {prompt: j for j, prompt in enumerate(prompts)}
+        scores = np.full((len(models), len(prompts), len(DIMENSIONS)), np.nan)
+        for key, prediction in predictions.items():
+            i, j = model_index[key[0]], prompt_index[key[1]]
+            scores[i, j, :4] = (prediction['overallScore'], prediction['realityIndex'],
+                                prediction['canvasParity'], TRUST_SCORES[prediction['trustProtocol']])
+            if key in coverage:
+                scores[i, j, 4] = coverage[key]
+        return cls(models, prompts, scores)
+
+    def dimension(self, dim: str = 'overallScore') -> np.ndarray:
+        """``(models, prompts)`` score array for one dimension"""
+        return self.scores[:, :, self._dim_index[dim]]
+
+    def _paired(self, dim: str) -> np.ndarray:
+        values = self.dimension(dim)
+        return values[:, None, :] - values[None, :, :]
+
+    def deltas(self, dim: str = 'overallScore') -> np.ndarray:
+        """``[i, j]`` = mean over shared prompts of model i minus model j"""
+        differences = self._paired(dim)
+        shared = (~np.isnan(differences)).sum(axis=2)
+        totals = np.nansum(differences, axis=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(shared > 0, totals / shared, np.nan)
+
+    def significance(self, dim: str = 'overallScore') -> Tuple[np.ndarray, np.ndarray]:
+        """Paired t statistics and two-sided Student t p-values (``shared - 1`` df) for ``deltas``"""
+        differences = self._paired(dim)
+        shared = (~np.isnan(differences)).sum(axis=2)
+        mean = self.deltas(dim)
+        squares = np.nansum((differences - mean[:, :, None]) ** 2, axis=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(squares / (shared - 1))
+            # Constant non-zero differences are infinitely significant
+            t = np.where(std > 0, mean / (std / np.sqrt(shared)), np.where(mean == 0, 0.0, np.sign(mean) * np.inf))
+        t[shared < 2] = np.nan
+        return t, student_t_sf2(t, shared - 1)
+
+    def ranks(self, dim: str = 'overallScore') -> np.ndarray:
+        """``(models, prompts)`` ranks per prompt, 1 = best, ties averaged, NaN if missing"""
+        values = self.dimension(dim)
+        ranks = np.full(values.shape, np.nan)
+        for column in range(values.shape[1]):
+            present = np.flatnonzero(~np.isnan(values[:, column]))
+            if not len(present):
+                continue
+            column_values = -values[present, column]
+            order = np.argsort(column_values, kind='stable')
+            ordinal = np.empty(len(present))
+            ordinal[order] = np.arange(1, len(present) + 1)
+            # Average ranks of tied values
+            _, groups = np.unique(column_values, return_inverse=True)
+            sums = np.bincount(groups, weights=ordinal)
+            counts = np.bincount(groups)
+            ranks[present, column] = (sums / counts)[groups]
+        return ranks
+
+    def leaderboard(self, dim: str = 'overallScore') -> List[Dict[str, Any]]:
+        values = self.dimension(dim)
+        ranks = self.ranks(dim)
+        deltas = self.deltas(dim)
+        rows = []
+        for i, model in enumerate(self.models):
+            others = np.delete(deltas[i], i)
+            rows.append({
+                'model': model,
+                'prompts': int((~np.isnan(values[i])).sum()),
+                'mean': float(np.nanmean(values[i])) if (~np.isnan(values[i])).any() else None,
+                'mean_rank': float(np.nanmean(ranks[i])) if (~np.isnan(ranks[i])).any() else None,
+                'wins': int((others > 0).sum())
+            })
+        return sorted(rows, key=lambda row: (row['mean_rank'] is None, row['mean_rank'] or 0))
+
+    def to_dict(self, dim: str = 'overallScore') -> Dict[str, Any]:
+        t, p = self.significance(dim)
+        return {
+            'dimension': dim,
+            'models': self.models,
+            'prompts': self.prompts,
+            'leaderboard': self.leaderboard(dim),
+            'deltas': np.where(np.isnan(self.deltas(dim)), None, self.deltas(dim)).tolist(),
+            'p_values': np.where(np.isnan(p), None, p).tolist()
+        }
+
+
+def _prompt_terms(prompt: str, prompt_texts: Dict[str, str], vocabulary: Vocabulary) -> Optional[TermSet]:
+    text = prompt_texts.get(prompt)
+    if not text:
+        return None
+    words = [word for word in dict.fromkeys(_WORD.findall(text.lower())) if word not in _STOPWORDS]
+    return vocabulary.term_set(words) if words else None
+
+
+def compare(responses: Responses, variant: str = DEFAULT_VARIANT,
+            prompt_texts: Optional[Dict[str, str]] = None,
+            workers: Optional[int] = None, batch_size: int = 64) -> ComparisonMatrix:
+    """Score a ``(model, prompt) -> content`` table and build the comparison matrix"""
+    table = _table(responses)
+    prompt_texts = prompt_texts or {}
+
+    # Score each distinct response once
+    unique: Dict[str, int] = {}
+    contents: List[str] = []
+    slots: Dict[Tuple[str, str], int] = {}
+    for key, content in table.items():
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if digest not in unique:
+            unique[digest] = len(contents)
+            contents.append(content)
+        slots[key] = unique[digest]
+    predictions = score_contents(contents, variant, workers=workers, batch_size=batch_size)
+
+    # Prompt features are built once and shared by all models; the vocabulary lives for this call
+    vocabulary = Vocabulary()
+    prompt_terms = {prompt: _prompt_terms(prompt, prompt_texts, vocabulary) for _, prompt in table}
+    coverage = {}
+    for key, k in slots.items():
+        terms = prompt_terms[key[1]]
+        if terms is not None:
+            stream = TokenStream.from_text(contents[k].lower(), vocabulary)
+            coverage[key] = terms.count_present(stream) / len(terms.terms)
+    return ComparisonMatrix.from_predictions({key: predictions[k] for key, k in slots.items()}, coverage)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Compare models over a directory of <model>_<prompt>.md responses')
+    parser.add_argument('directory')
+    parser.add_argument('--variant', default=DEFAULT_VARIANT)
+    parser.add_argument('--dimension', default='overallScore', choices=DIMENSIONS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--prompts', default=None,
+                        help=f'prompt file for promptCoverage (default: {BENCHMARK_PROMPTS} near the directory)')
+    args = parser.parse_args(argv)
+    responses = load_responses(args.directory)
+    prompts_path = args.prompts or find_benchmark_prompts(args.directory)
+    texts = None
+    if prompts_path:
+        texts = match_prompt_texts((prompt for _, prompt in responses), load_benchmark_prompts(prompts_path))
+    matrix = compare(responses, args.variant, texts, workers=args.workers)
+    print(json.dumps(matrix.to_dict(args.dimension), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+"""
+Score Confidence Intervals
+
+Python counterpart of ``ml/confidence-calculator.ts`` with an actual
+derivation: intervals for aggregate scores (per model, per prompt, per any
+label) and for single documents.
+
+- ``bootstrap_intervals``: percentile bootstrap of the mean. Rows are
+  packed so their observed values come first (NaN = missing), rows with the
+  same support share one ``(resamples, n)`` index matrix, and every
+  resampled mean of a chunk of rows is one fancy-indexing gather, so
+  thousands of models or prompts take one call and no Python loop per row.
+  Fully observed rows keep their column order, which makes the shared
+  indices a paired bootstrap across rows (e.g. models over the same prompts).
+- ``analytic_intervals``: Student t interval of the mean, with critical
+  values from the regularized incomplete beta (``student_t_sf2`` also gives
+  the comparison p-values).
+- ``document_intervals``: resamples a document's sentence segments. Spec
+  feature counts are extracted once per segment; a resample's counts are a
+  ``(resamples, segments) @ (segments, features)`` product, and component
+  values are evaluated on whole count columns.
+
+Every function returns a ``ConfidenceIntervals`` of aligned arrays.
+"""
+
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .document import segment_sentences
+from .spec import PER_COUNT, ScoringSpec, get_spec
+from .variants import DEFAULT_VARIANT, TRUST_SCORES, to_dimensions
+
+if TYPE_CHECKING:
+    from .comparison import ComparisonMatrix
+
+METHODS = ('bootstrap', 'analytic')
+DOCUMENT_DIMENSIONS = ('overallScore', 'realityIndex', 'canvasParity', 'trustProtocol')
+
+# Upper bound on elements gathered at once by the bootstrap
+_CHUNK_ELEMENTS = 1 << 24
+
+
+class ConfidenceIntervals:
+    """Estimates with lower and upper bounds, aligned with ``labels``"""
+
+    def __init__(self, labels: List[Any], estimate: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                 support: np.ndarray, confidence: float, method: str):
+        self.labels = labels
+        self.estimate = estimate
+        self.lower = lower
+        self.upper = upper
+        self.support = support
+        self.confidence = confidence
+        self.method = method
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.upper - self.lower
+
+    def score(self, scale: float = 100.0) -> np.ndarray:
+        """Confidence in [0, 1]: one minus the interval width relative to the score range"""
+        return np.clip(1 - self.width / scale, 0.0, 1.0)
+
+    def interval(self, label: Any) -> Tuple[float, float]:
+        i = self.labels.index(label)
+        return float(self.lower[i]), float(self.upper[i])
+
+    def rows(self) -> List[Dict[str, Any]]:
+        def value(array: np.ndarray, i: int) -> Optional[float]:
+            return None if np.isnan(array[i]) else float(array[i])
+
+        return [{'label': label, 'estimate': value(self.estimate, i), 'lower': value(self.lower, i),
+                 'upper': value(self.upper, i), 'support': int(self.support[i])}
+                for i, label in enumerate(self.labels)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'method': self.method, 'confidence': self.confidence, 'intervals': self.rows()}
+
+
+def _matrix(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return values[None, :] if values.ndim == 1 else values
+
+
+def _labels(labels: Optional[Sequence[Any]], count: int) -> List[Any]:
+    labels = list(range(count)) if labels is None else list(labels)
+    if len(labels) != count:
+        raise ValueError(f'{len(labels)} labels for {count} rows')
+    return labels
+
+
+def _pack(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Observed values of each row moved to the front (order kept), plus their counts"""
+    observed = ~np.isnan(values)
+    order = np.argsort(~observed, axis=1, kind='stable')
+    support = observed.sum(axis=1)
+    width = int(support.max()) if len(support) else 0
+    return np.take_along_axis(values, order, axis=1)[:, :width], support
+
+
+def group_values(labels: Sequence[Any], values) -> Tuple[List[Any], np.ndarray]:
+    """Flat ``(label, value)`` observations as sorted labels and a NaN-padded ``(labels, n)`` matrix"""
+    values = np.asarray(values, dtype=np.float64)
+    groups, inverse = np.unique(np.asarray(labels), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind='stable')
+    counts = np.bincount(inverse, minlength=len(groups))
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_groups = inverse[order]
+    matrix = np.full((len(groups), int(counts.max()) if len(counts) else 0), np.nan)
+    matrix[sorted_groups, np.arange(len(order)) - offsets[sorted_groups]] = values[order]
+    return groups.tolist(), matrix
+
+
+def _beta_fraction(a: np.ndarray, b: np.ndarray, x: np.ndarray, iterations: int = 300) -> np.ndarray:
+    """Continued fraction of the incomplete beta function (modified Lentz, Numerical Recipes betacf)"""
+    tiny = 1e-300
+
+    def bounded(value: np.ndarray) -> np.ndarray:
+        return np.where(np.abs(value) < tiny, tiny, value)
+
+    c = np.ones_like(x)
+    d = 1.0 / bounded(1.0 - (a + b) * x / (a + 1.0))
+    h = d
+    for m in range(1, iterations + 1):
+        numerator = m * (b - m) * x / ((a + 2 * m - 1.0) * (a + 2 * m))
+        d = 1.0 / bounded(1.0 + numerator * d)
+        c = bounded(1.0 + numerator / c)
+        h = h * d * c
+        numerator = -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1.0))
+        d = 1.0 / bounded(1.0 + numerator * d)
+        c = bounded(1.0 + numerator / c)
+        delta = d * c
+        h = h * delta
+        if np.all(np.abs(delta - 1.0) < 1e-13):
+            break
+    return h
+
+
+def student_t_sf2(t: np.ndarray, df: np.ndarray) -> np.ndarray:
+    """Two-sided Student t p-values, ``I_{df/(df+t^2)}(df/2, 1/2)``; NaN and inf pass through"""
+    t, df = np.broadcast_arrays(np.abs(np.asarray(t, dtype=np.float64)), np.asarray(df, dtype=np.float64))
+    p = np.full(t.shape, np.nan)
+    valid = ~np.isnan(t) & (df >= 1)
+    p[valid & np.isinf(t)] = 0.0
+    finite = valid & np.isfinite(t)
+    t, df = t[finite], df[finite]
+    p[finite] = _t_beta(df / (df + t * t), df)
+    return p
+
+
+def _t_beta(x: np.ndarray, df: np.ndarray) -> np.ndarray:
+    """``I_x(df/2, 1/2)``, the two-sided t tail at ``x = df / (df + t^2)``"""
+    a, b = df / 2, np.full_like(df, 0.5)
+    # lgamma over the few distinct degrees of freedom only
+    values, inverse = np.unique(a, return_inverse=True)
+    log_beta = np.array([math.lgamma(v) + math.lgamma(0.5) - math.lgamma(v + 0.5) for v in values])[inverse]
+    with np.errstate(divide='ignore'):
+        front = np.exp(a * np.log(x) + b * np.log1p(-x) - log_beta)
+    # The continued fraction converges for x below (a + 1) / (a + b + 2); use the symmetry above it
+    direct = x < (a + 1) / (a + b + 2)
+    result = np.empty_like(x)
+    result[direct] = (front * _beta_fraction(a, b, x) / a)[direct]
+    result[~direct] = (1.0 - front * _beta_fraction(b, a, 1.0 - x) / b)[~direct]
+    return np.clip(result, 0.0, 1.0)
+
+
+def student_t_quantile(confidence: float, df: np.ndarray, iterations: int = 60) -> np.ndarray:
+    """Two-sided critical t values (``P(|T| > t) = 1 - confidence``); NaN below one degree of freedom"""
+    df = np.asarray(df, dtype=np.float64)
+    critical = np.full(df.shape, np.nan)
+    valid = df >= 1
+    values, inverse = np.unique(df[valid], return_inverse=True)
+    # The tail I_x rises with x = df / (df + t^2): bisect x, then map back to t
+    low, high = np.zeros_like(values), np.ones_like(values)
+    alpha = 1 - confidence
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        below = _t_beta(middle, values) < alpha
+        low, high = np.where(below, middle, low), np.where(below, high, middle)
+    x = (low + high) / 2
+    critical[valid] = np.sqrt(values * (1 - x) / x)[inverse]
+    return critical
+
+
+def analytic_intervals(values, labels: Optional[Sequence[Any]] = None,
+                       confidence: float = 0.95) -> ConfidenceIntervals:
+    """Student t interval of each row's mean (``support - 1`` degrees of freedom); NaN below two observations"""
+    values = _matrix(values)
+    support = (~np.isnan(values)).sum(axis=1)
+    critical = student_t_quantile(confidence, support - 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(values, axis=1) / support
+        variance = np.nansum((values - mean[:, None]) ** 2, axis=1) / (support - 1)
+        margin = critical * np.sqrt(variance / support)
+    margin[support < 2] = np.nan
+    return ConfidenceIntervals(_labels(labels, len(values)), mean, mean - margin, mean + margin,
+                               support, confidence, 'analytic')
+
+
+def bootstrap_intervals(values, labels: Optional[Sequence[Any]] = None, confidence: float = 0.95,
+                        resamples: int = 1000, seed: Optional[int] = None) -> ConfidenceIntervals:
+    """Percentile bootstrap interval of each row's mean (NaN = missing observation)"""
+    values = _matrix(values)
+    packed, support = _pack(values)
+    rng = np.random.default_rng(seed)
+    quantiles = [(1 - confidence) / 2, (1 + confidence) / 2]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(values, axis=1) / support
+    lower = np.full(len(values), np.nan)
+    upper = np.full(len(values), np.nan)
+
+    for n in np.unique(support[support > 0]).tolist():
+        rows = np.flatnonzero(support == n)
+        indices = rng.integers(0, n, size=(resamples, n))
+        chunk = max(1, _CHUNK_ELEMENTS // (resamples * n))
+        for start in range(0, len(rows), chunk):
+            block = rows[start:start + chunk]
+            means = packed[block][:, indices].mean(axis=2)
+            lower[block], upper[block] = np.quantile(means, quantiles, axis=1)
+    return ConfidenceIntervals(_labels(labels, len(values)), mean, lower, upper, support,
+                               confidence, 'bootstrap')
+
+
+def intervals(values, labels: Optional[Sequence[Any]] = None, method: str = 'bootstrap',
+              confidence: float = 0.95, resamples: int = 1000,
+              seed: Optional[int] = None) -> ConfidenceIntervals:
+    if method == 'bootstrap':
+        return bootstrap_intervals(values, labels, confidence, resamples, seed)
+    if method == 'analytic':
+        return analytic_intervals(values, labels, confidence)
+    raise ValueError(f"Unknown method '{method}'. Available: {', '.join(METHODS)}")
+
+
+def aggregate_intervals(labels: Sequence[Any], values, method: str = 'bootstrap',
+                        confidence: float = 0.95, resamples: int = 1000,
+                        seed: Optional[int] = None) -> ConfidenceIntervals:
+    """Intervals of the mean score per label from flat per-document observations"""
+    groups, matrix = group_values(labels, values)
+    return intervals(matrix, groups, method, confidence, resamples, seed)
+
+
+def matrix_intervals(matrix: 'ComparisonMatrix', dim: str = 'overallScore', axis: str = 'model',
+                     method: str = 'bootstrap', confidence: float = 0.95, resamples: int = 1000,
+                     seed: Optional[int] = None) -> ConfidenceIntervals:
+    """Per-model (over prompts) or per-prompt (over models) intervals of a comparison matrix"""
+    values = matrix.dimension(dim)
+    if axis == 'model':
+        return intervals(values, matrix.models, method, confidence, resamples, seed)
+    if axis == 'prompt':
+        return intervals(values.T, matrix.prompts, method, confidence, resamples, seed)
+    raise ValueError(f"axis must be 'model' or 'prompt', not '{axis}'")
+
+
+def component_arrays(spec: ScoringSpec, counts: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+    """``Component.value`` for every row of a ``(rows, features)`` count matrix"""
+    values: Dict[str, Dict[str, np.ndarray]] = {}
+    for dimension, components in spec.dimensions.items():
+        for component in components:
+            score = np.full(len(counts), float(component.base))
+            for rule in component.rules:
+                count = counts[:, rule.feature]
+                if rule.mode == PER_COUNT:
+                    value = count * rule.weight
+                    if rule.cap is not None:
+                        value = np.minimum(value, rule.cap)
+                else:
+                    value = rule.weight
+                score += np.where(count >= rule.min_count, value, 0)
+            if component.high is not None:
+                score = np.minimum(score, component.high)
+            if component.low is not None:
+                score = np.maximum(score, component.low)
+            values.setdefault(dimension, {})[component.name] = score
+    return values
+
+
+def dimension_values(results: Dict[str, Any]) -> List[float]:
+    """``DOCUMENT_DIMENSIONS`` of a spec result as numbers (trust status mapped to a score)"""
+    dimensions = to_dimensions(results)
+    dimensions['trustProtocol'] = TRUST_SCORES[dimensions['trustProtocol']]
+    return [float(dimensions[dim]) for dim in DOCUMENT_DIMENSIONS]
+
+
+def score_rows(spec: ScoringSpec, counts: np.ndarray) -> np.ndarray:
+    """``(rows, DOCUMENT_DIMENSIONS)`` scores of a count matrix
+
+    Components are evaluated column-wise; ``finalize`` runs once per distinct
+    row of component values (resamples mostly repeat a few of them).
+    """
+    return score_components(spec, component_arrays(spec, counts))
+
+
+def score_components(spec: ScoringSpec, arrays: Dict[str, Dict[str, np.ndarray]]) -> np.ndarray:
+    """``(rows, DOCUMENT_DIMENSIONS)`` scores of ``component_arrays`` output"""
+    names = [(dimension, name) for dimension, components in arrays.items() for name in components]
+    values = np.stack([arrays[dimension][name] for dimension, name in names], axis=1)
+    distinct, inverse = np.unique(values, axis=0, return_inverse=True)
+    scores = []
+    for row in distinct.tolist():
+        components: Dict[str, Dict[str, float]] = {}
+        for (dimension, name), value in zip(names, row):
+            components.setdefault(dimension, {})[name] = value
+        scores.append(dimension_values(spec.finalize(components)))
+    return np.array(scores).reshape(len(distinct), len(DOCUMENT_DIMENSIONS))[inverse.reshape(-1)]
+
+
+def segment_counts(content: str, spec: ScoringSpec) -> np.ndarray:
+    """``(segments, features)`` counts, one segment per sentence including its terminator"""
+    starts, _ = segment_sentences(content)
+    bounds = [0] + starts[1:].tolist() + [len(content)] if len(starts) else [0]
+    return np.array([spec.extract(content[bounds[i]:bounds[i + 1]]) for i in range(len(bounds) - 1)],
+                    dtype=np.float64).reshape(-1, len(spec.features))
+
+
+def document_intervals(content: str, variant: str = DEFAULT_VARIANT, confidence: float = 0.95,
+                       resamples: int = 200, seed: Optional[int] = None,
+                       spec: Optional[ScoringSpec] = None) -> ConfidenceIntervals:
+    """Per-dimension intervals for one document by resampling its sentences
+
+    The estimate is the exact score. Patterns spanning a sentence boundary
+    only count in the estimate, so very short documents get narrow intervals.
+    """
+    spec = spec or get_spec(variant)
+    estimate = np.array(dimension_values(spec.score(content)))
+    segments = segment_counts(content, spec)
+    n = len(segments)
+    if n == 0:
+        nan = np.full(len(DOCUMENT_DIMENSIONS), np.nan)
+        return ConfidenceIntervals(list(DOCUMENT_DIMENSIONS), estimate, nan, nan.copy(),
+                                   np.zeros(len(nan), dtype=np.int64), confidence, 'sentence-bootstrap')
+
+    # How often each segment is drawn in each resample, then summed counts
+    indices = np.random.default_rng(seed).integers(0, n, size=(resamples, n))
+    draws = np.bincount((indices + n * np.arange(resamples)[:, None]).ravel(),
+                        minlength=resamples * n).reshape(resamples, n)
+    counts = draws @ segments
+    presence = np.array([not feature.count for feature in spec.features])
+    counts[:, presence] = np.minimum(counts[:, presence], 1)
+
+    scores = score_rows(spec, counts)
+    lower, upper = np.quantile(scores, [(1 - confidence) / 2, (1 + confidence) / 2], axis=0)
+    return ConfidenceIntervals(list(DOCUMENT_DIMENSIONS), estimate, lower, upper,
+                               np.full(len(DOCUMENT_DIMENSIONS), n), confidence, 'sentence-bootstrap')
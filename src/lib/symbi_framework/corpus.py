@@ -0,0 +1,200 @@
+"""
+Sharded Test-Case Corpus
+
+Labeled test cases (``name`` / ``input`` / ``expected``) stored as JSONL
+shards plus small per-shard indexes and a manifest:
+
+    corpus/
+      manifest.json              shard list, record counts, context histogram
+      shard-00000.jsonl          one test case per line
+      shard-00000.index.json     byte offsets, lengths, context and name per record
+
+Readers only parse the manifest up front. Shard indexes are loaded on first
+use, and records are parsed only when they are yielded, so sampling or
+filtering by ``input.metadata.context`` seeks straight to the matching lines.
+"""
+
+import bisect
+import json
+import os
+import random
+from typing import Any, Dict, Iterator, List, Optional
+
+MANIFEST_NAME = 'manifest.json'
+CORPUS_FORMAT = 'symbi-corpus'
+CORPUS_VERSION = 1
+
+
+def case_context(case: Dict[str, Any]) -> str:
+    return case.get('input', {}).get('metadata', {}).get('context', 'General')
+
+
+class CorpusWriter:
+    """Writes test cases into fixed-size JSONL shards with per-shard indexes"""
+
+    def __init__(self, directory: str, shard_size: int = 10000):
+        if shard_size < 1:
+            raise ValueError('shard_size must be at least 1')
+        self.directory = directory
+        self.shard_size = shard_size
+        self._shards: List[Dict[str, Any]] = []
+        self._fh = None
+        self._index: Dict[str, List[Any]] = {}
+        self._offset = 0
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+
+    def _open_shard(self) -> None:
+        number = len(self._shards)
+        entry = {
+            'file': f'shard-{number:05d}.jsonl',
+            'index': f'shard-{number:05d}.index.json',
+            'count': 0,
+            'contexts': {}
+        }
+        self._shards.append(entry)
+        self._fh = open(os.path.join(self.directory, entry['file']), 'wb')
+        self._index = {'offsets': [], 'lengths': [], 'contexts': [], 'names': []}
+        self._offset = 0
+
+    def _close_shard(self) -> None:
+        if self._fh is None:
+            return
+        self._fh.close()
+        self._fh = None
+        with open(os.path.join(self.directory, self._shards[-1]['index']), 'w') as f:
+            json.dump(self._index, f, separators=(',', ':'))
+
+    def add(self, case: Dict[str, Any]) -> None:
+        if self._closed:
+            raise ValueError('Cannot add cases to a closed corpus')
+        if self._fh is None or self._shards[-1]['count'] >= self.shard_size:
+            self._close_shard()
+            self._open_shard()
+
+        line = json.dumps(case, separators=(',', ':')).encode('utf-8') + b'\n'
+        context = case_context(case)
+        self._fh.write(line)
+        self._index['offsets'].append(self._offset)
+        self._index['lengths'].append(len(line))
+        self._index['contexts'].append(context)
+        self._index['names'].append(case.get('name', ''))
+        self._offset += len(line)
+
+        shard = self._shards[-1]
+        shard['count'] += 1
+        shard['contexts'][context] = shard['contexts'].get(context, 0) + 1
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._close_shard()
+        manifest = {
+            'format': CORPUS_FORMAT,
+            'version': CORPUS_VERSION,
+            'count': sum(shard['count'] for shard in self._shards),
+            'shards': self._shards
+        }
+        with open(os.path.join(self.directory, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        self._closed = True
+
+    def __enter__(self) -> 'CorpusWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class CorpusReader:
+    """Lazy reader over a sharded corpus"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != CORPUS_FORMAT:
+            raise ValueError(f'Not a SYMBI corpus: {directory}')
+        self.shards = self.manifest['shards']
+        self._starts = []
+        total = 0
+        for shard in self.shards:
+            self._starts.append(total)
+            total += shard['count']
+        self._count = total
+        self._indexes: Dict[int, Dict[str, List[Any]]] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def contexts(self) -> Dict[str, int]:
+        """Context histogram from the manifest (no shard access)"""
+        totals: Dict[str, int] = {}
+        for shard in self.shards:
+            for context, count in shard['contexts'].items():
+                totals[context] = totals.get(context, 0) + count
+        return totals
+
+    def _shard_index(self, shard_number: int) -> Dict[str, List[Any]]:
+        index = self._indexes.get(shard_number)
+        if index is None:
+            with open(os.path.join(self.directory, self.shards[shard_number]['index'])) as f:
+                index = self._indexes[shard_number] = json.load(f)
+        return index
+
+    def _read_records(self, shard_number: int, positions: List[int]) -> Iterator[Dict[str, Any]]:
+        index = self._shard_index(shard_number)
+        with open(os.path.join(self.directory, self.shards[shard_number]['file']), 'rb') as f:
+            for position in positions:
+                f.seek(index['offsets'][position])
+                yield json.loads(f.read(index['lengths'][position]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for shard in self.shards:
+            with open(os.path.join(self.directory, shard['file']), 'rb') as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def get(self, ordinal: int) -> Dict[str, Any]:
+        if not 0 <= ordinal < self._count:
+            raise IndexError(f'Corpus index out of range: {ordinal}')
+        shard_number = bisect.bisect_right(self._starts, ordinal) - 1
+        return next(self._read_records(shard_number, [ordinal - self._starts[shard_number]]))
+
+    __getitem__ = get
+
+    def filter(self, context: str) -> Iterator[Dict[str, Any]]:
+        """Iterate cases of one context, skipping shards the manifest rules out"""
+        for shard_number, shard in enumerate(self.shards):
+            if not shard['contexts'].get(context):
+                continue
+            contexts = self._shard_index(shard_number)['contexts']
+            positions = [i for i, c in enumerate(contexts) if c == context]
+            yield from self._read_records(shard_number, positions)
+
+    def sample(self, k: int, seed: Optional[int] = None,
+               context: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Uniform random sample of ``k`` cases (optionally within one context)"""
+        rng = random.Random(seed)
+        if context is None:
+            ordinals = sorted(rng.sample(range(self._count), min(k, self._count)))
+            return [self.get(ordinal) for ordinal in ordinals]
+
+        candidates = []
+        for shard_number, shard in enumerate(self.shards):
+            if shard['contexts'].get(context):
+                contexts = self._shard_index(shard_number)['contexts']
+                candidates.extend((shard_number, i) for i, c in enumerate(contexts) if c == context)
+        chosen = sorted(rng.sample(candidates, min(k, len(candidates))))
+        result = []
+        for shard_number in sorted({s for s, _ in chosen}):
+            positions = [p for s, p in chosen if s == shard_number]
+            result.extend(self._read_records(shard_number, positions))
+        return result
+
+
+def write_corpus(directory: str, cases, shard_size: int = 10000) -> None:
+    """Write an iterable of test cases as a sharded corpus"""
+    with CorpusWriter(directory, shard_size) as writer:
+        for case in cases:
+            writer.add(case)
@@ -0,0 +1,183 @@
+"""
+Documents
+
+A ``Document`` wraps one response's text and caches derived views that
+several scoring dimensions need, so each is computed once per document:
+
+- the lowercase copy
+- sentence spans as two offset arrays (no per-sentence strings)
+- the interned token stream of the lowercase text
+
+Tester methods take plain strings, so ``score_response`` opens a
+``Document.scope(text)`` for the call and ``Document.of(text)`` returns the
+scoped document when it is called with the *same* string object, building a
+new one otherwise. The scope is a context variable, so concurrent calls in
+other threads never share documents and nothing outlives the call.
+"""
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .tokens import TokenStream
+
+# Lowercase tokens (dots inside kept) after which a '.' does not end a sentence
+ABBREVIATIONS = frozenset({
+    'al', 'e.g', 'i.e', 'etc', 'vs', 'cf', 'approx', 'fig', 'eq', 'vol', 'pp',
+    'dr', 'mr', 'mrs', 'ms', 'prof', 'inc', 'ltd', 'jr', 'sr'
+})
+# Abbreviations that are also words, so only when a number follows ('No. 5' but 'the answer is no.')
+NUMBER_ABBREVIATIONS = frozenset({'no'})
+_MAX_ABBREVIATION = max(map(len, ABBREVIATIONS | NUMBER_ABBREVIATIONS))
+
+_ASCII_ALNUM = np.array([chr(code).isalnum() for code in range(128)])
+_ASCII_SPACE = np.array([chr(code).isspace() for code in range(128)])
+_EMPTY = np.zeros(0, dtype=np.int64)
+_NUMBER_AHEAD = re.compile(r'\s*\d')
+
+# Document shared by ``Document.of`` calls inside a ``Document.scope``
+_scoped: ContextVar[Optional['Document']] = ContextVar('document', default=None)
+
+
+def code_points(text: str) -> np.ndarray:
+    """``uint32`` code point view of a string (one 4-byte copy)"""
+    return np.frombuffer(text.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+
+
+def _classify(codes: np.ndarray, ascii_table: np.ndarray, predicate: Callable[[str], bool]) -> np.ndarray:
+    """Vectorized character class test: ASCII by table, other code points via ``predicate``"""
+    result = ascii_table[np.minimum(codes, 127)]
+    for i in np.flatnonzero(codes >= 128).tolist():
+        result[i] = predicate(chr(codes[i]))
+    return result
+
+
+def _skip_space(codes: np.ndarray, offsets: np.ndarray, step: int, limit: int) -> np.ndarray:
+    """Move each offset past whitespace in direction ``step`` (checks only boundary characters)"""
+    offsets = offsets.copy()
+    probe = 0 if step > 0 else -1
+    while True:
+        inside = offsets != limit
+        index = offsets[inside] + probe
+        moving = np.zeros(len(offsets), dtype=bool)
+        moving[inside] = _classify(codes[index], _ASCII_SPACE, str.isspace)
+        if not moving.any():
+            return offsets
+        offsets[moving] += step
+
+
+def segment_sentences(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sentence ``(starts, ends)`` offsets, terminators and surrounding whitespace excluded
+
+    Splits on runs of ``.``, ``!`` and ``?`` (as ``re.split(r'[.!?]+', ...)``)
+    except where the run is directly followed by a letter or digit
+    (``1.18``, ``e.g``, ``node.js``) or is a single '.' after a known
+    abbreviation (``et al.``, ``e.g.``, ``Dr.``, ``No. 5``). Empty sentences
+    are dropped.
+
+    Only terminator detection touches every character; all other checks
+    gather the few characters around each terminator run.
+    """
+    codes = code_points(text)
+    n = len(codes)
+    positions = np.flatnonzero((codes == 46) | (codes == 33) | (codes == 63))
+    if len(positions):
+        breaks = np.diff(positions) != 1
+        run_starts = positions[np.concatenate(([True], breaks))]
+        run_ends = positions[np.concatenate((breaks, [True]))] + 1
+    else:
+        run_starts = run_ends = _EMPTY
+
+    followed = np.zeros(len(run_ends), dtype=bool)
+    inside = run_ends < n
+    followed[inside] = _classify(codes[run_ends[inside]], _ASCII_ALNUM, str.isalnum)
+    keep = ~followed
+
+    # Length of the token (letters, digits, dots) before each lone '.'
+    candidates = np.flatnonzero(keep & (run_ends - run_starts == 1) & (codes[run_starts] == 46))
+    token_length = np.zeros(len(candidates), dtype=np.int64)
+    open_token = np.ones(len(candidates), dtype=bool)
+    for k in range(1, _MAX_ABBREVIATION + 2):
+        index = run_starts[candidates] - k
+        valid = open_token & (index >= 0)
+        chars = codes[np.maximum(index, 0)]
+        open_token &= valid & ((chars == 46) | _classify(chars, _ASCII_ALNUM, str.isalnum))
+        token_length += open_token
+    for i, length in zip(candidates.tolist(), token_length.tolist()):
+        if 0 < length <= _MAX_ABBREVIATION:
+            end = int(run_starts[i])
+            token = text[end - length:end].lower()
+            if token in ABBREVIATIONS or (token in NUMBER_ABBREVIATIONS and _NUMBER_AHEAD.match(text, end + 1)):
+                keep[i] = False
+
+    starts = _skip_space(codes, np.concatenate(([0], run_ends[keep])), 1, n)
+    ends = _skip_space(codes, np.concatenate((run_starts[keep], [n])), -1, 0)
+    nonempty = starts < ends
+    return starts[nonempty], ends[nonempty]
+
+
+class Document:
+    """Text plus lazily computed, cached views shared across scoring dimensions"""
+
+    __slots__ = ('text', '_lower', '_sentences', '_tokens')
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lower: Optional[str] = None
+        self._sentences: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._tokens: Optional[TokenStream] = None
+
+    @classmethod
+    def of(cls, text: str) -> 'Document':
+        """Document for ``text``, reusing the scoped one for the same string object"""
+        if isinstance(text, Document):
+            return text
+        document = _scoped.get()
+        if document is None or document.text is not text:
+            document = cls(text)
+        return document
+
+    @classmethod
+    @contextmanager
+    def scope(cls, text: str) -> Iterator['Document']:
+        """Make ``of(text)`` return one shared document until the block exits"""
+        document = cls.of(text)
+        token = _scoped.set(document)
+        try:
+            yield document
+        finally:
+            _scoped.reset(token)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def sentence_spans(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._sentences is None:
+            self._sentences = segment_sentences(self.text)
+        return self._sentences
+
+    @property
+    def tokens(self) -> TokenStream:
+        if self._tokens is None:
+            self._tokens = TokenStream.from_text(self.lower)
+        return self._tokens
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_spans[0])
+
+    def sentence(self, index: int) -> str:
+        starts, ends = self.sentence_spans
+        return self.text[starts[index]:ends[index]]
+
+    def sentences(self) -> Iterator[str]:
+        for start, end in zip(*self.sentence_spans):
+            yield self.text[start:end]
+
@@ -0,0 +1,209 @@
+"""
+Streaming Drift Detection
+
+Incremental counterpart of ``drift.ts``: watches scored streams per model
+and dimension and raises a ``DriftEvent`` when a new score leaves the EWMA
+control band. Each observation is O(1):
+
+- the EWMA is a single recurrence step
+- window mean/std/slope come from running sums over a ring buffer, updated
+  by adding the newest value and removing the evicted one
+
+As in ``detectDrift``, a new value is judged against the state *before* it
+is added (EWMA of prior values, std of the prior window), so the outlier
+does not widen its own threshold. All series live in rows of shared numpy
+arrays, grown by doubling when a new model/dimension pair appears.
+"""
+
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .variants import TRUST_SCORES, to_dimensions
+
+Key = Tuple[str, str]
+
+
+class DriftEvent:
+    """A score that crossed its series' control limit"""
+
+    __slots__ = ('model', 'dimension', 'value', 'ewma', 'deviation', 'threshold',
+                 'mean', 'std', 'slope', 'observation')
+
+    def __init__(self, model: str, dimension: str, value: float, ewma: float, deviation: float,
+                 threshold: float, mean: float, std: float, slope: float, observation: int):
+        self.model = model
+        self.dimension = dimension
+        self.value = value
+        self.ewma = ewma
+        self.deviation = deviation
+        self.threshold = threshold
+        self.mean = mean
+        self.std = std
+        self.slope = slope
+        self.observation = observation
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def result_dimensions(results: Dict[str, Any]) -> Dict[str, float]:
+    """Numeric dimension scores from a tester result or a flat dimension dict"""
+    if 'overall_score' in results:
+        results = to_dimensions(results)
+    dimensions = {}
+    for name, value in results.items():
+        if isinstance(value, str):
+            value = TRUST_SCORES.get(value)
+        if isinstance(value, (int, float)):
+            dimensions[name] = float(value)
+    return dimensions
+
+
+class DriftMonitor:
+    """Per model/dimension EWMA control limits over ring-buffer windows"""
+
+    def __init__(self, window: int = 50, alpha: float = 0.3, limit: float = 3.0,
+                 sigma_floor: float = 0.05, min_history: int = 2,
+                 on_drift: Optional[Callable[[DriftEvent], None]] = None,
+                 max_events: int = 1000, capacity: int = 16):
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.window = window
+        self.alpha = alpha
+        self.limit = limit
+        self.sigma_floor = sigma_floor
+        self.min_history = max(2, min_history)
+        self.on_drift = on_drift
+        self.events: Deque[DriftEvent] = deque(maxlen=max_events)
+        self._rows: Dict[Key, int] = {}
+        self._keys: List[Key] = []
+        self._ring = np.zeros((0, window))
+        self._count = np.zeros(0, dtype=np.int64)
+        self._state = np.zeros((0, 4))
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        old = len(self._count)
+        ring = np.zeros((capacity, self.window))
+        # Per row: observation count, EWMA, shift (first value), shifted window sum, sum of squares
+        count = np.zeros(capacity, dtype=np.int64)
+        state = np.zeros((capacity, 4))
+        ring[:old] = self._ring
+        count[:old] = self._count
+        state[:old] = self._state
+        self._ring, self._count, self._state = ring, count, state
+
+    def _row(self, model: str, dimension: str) -> int:
+        key = (model, dimension)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self._keys)
+            self._keys.append(key)
+            if row >= len(self._count):
+                self._allocate(2 * len(self._count))
+        return row
+
+    def update(self, model: str, dimension: str, value: float) -> Optional[DriftEvent]:
+        """Add one observation; returns the drift event if it crossed the limit"""
+        row = self._row(model, dimension)
+        ring, state = self._ring[row], self._state[row]
+        count = int(self._count[row])
+        value = float(value)
+        if count == 0:
+            ewma, shift, total, squares = value, value, 0.0, 0.0
+        else:
+            ewma, shift, total, squares = state.tolist()
+
+        size = min(count, self.window)
+        event = None
+        if size >= self.min_history:
+            mean, std, slope = self._window_stats(ring, count, size, shift, total, squares)
+            threshold = (std or self.sigma_floor) * self.limit
+            deviation = abs(value - ewma)
+            if deviation > threshold:
+                event = DriftEvent(model, dimension, value, ewma, deviation, threshold,
+                                   mean, std, slope, count)
+
+        slot = count % self.window
+        if count >= self.window:
+            evicted = float(ring[slot]) - shift
+            total -= evicted
+            squares -= evicted * evicted
+        shifted = value - shift
+        total += shifted
+        squares += shifted * shifted
+        ring[slot] = value
+        if count:
+            ewma = self.alpha * value + (1 - self.alpha) * ewma
+        state[:] = (ewma, shift, total, squares)
+        self._count[row] = count + 1
+
+        if event is not None:
+            self.events.append(event)
+            if self.on_drift is not None:
+                self.on_drift(event)
+        return event
+
+    def _window_stats(self, ring: np.ndarray, count: int, size: int, shift: float,
+                      total: float, squares: float) -> Tuple[float, float, float]:
+        mean = shift + total / size
+        variance = max(0.0, (squares - total * total / size) / max(1, size - 1))
+        newest = float(ring[(count - 1) % self.window])
+        oldest = float(ring[(count - size) % self.window])
+        return mean, math.sqrt(variance), (newest - oldest) / max(1, size - 1)
+
+    def observe(self, model: str, results: Dict[str, Any]) -> List[DriftEvent]:
+        """Feed one scorer result (tester result or dimension dict) for a model"""
+        events = []
+        for dimension, value in result_dimensions(results).items():
+            event = self.update(model, dimension, value)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def stats(self, model: str, dimension: str) -> Dict[str, float]:
+        """Current window mean/std/slope and EWMA for one series"""
+        row = self._rows.get((model, dimension))
+        count = 0 if row is None else int(self._count[row])
+        if not count:
+            return {'count': 0, 'ewma': 0.0, 'mean': 0.0, 'std': 0.0, 'slope': 0.0}
+        ewma, shift, total, squares = self._state[row].tolist()
+        size = min(count, self.window)
+        mean, std, slope = self._window_stats(self._ring[row], count, size, shift, total, squares)
+        return {'count': count, 'ewma': ewma, 'mean': mean, 'std': std, 'slope': slope}
+
+    def series(self) -> List[Key]:
+        return list(self._keys)
+
+    def to_dict(self) -> Dict[str, Any]:
+        n = len(self._keys)
+        return {
+            'window': self.window,
+            'alpha': self.alpha,
+            'limit': self.limit,
+            'sigma_floor': self.sigma_floor,
+            'min_history': self.min_history,
+            'keys': [list(key) for key in self._keys],
+            'ring': self._ring[:n].tolist(),
+            'count': self._count[:n].tolist(),
+            'state': self._state[:n].tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'DriftMonitor':
+        keys = [tuple(key) for key in state['keys']]
+        monitor = cls(state['window'], state['alpha'], state['limit'], state['sigma_floor'],
+                      state['min_history'], capacity=max(16, len(keys)))
+        for key in keys:
+            monitor._row(*key)
+        n = len(keys)
+        if n:
+            monitor._ring[:n] = state['ring']
+            monitor._count[:n] = state['count']
+            monitor._state[:n] = state['state']
+        return monitor
@@ -0,0 +1,115 @@
+"""
+Conversation Emergence Analysis
+
+Sliding-window emergence tracking for multi-turn agent conversations. Each
+turn is scanned once for the emergence features of a scoring spec (analogy,
+structure and synthesis patterns, grouped in the spec's emergence
+component) and its counts enter a ring buffer of the last ``window`` turns.
+
+Window aggregates are running sums: adding a turn adds its row and removes
+the evicted row, so a new turn costs O(turn length) for the scan plus
+O(features) for the update, independent of the window size.
+
+The window-level score evaluates the emergence component on the window's
+merged counts (presence features present in any turn, count features
+summed), i.e. as if the window's turns were one document, except that
+matches spanning two turns are not seen.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .spec import Component, Rule, ScoringSpec, get_spec
+
+
+class ConversationEmergence:
+    """Incremental emergence aggregates over the last ``window`` turns"""
+
+    def __init__(self, window: int = 10, variant: str = 'balanced',
+                 spec: Optional[ScoringSpec] = None):
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        self.window = window
+        self.spec = spec or get_spec(variant)
+        component = self.spec.component('reality_index', 'emergence_bonus')
+
+        # Remap the component's rules onto local feature columns
+        columns: Dict[int, int] = {}
+        for rule in component.rules:
+            columns.setdefault(rule.feature, len(columns))
+        self.features = [self.spec.features[index] for index in columns]
+        self.component = Component(component.name, component.base, [
+            Rule(columns[r.feature], r.weight, r.mode, r.min_count, r.cap, r.group)
+            for r in component.rules
+        ], component.low, component.high)
+        self.groups = list(dict.fromkeys(rule.group or 'other' for rule in component.rules))
+        self._group_ids = np.array([self.groups.index(rule.group or 'other') for rule in self.component.rules])
+        self._is_count = np.array([feature.count for feature in self.features])
+
+        self._counts = np.zeros((window, len(self.features)), dtype=np.int64)
+        self._hits = np.zeros((window, len(self.groups)), dtype=np.int64)
+        self._scores = np.zeros(window)
+        self._count_sums = np.zeros(len(self.features), dtype=np.int64)
+        self._hit_sums = np.zeros(len(self.groups), dtype=np.int64)
+        self._score_sum = 0.0
+        self.turns = 0
+
+    def _rule_hits(self, counts: List[int]) -> np.ndarray:
+        fired = np.array([rule.contribution(counts[rule.feature]) != 0 for rule in self.component.rules])
+        return np.bincount(self._group_ids[fired], minlength=len(self.groups))
+
+    def add_turn(self, text: str, role: Optional[str] = None) -> Dict[str, Any]:
+        """Scan one turn and update the window; returns turn and window aggregates"""
+        counts = self.spec.extract(text, self.features)
+        hits = self._rule_hits(counts)
+        score = self.component.value(counts)
+
+        slot = self.turns % self.window
+        if self.turns >= self.window:
+            self._count_sums -= self._counts[slot]
+            self._hit_sums -= self._hits[slot]
+            self._score_sum -= self._scores[slot]
+        self._counts[slot] = counts
+        self._hits[slot] = hits
+        self._scores[slot] = score
+        self._count_sums += self._counts[slot]
+        self._hit_sums += hits
+        self._score_sum += score
+        self.turns += 1
+
+        return {
+            'turn': self.turns - 1,
+            'role': role,
+            'score': score,
+            'hits': dict(zip(self.groups, hits.tolist())),
+            'window': self.summary()
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregates over the turns currently in the window"""
+        size = min(self.turns, self.window)
+        if not size:
+            return {'turns': 0, 'score': 0.0, 'mean_turn_score': 0.0,
+                    'hits': dict.fromkeys(self.groups, 0), 'hit_rate': dict.fromkeys(self.groups, 0.0)}
+        merged = np.where(self._is_count, self._count_sums, self._count_sums > 0).tolist()
+        return {
+            'turns': size,
+            'score': self.component.value(merged),
+            'mean_turn_score': self._score_sum / size,
+            'hits': dict(zip(self.groups, self._hit_sums.tolist())),
+            'hit_rate': dict(zip(self.groups, (self._hit_sums / size).tolist()))
+        }
+
+
+def analyze_conversation(turns: Iterable[Any], window: int = 10,
+                         variant: str = 'balanced') -> List[Dict[str, Any]]:
+    """Per-turn results for a conversation of strings or ``{'content', 'role'}`` dicts"""
+    analyzer = ConversationEmergence(window, variant)
+    results = []
+    for turn in turns:
+        if isinstance(turn, dict):
+            results.append(analyzer.add_turn(turn.get('content', ''), turn.get('role')))
+        else:
+            results.append(analyzer.add_turn(turn))
+    return results
@@ -0,0 +1,222 @@
+"""
+Accuracy Evaluation Harness
+
+Scores a labeled corpus in parallel and checks every ``expected`` constraint
+at once. Predictions are collected into per-dimension arrays and compared
+against ``min``/``max`` bounds (range dimensions) or ``status``/``level``
+labels with vectorized comparisons, producing per-dimension and per-context
+pass rates plus a list of failures.
+
+The corpus is consumed lazily: cases are read, scored and reduced to their
+name, context and expectations one batch at a time, so document contents
+are never all held in memory.
+
+``ethicalAlignment`` and ``resonanceQuality`` are placeholders for the
+TypeScript detector's extra dimensions. Corpora carry expectations for them,
+but no Python variant scores them yet, so they are reported as ``unscored``.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .corpus import case_context
+from .variants import DEFAULT_VARIANT, score_dimensions
+
+# Dimensions checked against numeric bounds, and label dimensions with their field
+# (ethicalAlignment and resonanceQuality are placeholders: no variant scores them)
+RANGE_DIMENSIONS = ('realityIndex', 'ethicalAlignment', 'canvasParity')
+LABEL_DIMENSIONS = {'trustProtocol': 'status', 'resonanceQuality': 'level'}
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _score_batch(contents: List[str], variant: str,
+                 scorer: Optional[Callable[[str], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Worker entry point: score a batch of contents"""
+    if scorer is not None:
+        return [scorer(content) for content in contents]
+    return [score_dimensions(content, variant) for content in contents]
+
+
+def score_contents(contents: List[str], variant: str = DEFAULT_VARIANT,
+                   scorer: Optional[Callable[[str], Dict[str, Any]]] = None,
+                   workers: Optional[int] = None, batch_size: int = 64) -> List[Dict[str, Any]]:
+    """Score contents across a process pool (``workers=1`` scores in-process)
+
+    A custom ``scorer`` must be a picklable top-level function when workers > 1.
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = [contents[i:i + batch_size] for i in range(0, len(contents), batch_size)]
+    score_batch = partial(_score_batch, variant=variant, scorer=scorer)
+    if workers == 1 or len(batches) <= 1:
+        results = map(score_batch, batches)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+            results = list(pool.map(score_batch, batches))
+    return [prediction for batch in results for prediction in batch]
+
+
+def _batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def score_stream(contents: Iterable[str], variant: str = DEFAULT_VARIANT,
+                 scorer: Optional[Callable[[str], Dict[str, Any]]] = None,
+                 workers: Optional[int] = None, batch_size: int = 64) -> Iterator[Dict[str, Any]]:
+    """``score_contents`` over an iterable, yielding predictions in input order as batches finish
+
+    At most two batches per worker are read ahead, so memory stays bounded
+    however long the input is.
+    """
+    workers = workers or os.cpu_count() or 1
+    score_batch = partial(_score_batch, variant=variant, scorer=scorer)
+    batches = _batches(contents, batch_size)
+    if workers == 1:
+        for batch in batches:
+            yield from score_batch(batch)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Any] = deque()
+        for batch in batches:
+            pending.append(pool.submit(score_batch, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class EvaluationReport:
+    """Vectorized comparison of predictions against expected constraints"""
+
+    def __init__(self, cases: List[Dict[str, Any]], predictions: List[Dict[str, Any]]):
+        n = len(cases)
+        self.names = [case.get('name', str(i)) for i, case in enumerate(cases)]
+        self.contexts = _object_array([case_context(case) for case in cases])
+        self.context_names, context_ids = np.unique(self.contexts, return_inverse=True) if n else ([], [])
+        self._context_ids = np.asarray(context_ids, dtype=np.int64)
+
+        self.predicted: Dict[str, np.ndarray] = {}
+        self.applicable: Dict[str, np.ndarray] = {}
+        self.unscored: Dict[str, np.ndarray] = {}
+        self.passed: Dict[str, np.ndarray] = {}
+        self._expected: Dict[str, Any] = {}
+
+        for dim in RANGE_DIMENSIONS:
+            predicted = np.full(n, np.nan)
+            low = np.full(n, np.nan)
+            high = np.full(n, np.nan)
+            for i, (case, prediction) in enumerate(zip(cases, predictions)):
+                bounds = case.get('expected', {}).get(dim)
+                if bounds is not None:
+                    low[i] = bounds.get('min', -np.inf)
+                    high[i] = bounds.get('max', np.inf)
+                value = prediction.get(dim)
+                if value is not None:
+                    predicted[i] = value
+            constrained = ~np.isnan(low)
+            scored = ~np.isnan(predicted)
+            with np.errstate(invalid='ignore'):
+                passed = (predicted >= low) & (predicted <= high)
+            self._record(dim, predicted, constrained, scored, passed, (low, high))
+
+        for dim, field in LABEL_DIMENSIONS.items():
+            predicted = _object_array([prediction.get(dim) for prediction in predictions])
+            expected = _object_array([case.get('expected', {}).get(dim, {}).get(field) for case in cases])
+            constrained = expected != None  # noqa: E711 (elementwise on object arrays)
+            scored = predicted != None  # noqa: E711
+            self._record(dim, predicted, constrained, scored, predicted == expected, expected)
+
+    def _record(self, dim: str, predicted, constrained, scored, passed, expected) -> None:
+        self.predicted[dim] = predicted
+        self.applicable[dim] = constrained & scored
+        self.unscored[dim] = constrained & ~scored
+        self.passed[dim] = self.applicable[dim] & passed.astype(bool)
+        self._expected[dim] = expected
+
+    @property
+    def case_passed(self) -> np.ndarray:
+        """Cases whose every applicable constraint passed"""
+        failed = np.zeros(len(self.names), dtype=bool)
+        for dim in self.applicable:
+            failed |= self.applicable[dim] & ~self.passed[dim]
+        return ~failed
+
+    def _by_context(self, dim: str) -> Dict[str, Optional[float]]:
+        k = len(self.context_names)
+        applicable = np.bincount(self._context_ids, weights=self.applicable[dim], minlength=k)
+        passed = np.bincount(self._context_ids, weights=self.passed[dim], minlength=k)
+        return {str(name): (float(p / a) if a else None)
+                for name, a, p in zip(self.context_names, applicable, passed)}
+
+    def failures(self) -> List[Dict[str, Any]]:
+        result = []
+        for dim in self.applicable:
+            for i in np.flatnonzero(self.applicable[dim] & ~self.passed[dim]):
+                expected = self._expected[dim]
+                if isinstance(expected, tuple):
+                    expected_value = {'min': float(expected[0][i]), 'max': float(expected[1][i])}
+                else:
+                    expected_value = expected[i]
+                predicted = self.predicted[dim][i]
+                result.append({
+                    'name': self.names[i],
+                    'context': self.contexts[i],
+                    'dimension': dim,
+                    'predicted': predicted.item() if isinstance(predicted, np.generic) else predicted,
+                    'expected': expected_value
+                })
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        dimensions = {}
+        for dim in self.applicable:
+            applicable = int(self.applicable[dim].sum())
+            passed = int(self.passed[dim].sum())
+            dimensions[dim] = {
+                'applicable': applicable,
+                'passed': passed,
+                'unscored': int(self.unscored[dim].sum()),
+                'pass_rate': passed / applicable if applicable else None,
+                'by_context': self._by_context(dim)
+            }
+        case_passed = self.case_passed
+        return {
+            'cases': len(self.names),
+            'case_pass_rate': float(case_passed.mean()) if len(self.names) else None,
+            'dimensions': dimensions,
+            'failures': self.failures()
+        }
+
+
+def evaluate_corpus(cases: Iterable[Dict[str, Any]], variant: str = DEFAULT_VARIANT,
+                    scorer: Optional[Callable[[str], Dict[str, Any]]] = None,
+                    workers: Optional[int] = None, batch_size: int = 64) -> EvaluationReport:
+    """Score every case of a corpus in parallel and evaluate its expectations
+
+    Cases are consumed lazily; only their name, context and expectations are kept.
+    """
+    kept: List[Dict[str, Any]] = []
+
+    def contents() -> Iterator[str]:
+        for i, case in enumerate(cases):
+            kept.append({'name': case.get('name', str(i)), 'expected': case.get('expected', {}),
+                         'input': {'metadata': {'context': case_context(case)}}})
+            yield case.get('input', {}).get('content', '')
+
+    predictions = list(score_stream(contents(), variant, scorer, workers, batch_size))
+    return EvaluationReport(kept, predictions)
@@ -0,0 +1,141 @@
+"""
+Group Fairness Metrics
+
+Per-group false positive / false negative rates, equalized-odds gap and
+Wilson confidence intervals for ethics receipts. Confusion counts are kept
+as an (n_groups, 4) integer array and updated with a single ``np.bincount``
+per batch, so accumulation over tens of millions of predictions and
+thousands of groups stays vectorized. Accumulators merge across workers.
+"""
+
+from statistics import NormalDist
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+# Column order of the confusion count matrix: cell = 2 * label + prediction
+TN, FP, FN, TP = 0, 1, 2, 3
+
+
+def wilson_interval(successes: np.ndarray, totals: np.ndarray, confidence: float = 0.95):
+    """Vectorized Wilson score interval; NaN where the total is zero"""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    successes = np.asarray(successes, dtype=np.float64)
+    totals = np.asarray(totals, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = successes / totals
+        denominator = 1 + z * z / totals
+        centre = (p + z * z / (2 * totals)) / denominator
+        margin = z * np.sqrt(p * (1 - p) / totals + z * z / (4 * totals * totals)) / denominator
+    return centre - margin, centre + margin
+
+
+class FairnessReport:
+    """Per-group rates (aligned arrays) plus the equalized-odds gap"""
+
+    def __init__(self, groups: List[Hashable], counts: np.ndarray, confidence: float,
+                 min_support: int = 1):
+        self.groups = groups
+        self.counts = counts
+        self.negatives = counts[:, TN] + counts[:, FP]
+        self.positives = counts[:, FN] + counts[:, TP]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.fpr = counts[:, FP] / self.negatives
+            self.fnr = counts[:, FN] / self.positives
+        self.fpr_ci = wilson_interval(counts[:, FP], self.negatives, confidence)
+        self.fnr_ci = wilson_interval(counts[:, FN], self.positives, confidence)
+
+        # Groups without enough support on a side do not contribute to that side's gap
+        fpr = self.fpr[self.negatives >= min_support]
+        fnr = self.fnr[self.positives >= min_support]
+        fpr_gap = float(fpr.max() - fpr.min()) if fpr.size else 0.0
+        fnr_gap = float(fnr.max() - fnr.min()) if fnr.size else 0.0
+        self.eo_gap = max(fpr_gap, fnr_gap)
+
+    def to_receipt(self, decimals: int = 3) -> Dict[str, Any]:
+        """Receipt fields: ``eo_gap`` and ``bias_metrics`` (NaN rates are omitted)"""
+        def rates(values: np.ndarray) -> Dict[str, float]:
+            return {str(group): round(float(value), decimals)
+                    for group, value in zip(self.groups, values) if not np.isnan(value)}
+
+        return {
+            'eo_gap': round(self.eo_gap, decimals),
+            'bias_metrics': {
+                'group_fpr': rates(self.fpr),
+                'group_fnr': rates(self.fnr),
+                'group_fpr_ci': {str(g): [round(float(lo), decimals), round(float(hi), decimals)]
+                                 for g, lo, hi in zip(self.groups, *self.fpr_ci) if not np.isnan(lo)},
+                'group_fnr_ci': {str(g): [round(float(lo), decimals), round(float(hi), decimals)]
+                                 for g, lo, hi in zip(self.groups, *self.fnr_ci) if not np.isnan(lo)}
+            }
+        }
+
+
+class GroupFairnessAccumulator:
+    """Streaming per-group confusion counts for binary labels/predictions"""
+
+    def __init__(self):
+        self._index: Dict[Hashable, int] = {}
+        self._groups: List[Hashable] = []
+        self.counts = np.zeros((0, 4), dtype=np.int64)
+
+    def _group_ids(self, unique_groups: Iterable[Hashable]) -> np.ndarray:
+        """Map (already de-duplicated) group keys to stable integer ids"""
+        ids = []
+        for group in unique_groups:
+            group = group.item() if isinstance(group, np.generic) else group
+            gid = self._index.get(group)
+            if gid is None:
+                gid = self._index[group] = len(self._groups)
+                self._groups.append(group)
+            ids.append(gid)
+        return np.asarray(ids, dtype=np.int64)
+
+    def _grow(self) -> None:
+        if self.counts.shape[0] < len(self._groups):
+            grown = np.zeros((len(self._groups), 4), dtype=np.int64)
+            grown[:self.counts.shape[0]] = self.counts
+            self.counts = grown
+
+    def update(self, labels, predictions, groups) -> 'GroupFairnessAccumulator':
+        """Accumulate one batch of binary labels, binary predictions and scalar group keys
+
+        Composite groups (language x region x model) are passed as joined keys,
+        e.g. ``'es/latam/mlp_v3'``.
+        """
+        labels = np.asarray(labels).astype(bool, copy=False)
+        predictions = np.asarray(predictions).astype(bool, copy=False)
+        groups = np.asarray(groups)
+        if not (labels.shape == predictions.shape == groups.shape):
+            raise ValueError('labels, predictions and groups must have the same shape')
+        if labels.size == 0:
+            return self
+
+        unique_groups, inverse = np.unique(groups, return_inverse=True)
+        gid = self._group_ids(unique_groups)[inverse.ravel()]
+        cell = labels.ravel().astype(np.int64) * 2 + predictions.ravel()
+        self._grow()
+        batch = np.bincount(gid * 4 + cell, minlength=len(self._groups) * 4)
+        self.counts += batch.reshape(-1, 4)
+        return self
+
+    def merge(self, other: 'GroupFairnessAccumulator') -> 'GroupFairnessAccumulator':
+        """Fold another accumulator's counts into this one"""
+        if other._groups:
+            gid = self._group_ids(other._groups)
+            self._grow()
+            np.add.at(self.counts, gid, other.counts[:len(other._groups)])
+        return self
+
+    @property
+    def groups(self) -> List[Hashable]:
+        return list(self._groups)
+
+    def report(self, confidence: float = 0.95, min_support: int = 1,
+               groups: Optional[Iterable[Hashable]] = None) -> FairnessReport:
+        """Compute rates and intervals, optionally restricted to a subset of groups"""
+        if groups is None:
+            return FairnessReport(self.groups, self.counts, confidence, min_support)
+        selected = list(groups)
+        rows = np.asarray([self._index[g] for g in selected], dtype=np.int64)
+        return FairnessReport(selected, self.counts[rows], confidence, min_support)
@@ -0,0 +1,244 @@
+"""
+Golden Score Snapshots
+
+Versioned snapshots of every variant's per-document scores for a corpus,
+used as regression baselines (the ``golden_version`` of reality receipts):
+
+    golden/
+      2025.09.26-rc1.npz    ids, one column per (variant, dimension), metadata
+
+Each snapshot is one columnar ``.npz`` file: document IDs as a sorted UTF-8
+bytes column, ``int16`` columns for integer scores, ``float64`` for the
+Reality Index and ``int8`` codes for the trust status. Diffing a run against
+a golden version aligns the two ID columns once and then compares whole
+columns against per-dimension tolerances, so only changed documents are ever
+turned back into Python objects.
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .evaluation import score_contents
+from .variants import DEFAULT_VARIANT, variant_version
+
+GOLDEN_FORMAT = 'symbi-golden'
+GOLDEN_FORMAT_VERSION = 1
+
+# Dimension -> column dtype; trust statuses are stored as codes into TRUST_LEVELS
+GOLDEN_DIMENSIONS = {
+    'overallScore': np.int16,
+    'realityIndex': np.float64,
+    'canvasParity': np.int16,
+    'trustProtocol': np.int8
+}
+TRUST_LEVELS = ('FAIL', 'PARTIAL', 'PASS')
+DEFAULT_TOLERANCES = {'overallScore': 0, 'realityIndex': 0.0, 'canvasParity': 0, 'trustProtocol': 0}
+
+_VERSION = re.compile(r'^[\w.\-]+$')
+_EPSILON = 1e-9
+
+
+def _column(dim: str, values: List[Any]) -> np.ndarray:
+    if dim == 'trustProtocol':
+        return np.array([TRUST_LEVELS.index(value) for value in values], dtype=np.int8)
+    return np.array(values, dtype=GOLDEN_DIMENSIONS[dim])
+
+
+def _value(dim: str, value: Any) -> Any:
+    return TRUST_LEVELS[value] if dim == 'trustProtocol' else value.item()
+
+
+class GoldenSnapshot:
+    """Per-document scores for a set of variants, sorted by document ID"""
+
+    def __init__(self, version: str, ids: np.ndarray, columns: Dict[str, Dict[str, np.ndarray]],
+                 scorers: Optional[Dict[str, str]] = None):
+        if not _VERSION.match(version):
+            raise ValueError(f'Invalid golden version: {version!r}')
+        order = np.argsort(ids, kind='stable')
+        self.version = version
+        self.ids = ids[order]
+        if len(self.ids) > 1 and (self.ids[1:] == self.ids[:-1]).any():
+            raise ValueError('Duplicate document IDs in golden snapshot')
+        self.columns = {variant: {dim: column[order] for dim, column in dims.items()}
+                        for variant, dims in columns.items()}
+        self.scorers = scorers or {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def variants(self) -> List[str]:
+        return list(self.columns)
+
+    @classmethod
+    def from_results(cls, version: str, ids: Sequence[str],
+                     results: Dict[str, List[Dict[str, Any]]],
+                     scorers: Optional[Dict[str, str]] = None) -> 'GoldenSnapshot':
+        """Snapshot from per-variant lists of dimension results aligned with ``ids``"""
+        columns = {variant: {dim: _column(dim, [result[dim] for result in rows]) for dim in GOLDEN_DIMENSIONS}
+                   for variant, rows in results.items()}
+        return cls(version, np.array([i.encode('utf-8') for i in ids], dtype=bytes), columns, scorers)
+
+    def save(self, path: str) -> None:
+        meta = {'format': GOLDEN_FORMAT, 'format_version': GOLDEN_FORMAT_VERSION,
+                'golden_version': self.version, 'documents': len(self.ids), 'scorers': self.scorers}
+        arrays = {'ids': self.ids, 'meta': np.array(json.dumps(meta))}
+        for variant, dims in self.columns.items():
+            for dim, column in dims.items():
+                arrays[f'{variant}/{dim}'] = column
+        temporary = path + '.tmp.npz'
+        np.savez_compressed(temporary, **arrays)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'GoldenSnapshot':
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('format') != GOLDEN_FORMAT or meta.get('format_version', 0) > GOLDEN_FORMAT_VERSION:
+                raise ValueError(f'Not a supported golden snapshot: {path}')
+            columns: Dict[str, Dict[str, np.ndarray]] = {}
+            for key in data.files:
+                if '/' in key:
+                    variant, dim = key.split('/', 1)
+                    columns.setdefault(variant, {})[dim] = data[key]
+            return cls(meta['golden_version'], data['ids'], columns, meta.get('scorers'))
+
+    def diff(self, current: 'GoldenSnapshot',
+             tolerances: Optional[Dict[str, float]] = None) -> 'GoldenDiff':
+        """Compare ``current`` against this golden snapshot"""
+        return GoldenDiff(self, current, tolerances)
+
+
+class GoldenDiff:
+    """Documents whose scores moved beyond tolerance, plus added and removed IDs
+
+    A golden variant or dimension the current run lacks is listed in ``missing``
+    and counts as changed for every shared document (its current value is None).
+    """
+
+    def __init__(self, golden: GoldenSnapshot, current: GoldenSnapshot,
+                 tolerances: Optional[Dict[str, float]] = None):
+        self.golden = golden
+        self.current = current
+        self.tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+        if np.array_equal(golden.ids, current.ids):
+            # Same corpus: rows already line up
+            self.ids = golden.ids
+            golden_rows = current_rows = np.arange(len(self.ids))
+            self.added = self.removed = golden.ids[:0]
+        else:
+            self.ids, golden_rows, current_rows = np.intersect1d(
+                golden.ids, current.ids, assume_unique=True, return_indices=True)
+            self.added = np.setdiff1d(current.ids, golden.ids, assume_unique=True)
+            self.removed = np.setdiff1d(golden.ids, current.ids, assume_unique=True)
+
+        # (variant, dimension) -> boolean mask over the shared IDs
+        self.changed: Dict[str, Dict[str, np.ndarray]] = {}
+        self.missing: Dict[str, List[str]] = {}
+        self._rows = (golden_rows, current_rows)
+        for variant, dims in golden.columns.items():
+            for dim in dims:
+                if dim not in current.columns.get(variant, {}):
+                    self.missing.setdefault(variant, []).append(dim)
+                    self.changed.setdefault(variant, {})[dim] = np.ones(len(self.ids), dtype=bool)
+                    continue
+                before = golden.columns[variant][dim][golden_rows]
+                after = current.columns[variant][dim][current_rows]
+                if dim == 'trustProtocol':
+                    moved = np.abs(before.astype(np.int16) - after) > self.tolerances[dim]
+                else:
+                    moved = np.abs(before.astype(np.float64) - after) > self.tolerances[dim] + _EPSILON
+                self.changed.setdefault(variant, {})[dim] = moved
+
+    @property
+    def changed_mask(self) -> np.ndarray:
+        mask = np.zeros(len(self.ids), dtype=bool)
+        for dims in self.changed.values():
+            for moved in dims.values():
+                mask |= moved
+        return mask
+
+    @property
+    def clean(self) -> bool:
+        return not (self.changed_mask.any() or self.missing or len(self.added) or len(self.removed))
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        return {variant: {dim: int(moved.sum()) for dim, moved in dims.items()}
+                for variant, dims in self.changed.items()}
+
+    def changes(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Changed documents with golden and current values of each moved dimension"""
+        golden_rows, current_rows = self._rows
+        result = []
+        for k in np.flatnonzero(self.changed_mask)[:limit].tolist():
+            entry: Dict[str, Any] = {'id': self.ids[k].decode('utf-8'), 'changes': {}}
+            for variant, dims in self.changed.items():
+                for dim, moved in dims.items():
+                    if moved[k]:
+                        current = self.current.columns.get(variant, {}).get(dim)
+                        entry['changes'].setdefault(variant, {})[dim] = {
+                            'golden': _value(dim, self.golden.columns[variant][dim][golden_rows[k]]),
+                            'current': None if current is None else _value(dim, current[current_rows[k]])
+                        }
+            result.append(entry)
+        return result
+
+    def to_dict(self, limit: Optional[int] = 100) -> Dict[str, Any]:
+        return {
+            'golden_version': self.golden.version,
+            'current_version': self.current.version,
+            'compared': len(self.ids),
+            'changed': int(self.changed_mask.sum()),
+            'by_dimension': self.counts(),
+            'missing': self.missing,
+            'added': [i.decode('utf-8') for i in self.added[:limit].tolist()],
+            'removed': [i.decode('utf-8') for i in self.removed[:limit].tolist()],
+            'changes': self.changes(limit)
+        }
+
+
+class GoldenStore:
+    """Directory of golden snapshots, one ``<version>.npz`` file each"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path(self, version: str) -> str:
+        if not _VERSION.match(version):
+            raise ValueError(f'Invalid golden version: {version!r}')
+        return os.path.join(self.directory, f'{version}.npz')
+
+    def versions(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.directory) if name.endswith('.npz'))
+
+    def save(self, snapshot: GoldenSnapshot) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(snapshot.version)
+        snapshot.save(path)
+        return path
+
+    def load(self, version: str) -> GoldenSnapshot:
+        path = self.path(version)
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown golden version '{version}'")
+        return GoldenSnapshot.load(path)
+
+    def compare(self, version: str, current: GoldenSnapshot,
+                tolerances: Optional[Dict[str, float]] = None) -> GoldenDiff:
+        return self.load(version).diff(current, tolerances)
+
+
+def snapshot_contents(version: str, ids: Sequence[str], contents: List[str],
+                      variants: Sequence[str] = (DEFAULT_VARIANT,),
+                      workers: Optional[int] = None) -> GoldenSnapshot:
+    """Score contents with each variant and snapshot the results"""
+    results = {variant: score_contents(contents, variant, workers=workers) for variant in variants}
+    scorers = {variant: variant_version(variant) for variant in variants}
+    return GoldenSnapshot.from_results(version, ids, results, scorers)
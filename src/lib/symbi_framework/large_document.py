@@ -0,0 +1,166 @@
+"""
+Large Document Scoring
+
+Scores documents too large to hold comfortably as one string (multi-hundred
+MB transcripts). The file is memory-mapped and scanned in windows; only one
+window is decoded at a time, so peak memory is bounded by the window size
+rather than the document size.
+
+Each window owns a core byte range ``[start, end)`` and is decoded together
+with ``overlap`` bytes of context on both sides. The overlap is sized to the
+longest pattern reach in the spec (literal length for terms, maximum width
+for bounded regexes, ``max_reach`` characters for unbounded ones such as
+``.*?``).
+
+Window results merge into document-level feature counts as follows:
+
+- presence features (terms and searched patterns) are OR-ed: a feature is
+  present if any window, context included, contains a match
+- count features are summed over matches that *start* in a window's core, so
+  a match in the overlap is counted by exactly one window
+- each count feature's scan resumes where the previous window's last counted
+  match ended, which is where a whole-document ``findall`` resumes too, so
+  non-overlapping matches pair up the same way (``\\*\\*.*?\\*\\*`` on a long
+  line with many ``**``) instead of depending on where the window starts
+
+Both are exact for every match no longer than the overlap. A match that
+spans more than ``max_reach`` characters (a ``.*?`` gap across a very long
+line) can be missed, and can then shift how later matches pair up; this is
+the price of bounded memory.
+
+ASCII windows are not decoded at all: they are matched as bytes with the
+spec's bytes-compiled patterns, and byte offsets double as match offsets.
+"""
+
+import mmap
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre
+    import sre_parse as _sre_parse
+
+from .spec import LOWER, TERM, Feature, ScoringSpec, ascii_safe, get_spec
+
+# Bytes per character in the worst case (UTF-8)
+_MAX_CHAR_BYTES = 4
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+@lru_cache(maxsize=None)
+def feature_reach(feature: Feature, max_reach: int = 4096) -> int:
+    """Longest match of a feature in characters (``max_reach`` if unbounded)"""
+    if feature.kind == TERM:
+        return len(feature.source)
+    _, high = _sre_parse.parse(feature.source).getwidth()
+    return max_reach if high >= _sre.MAXREPEAT - 1 else min(high, max_reach)
+
+
+def _snap(data: Buffer, position: int) -> int:
+    """Move a byte offset back to the start of a UTF-8 character"""
+    while 0 < position < len(data) and (data[position] & 0xC0) == 0x80:
+        position -= 1
+    return position
+
+
+class LargeDocumentScorer:
+    """Windowed, memory-mapped scoring with a spec's feature tables"""
+
+    def __init__(self, variant: str = 'balanced', window_size: int = 4 * 1024 * 1024,
+                 max_reach: int = 4096, spec: Optional[ScoringSpec] = None):
+        self.spec = spec or get_spec(variant)
+        self.window_size = window_size
+        self.max_reach = max_reach
+        reach = max(feature_reach(f, max_reach) for f in self.spec.features)
+        self.overlap = reach * _MAX_CHAR_BYTES
+        self.windows = 0
+
+    def counts(self, data: Buffer) -> List[int]:
+        """Merged feature counts over all windows of a UTF-8 buffer"""
+        features = self.spec.features
+        counts = [0] * len(features)
+        # Per count feature: where its scan resumes, relative to the end of the last core
+        resume = [0] * len(features)
+        self.windows = 0
+        start, size = 0, len(data)
+        while start < size:
+            end = _snap(data, min(size, start + self.window_size))
+            if end <= start:
+                end = min(size, start + self.window_size)
+            left = _snap(data, max(0, start - self.overlap))
+            right = _snap(data, min(size, end + self.overlap))
+            self._scan(data, left, start, end, right, counts, resume)
+            self.windows += 1
+            start = end
+        return counts
+
+    def _scan(self, data: Buffer, left: int, start: int, end: int, right: int,
+              counts: List[int], resume: Optional[List[int]] = None) -> None:
+        """Match one window; ``resume`` carries count scans over from the previous window"""
+        window = bytes(data[left:right])
+        if ascii_safe(window):
+            core = (start - left, end - left)
+            self._match(window, window.lower(), core, core, counts, resume)
+            return
+        del window
+        before = bytes(data[left:start]).decode('utf-8', errors='replace')
+        core = bytes(data[start:end]).decode('utf-8', errors='replace')
+        after = bytes(data[end:right]).decode('utf-8', errors='replace')
+        raw = before + core + after
+        lower = raw.lower()
+        # Core bounds in each text; lowercasing can change lengths
+        raw_core = (len(before), len(before) + len(core))
+        lower_start = len(before.lower())
+        lower_core = (lower_start, lower_start + len(core.lower()))
+        del before, core, after
+        self._match(raw, lower, raw_core, lower_core, counts, resume)
+
+    def _match(self, raw: Union[str, bytes], lower: Union[str, bytes], raw_core: Tuple[int, int],
+               lower_core: Tuple[int, int], counts: List[int], resume: Optional[List[int]]) -> None:
+        binary = isinstance(raw, bytes)
+        for feature in self.spec.features:
+            if not feature.count and counts[feature.index]:
+                continue
+            text, (core_start, core_end) = ((lower, lower_core) if feature.target == LOWER
+                                            else (raw, raw_core))
+            if feature.kind == TERM:
+                if (feature.needle if binary else feature.source) in text:
+                    counts[feature.index] = 1
+                continue
+            pattern = feature.compiled_bytes if binary else feature.compiled
+            if pattern is None:
+                text, pattern = text.decode('ascii'), feature.compiled
+            if feature.count:
+                # The window's core starts where the previous one ended
+                position = 0 if resume is None else max(0, core_start + resume[feature.index])
+                for match in pattern.finditer(text, position):
+                    if match.start() >= core_end:
+                        break
+                    if match.start() >= core_start:
+                        counts[feature.index] += 1
+                        position = match.end()
+                if resume is not None:
+                    resume[feature.index] = position - core_end
+            elif pattern.search(text):
+                counts[feature.index] = 1
+
+    def count_file(self, path: str) -> List[int]:
+        if os.path.getsize(path) == 0:
+            return self.counts(b'')
+        with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return self.counts(data)
+
+    def score_file(self, path: str) -> Dict[str, Any]:
+        """Score a file; ``windows`` records how many windows were scanned"""
+        results = self.spec.evaluate(self.count_file(path))
+        results['windows'] = self.windows
+        return results
+
+
+def score_large_document(path: str, variant: str = 'balanced',
+                         window_size: int = 4 * 1024 * 1024, max_reach: int = 4096) -> Dict[str, Any]:
+    return LargeDocumentScorer(variant, window_size, max_reach).score_file(path)
@@ -0,0 +1,191 @@
+"""
+Memory-Mapped Corpus Reader
+
+Reads bulk corpora (JSONL files or concatenated texts with a record
+separator) through one read-only memory map plus an offset index:
+
+    responses.jsonl
+    responses.jsonl.offsets.npz    record starts/ends, file size and mtime
+
+The index is built once with a vectorized separator scan (in fixed-size
+chunks, so its temporary mask stays small) and reused until the file
+changes. Records are handed out as zero-copy ``memoryview`` slices
+of the mapping and decoded only when a caller asks for text or JSON.
+
+Process pools share the file instead of receiving pickled records:
+``score_mapped`` sends workers ``(start, stop)`` record ranges, and each
+worker maps the file once (the page cache is shared by all of them).
+"""
+
+import json
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .variants import DEFAULT_VARIANT, score_dimensions
+
+INDEX_SUFFIX = '.offsets.npz'
+INDEX_VERSION = 1
+# Bytes compared per step of the separator scan (bounds the temporary mask)
+SCAN_CHUNK = 1 << 24
+
+
+def _find_separators(buffer, separator: bytes) -> np.ndarray:
+    if len(separator) == 1:
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        found = [np.flatnonzero(data[offset:offset + SCAN_CHUNK] == separator[0]) + offset
+                 for offset in range(0, len(data), SCAN_CHUNK)]
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+    return np.fromiter((m.start() for m in re.finditer(re.escape(separator), buffer)), dtype=np.int64)
+
+
+def build_offsets(buffer, separator: bytes = b'\n') -> Tuple[np.ndarray, np.ndarray]:
+    """Record ``(starts, ends)`` between separators; empty records and trailing CR dropped"""
+    positions = _find_separators(buffer, separator).astype(np.int64)
+    starts = np.concatenate(([0], positions + len(separator)))
+    ends = np.concatenate((positions, [len(buffer)]))
+    if len(buffer) and len(separator) == 1 and separator != b'\r':
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        nonempty = ends > starts
+        carriage = np.zeros(len(ends), dtype=bool)
+        carriage[nonempty] = data[ends[nonempty] - 1] == 13
+        ends = ends - carriage
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
+class MappedCorpus:
+    """Read-only memory-mapped records with a persisted offset index"""
+
+    def __init__(self, path: str, separator: bytes = b'\n', field: Optional[str] = None,
+                 persist_index: bool = True):
+        """``field`` is a dotted JSON path (``input.content``) for ``content``; None uses the raw text"""
+        if not separator:
+            raise ValueError('separator must not be empty')
+        self.path = path
+        self.separator = separator
+        self.field = field
+        self.persist_index = persist_index
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b'')
+        self.starts, self.ends = self._load_index()
+
+    def __reduce__(self):
+        # Pickles as its path, so workers map the file themselves
+        return MappedCorpus, (self.path, self.separator, self.field, self.persist_index)
+
+    @property
+    def index_path(self) -> str:
+        return self.path + INDEX_SUFFIX
+
+    def _stamp(self) -> Tuple[int, int]:
+        stat = os.fstat(self._file.fileno())
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        size, mtime_ns = self._stamp()
+        try:
+            with np.load(self.index_path, allow_pickle=False) as index:
+                if (int(index['version']) == INDEX_VERSION and int(index['size']) == size
+                        and int(index['mtime_ns']) == mtime_ns and index['separator'].tobytes() == self.separator):
+                    return index['starts'], index['ends']
+        except (OSError, KeyError, ValueError):
+            pass
+        starts, ends = build_offsets(self._view, self.separator)
+        if self.persist_index:
+            temporary = self.index_path + '.tmp.npz'
+            try:
+                np.savez(temporary, version=INDEX_VERSION, size=size, mtime_ns=mtime_ns,
+                         separator=np.frombuffer(self.separator, dtype=np.uint8), starts=starts, ends=ends)
+                os.replace(temporary, self.index_path)
+            except OSError:
+                pass  # Read-only location: keep the index in memory only
+        return starts, ends
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def record(self, index: int) -> memoryview:
+        """Zero-copy view of one record's bytes"""
+        return self._view[self.starts[index]:self.ends[index]]
+
+    __getitem__ = record
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> List[memoryview]:
+        stop = len(self) if stop is None else min(stop, len(self))
+        view = self._view
+        return [view[s:e] for s, e in zip(self.starts[start:stop].tolist(), self.ends[start:stop].tolist())]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return iter(self.records())
+
+    def text(self, index: int) -> str:
+        return str(self.record(index), 'utf-8')
+
+    def json(self, index: int) -> Any:
+        return json.loads(str(self.record(index), 'utf-8'))
+
+    def content(self, index: int) -> str:
+        """Text to score: the raw record, or its ``field`` when records are JSON"""
+        if self.field is None:
+            return self.text(index)
+        value = self.json(index)
+        for key in self.field.split('.'):
+            value = value[key]
+        return value
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Record views are still alive; the mapping closes when they go
+        self._file.close()
+
+    def __enter__(self) -> 'MappedCorpus':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# Per-process mappings opened by ``_score_range`` workers
+_OPEN: Dict[Tuple[str, bytes, Optional[str]], MappedCorpus] = {}
+
+
+def _score_records(corpus: MappedCorpus, bounds: Tuple[int, int], variant: str) -> List[Dict[str, Any]]:
+    return [score_dimensions(corpus.content(i), variant) for i in range(*bounds)]
+
+
+def _score_range(bounds: Tuple[int, int], path: str, separator: bytes,
+                 field: Optional[str], variant: str) -> List[Dict[str, Any]]:
+    """Worker entry point: score records ``start:stop`` of a mapped corpus"""
+    key = (path, separator, field)
+    corpus = _OPEN.get(key)
+    if corpus is None:
+        corpus = _OPEN[key] = MappedCorpus(path, separator, field, persist_index=False)
+    return _score_records(corpus, bounds, variant)
+
+
+def score_mapped(path: str, variant: str = DEFAULT_VARIANT, separator: bytes = b'\n',
+                 field: Optional[str] = None, workers: Optional[int] = None,
+                 batch_size: int = 256) -> List[Dict[str, Any]]:
+    """Score every record of a mapped corpus; workers receive record ranges only"""
+    workers = workers or os.cpu_count() or 1
+    with MappedCorpus(path, separator, field) as corpus:
+        count = len(corpus)
+        ranges = [(i, min(i + batch_size, count)) for i in range(0, count, batch_size)]
+        if workers == 1 or len(ranges) <= 1:
+            return [prediction for bounds in ranges for prediction in _score_records(corpus, bounds, variant)]
+    score_range = partial(_score_range, path=path, separator=separator, field=field, variant=variant)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        results = list(pool.map(score_range, ranges))
+    return [prediction for batch in results for prediction in batch]
@@ -0,0 +1,240 @@
+"""
+Multilingual Scoring
+
+Extends a scoring spec to the languages the ethics receipts list
+(``en``, ``es``, ``fr``, ``ar``, ``hi``, ``zh``). Each language has a term
+table keyed by the English spec feature it stands in for; the table is
+compiled into one trie-shaped regex (shared prefixes are matched once), so a
+response is scanned by a single automaton for its language instead of by
+every language's term list.
+
+A cheap identification pre-pass picks the automaton: Unicode script counts
+over a sample decide Arabic, Devanagari and Han text, and stopword hits
+separate English, Spanish and French. English responses are scored by the
+spec unchanged; other languages add their automaton's hits to the spec's
+own feature counts, so code-switched English and markup still count.
+
+The language automata match casefolded text. The spec's own features keep
+the tester's ``str.lower()``, so English scores stay identical to the
+balanced tester; the two only differ on characters such as ``ß`` and final
+``ς``, which no English feature contains.
+
+Latin-script tables match at word starts, which allows inflected endings
+(``limitación``/``limitaciones``); Arabic, Devanagari and Han tables match
+anywhere, which makes CJK matching segmentation-free and tolerates attached
+Arabic prefixes.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from .artifacts import compile_pattern
+from .spec import ScoringSpec, get_spec
+
+LANGUAGES = ('en', 'es', 'fr', 'ar', 'hi', 'zh')
+
+# Language -> {English spec feature source: native terms}
+TERM_TABLES: Dict[str, Dict[str, List[str]]] = {
+    'es': {
+        'reference': ['referencia'], 'paper': ['artículo'], 'study': ['estudio'], 'source': ['fuente'],
+        'limitation': ['limitación', 'limitaciones'], 'simplified': ['simplificad'],
+        'note that': ['cabe señalar', 'ten en cuenta que'],
+        'should note': ['debo señalar', 'debo aclarar'], r'i should note': ['debo señalar', 'debo aclarar'],
+        'involves concepts': ['implica conceptos'], 'complex': ['complej'], 'involves': ['implica'],
+        r'let me explain': ['déjame explicar', 'permíteme explicar'],
+        r'would you like': ['te gustaría', 'le gustaría'],
+        r'does this.*?help': ['¿te ayuda', '¿esto ayuda', '¿le ayuda'],
+        r'for example|such as|like.*?sentence': ['por ejemplo'],
+        r'in other words': ['en otras palabras'], r'this means': ['esto significa'],
+        r'put simply': ['en pocas palabras', 'dicho de forma sencilla'],
+        r'similar to': ['similar a', 'parecido a'],
+        r'to understand': ['para entender', 'para comprender'],
+        r'help.*?understand': ['ayudarte a entender', 'ayudarle a entender'],
+        'transformer': ['transformador'], 'neural network': ['red neuronal', 'redes neuronales'],
+        'architecture': ['arquitectura']
+    },
+    'fr': {
+        'reference': ['référence'], 'paper': ['article'], 'study': ['étude'], 'source': ['source'],
+        'limitation': ['limitation'], 'simplified': ['simplifié'],
+        'note that': ['notez que', 'il faut noter'],
+        'should note': ['je dois noter', 'je dois préciser'],
+        r'i should note': ['je dois noter', 'je dois préciser'],
+        'involves concepts': ['implique des concepts'], 'complex': ['complexe'], 'involves': ['implique'],
+        r'let me explain': ['laissez-moi expliquer', "permettez-moi d'expliquer"],
+        r'would you like': ['voulez-vous', 'aimeriez-vous'],
+        r'does this.*?help': ['cela vous aide', 'est-ce que cela aide'],
+        r'for example|such as|like.*?sentence': ['par exemple'],
+        r'in other words': ["en d'autres termes", 'autrement dit'], r'this means': ['cela signifie'],
+        r'put simply': ['pour faire simple'], r'similar to': ['similaire à'],
+        r'to understand': ['pour comprendre'], r'help.*?understand': ['vous aider à comprendre'],
+        'neural network': ['réseau de neurones', 'réseaux de neurones', 'réseau neuronal'],
+        'architecture': ['architecture']
+    },
+    'ar': {
+        'reference': ['مرجع'], 'paper': ['ورقة بحثية'], 'study': ['دراسة'], 'source': ['مصدر'],
+        'limitation': ['قيود'], 'simplified': ['مبسط'], 'note that': ['تجدر الإشارة'],
+        'should note': ['يجب أن أشير'], r'i should note': ['يجب أن أشير'],
+        'complex': ['معقد'], 'involves': ['يتضمن'],
+        r'let me explain': ['دعني أشرح'], r'would you like': ['هل تود'],
+        r'does this.*?help': ['هل يساعدك'],
+        r'for example|such as|like.*?sentence': ['على سبيل المثال'],
+        r'in other words': ['بعبارة أخرى'], r'this means': ['هذا يعني'], r'similar to': ['مشابه ل'],
+        r'to understand': ['لفهم'], 'neural network': ['شبكة عصبية'], 'architecture': ['بنية'],
+        r'\?': ['؟']
+    },
+    'hi': {
+        'reference': ['संदर्भ'], 'paper': ['शोध पत्र'], 'study': ['अध्ययन'], 'source': ['स्रोत'],
+        'limitation': ['सीमा'], 'simplified': ['सरलीकृत'], 'note that': ['ध्यान दें'],
+        'should note': ['मुझे ध्यान देना चाहिए'], r'i should note': ['मुझे ध्यान देना चाहिए'],
+        'complex': ['जटिल'], 'involves': ['शामिल'],
+        r'let me explain': ['मैं समझाता हूँ', 'मुझे समझाने दीजिए'], r'would you like': ['क्या आप चाहेंगे'],
+        r'does this.*?help': ['क्या इससे मदद'],
+        r'for example|such as|like.*?sentence': ['उदाहरण के लिए'],
+        r'in other words': ['दूसरे शब्दों में'], r'this means': ['इसका मतलब है'], r'similar to': ['के समान'],
+        r'to understand': ['समझने के लिए'], 'neural network': ['न्यूरल नेटवर्क', 'तंत्रिका नेटवर्क'],
+        'architecture': ['आर्किटेक्चर']
+    },
+    'zh': {
+        'reference': ['参考'], 'paper': ['论文'], 'study': ['研究'], 'source': ['来源'],
+        'limitation': ['局限'], 'simplified': ['简化'], 'note that': ['需要注意'],
+        'should note': ['我应该指出'], r'i should note': ['我应该指出'],
+        'complex': ['复杂'], 'involves': ['涉及'],
+        r'let me explain': ['让我解释'], r'would you like': ['你想', '您是否希望'],
+        r'does this.*?help': ['这有帮助吗', '对你有帮助吗'],
+        r'for example|such as|like.*?sentence': ['例如', '比如'],
+        r'in other words': ['换句话说'], r'this means': ['这意味着'], r'put simply': ['简单来说'],
+        r'similar to': ['类似于'], r'to understand': ['为了理解'],
+        'transformer': ['变换器'], 'neural network': ['神经网络'], 'architecture': ['架构'],
+        r'\?': ['？']
+    }
+}
+
+# Languages whose terms must start at a word boundary
+_WORD_START = {'es', 'fr'}
+
+_STOPWORDS = {
+    'en': {'the', 'and', 'is', 'of', 'to', 'this', 'that', 'it', 'with', 'you'},
+    'es': {'el', 'la', 'los', 'las', 'que', 'de', 'y', 'es', 'por', 'una', 'del', 'para'},
+    'fr': {'le', 'la', 'les', 'et', 'est', 'des', 'une', 'du', 'pour', 'que', 'dans', 'vous'}
+}
+_SCRIPT_LANGUAGES = (('ARABIC', 'ar'), ('DEVANAGARI', 'hi'), ('CJK', 'zh'))
+_WORD = re.compile(r'\w+')
+
+
+def detect_language(text: str, sample: int = 2000) -> str:
+    """Cheap language guess from the first ``sample`` characters (defaults to 'en')"""
+    head = text[:sample]
+    scripts = dict.fromkeys((lang for _, lang in _SCRIPT_LANGUAGES), 0)
+    letters = 0
+    for char in head:
+        if not char.isalpha():
+            continue
+        letters += 1
+        if char < '\u0600':  # below Arabic: Latin, Greek, Cyrillic
+            continue
+        name = unicodedata.name(char, '')
+        for prefix, lang in _SCRIPT_LANGUAGES:
+            if name.startswith(prefix):
+                scripts[lang] += 1
+                break
+    if letters:
+        lang, hits = max(scripts.items(), key=lambda item: item[1])
+        if hits * 3 >= letters:
+            return lang
+    words = _WORD.findall(head.casefold())
+    scores = {lang: sum(word in stopwords for word in words) for lang, stopwords in _STOPWORDS.items()}
+    best = max(scores, key=scores.get)
+    return best if scores[best] > scores['en'] else 'en'
+
+
+def _trie_pattern(terms: List[str]) -> str:
+    """Regex matching the longest of ``terms`` at a position, with shared prefixes factored"""
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def pattern(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return f'(?:{body})?'
+        return body
+
+    return pattern(trie)
+
+
+class TermAutomaton:
+    """One compiled matcher for a language's term table"""
+
+    def __init__(self, terms: Dict[str, List[int]], word_start: bool = False):
+        # Casefolded term -> spec feature indices
+        self.terms = {term.casefold(): indices for term, indices in terms.items()}
+        start = r'(?<!\w)' if word_start else ''
+        # Lookahead finds the longest term at every position, overlaps included
+        self.pattern = compile_pattern(f'(?=({start}{_trie_pattern(list(self.terms))}))')
+        # Shorter terms that are prefixes of a longer one (hidden by longest match)
+        self._prefixes = {term: [other for other in self.terms if other != term and term.startswith(other)]
+                          for term in self.terms}
+
+    def scan(self, text: str) -> Dict[int, int]:
+        """Feature index -> number of term occurrences in casefolded ``text``"""
+        counts: Dict[int, int] = {}
+        for match in self.pattern.finditer(text.casefold()):
+            term = match.group(1)
+            for found in [term] + self._prefixes[term]:
+                for index in self.terms[found]:
+                    counts[index] = counts.get(index, 0) + 1
+        return counts
+
+
+class MultilingualScorer:
+    """Scores responses with the spec plus the detected language's automaton"""
+
+    def __init__(self, variant: str = 'balanced', spec: Optional[ScoringSpec] = None,
+                 tables: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        self.spec = spec or get_spec(variant)
+        self.tables = TERM_TABLES if tables is None else tables
+        self._by_source: Dict[str, List[int]] = {}
+        for feature in self.spec.features:
+            self._by_source.setdefault(feature.source, []).append(feature.index)
+        self._automata: Dict[str, TermAutomaton] = {}
+
+    def automaton(self, language: str) -> TermAutomaton:
+        """Compiled automaton for a language (built on first use)"""
+        automaton = self._automata.get(language)
+        if automaton is None:
+            if language not in self.tables:
+                raise ValueError(f"No term table for language '{language}'. Available: {', '.join(self.tables)}")
+            terms: Dict[str, List[int]] = {}
+            for source, native_terms in self.tables[language].items():
+                indices = self._by_source.get(source)
+                if indices is None:
+                    raise ValueError(f"Term table '{language}' maps unknown feature {source!r}")
+                for term in native_terms:
+                    terms.setdefault(term, []).extend(indices)
+            automaton = self._automata[language] = TermAutomaton(terms, language in _WORD_START)
+        return automaton
+
+    def counts(self, content: str, language: Optional[str] = None) -> Tuple[str, List[int]]:
+        language = language or detect_language(content)
+        counts = self.spec.extract(content)
+        if language != 'en':
+            for index, hits in self.automaton(language).scan(content).items():
+                if self.spec.features[index].count:
+                    counts[index] += hits
+                else:
+                    counts[index] = 1
+        return language, counts
+
+    def score(self, content: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """Score one response; ``language`` skips detection when known"""
+        language, counts = self.counts(content, language)
+        results = self.spec.evaluate(counts)
+        results['language'] = language
+        return results
@@ -0,0 +1,275 @@
+"""
+Streaming Operationalization Metrics
+
+Online aggregation of SYMBI dimension scores over an unbounded stream of
+receipts. Every metric keeps O(1) state:
+
+- Welford running mean/variance over the whole stream
+- an exponentially decayed mean (half-life in seconds) for "live" values
+- a tumbling time window holding the current and last completed window
+
+All states can be serialised with ``to_dict`` and merged, so parallel workers
+can each consume part of the stream and a coordinator combines the partials.
+"""
+
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+# Receipt field -> operationalization metric
+METRIC_FIELDS = {
+    'reality_score': 'reality_index',
+    'trust_score': 'trust_protocol',
+    'ethics_score': 'ethical_alignment',
+    'resonance_score': 'resonance_quality',
+    'parity_score': 'canvas_parity'
+}
+
+
+def _to_epoch(timestamp: Union[None, int, float, str]) -> float:
+    """Normalise a receipt timestamp (epoch seconds or ISO 8601) to epoch seconds"""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+
+class WelfordAccumulator:
+    """Running count/mean/variance (Welford), mergeable with Chan's formula"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: 'WelfordAccumulator') -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, float]) -> 'WelfordAccumulator':
+        return cls(int(state['count']), state['mean'], state['m2'])
+
+
+class DecayedMean:
+    """Exponentially time-decayed mean; older observations fade with the half-life"""
+
+    __slots__ = ('half_life', 'weight', 'total', 'last_ts')
+
+    def __init__(self, half_life: float, weight: float = 0.0, total: float = 0.0,
+                 last_ts: Optional[float] = None):
+        self.half_life = half_life
+        self.weight = weight
+        self.total = total
+        self.last_ts = last_ts
+
+    def _decay_to(self, ts: float) -> None:
+        if self.last_ts is not None and ts > self.last_ts:
+            factor = 0.5 ** ((ts - self.last_ts) / self.half_life)
+            self.weight *= factor
+            self.total *= factor
+        if self.last_ts is None or ts > self.last_ts:
+            self.last_ts = ts
+
+    def update(self, value: float, ts: float) -> None:
+        # Late samples are decayed relative to the current reference time
+        if self.last_ts is not None and ts < self.last_ts:
+            factor = 0.5 ** ((self.last_ts - ts) / self.half_life)
+            self.weight += factor
+            self.total += value * factor
+            return
+        self._decay_to(ts)
+        self.weight += 1.0
+        self.total += value
+
+    def merge(self, other: 'DecayedMean') -> None:
+        if other.last_ts is None:
+            return
+        reference = other.last_ts if self.last_ts is None else max(self.last_ts, other.last_ts)
+        self._decay_to(reference)
+        factor = 0.5 ** ((reference - other.last_ts) / self.half_life)
+        self.weight += other.weight * factor
+        self.total += other.total * factor
+
+    @property
+    def value(self) -> float:
+        return self.total / self.weight if self.weight > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'half_life': self.half_life, 'weight': self.weight,
+                'total': self.total, 'last_ts': self.last_ts}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'DecayedMean':
+        return cls(state['half_life'], state['weight'], state['total'], state['last_ts'])
+
+
+class TumblingWindow:
+    """Fixed, non-overlapping time windows; keeps the open window and the last closed one"""
+
+    __slots__ = ('size', 'start', 'current', 'previous')
+
+    def __init__(self, size: float):
+        self.size = size
+        self.start: Optional[float] = None
+        self.current = WelfordAccumulator()
+        self.previous = WelfordAccumulator()
+
+    def _window_start(self, ts: float) -> float:
+        return math.floor(ts / self.size) * self.size
+
+    def update(self, value: float, ts: float) -> None:
+        start = self._window_start(ts)
+        if self.start is None or start > self.start:
+            if self.start is not None:
+                # Skipped windows are empty, so the previous window is only kept if adjacent
+                self.previous = self.current if start - self.start == self.size else WelfordAccumulator()
+            self.current = WelfordAccumulator()
+            self.start = start
+        elif start < self.start:
+            if start == self.start - self.size:
+                self.previous.update(value)
+            return  # samples older than the previous window are dropped
+        self.current.update(value)
+
+    def merge(self, other: 'TumblingWindow') -> None:
+        if other.start is None:
+            return
+        if self.start is None or other.start > self.start:
+            mine_current, mine_start = self.current, self.start
+            self.start = other.start
+            self.current = WelfordAccumulator.from_dict(other.current.to_dict())
+            self.previous = WelfordAccumulator.from_dict(other.previous.to_dict())
+            if mine_start == other.start - self.size:
+                self.previous.merge(mine_current)
+        elif other.start == self.start:
+            self.current.merge(other.current)
+            self.previous.merge(other.previous)
+        elif other.start == self.start - self.size:
+            self.previous.merge(other.current)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'size': self.size, 'start': self.start,
+                'current': self.current.to_dict(), 'previous': self.previous.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'TumblingWindow':
+        window = cls(state['size'])
+        window.start = state['start']
+        window.current = WelfordAccumulator.from_dict(state['current'])
+        window.previous = WelfordAccumulator.from_dict(state['previous'])
+        return window
+
+
+class MetricStream:
+    """All online statistics tracked for a single metric"""
+
+    def __init__(self, half_life: float = 3600.0, window: float = 300.0):
+        self.overall = WelfordAccumulator()
+        self.decayed = DecayedMean(half_life)
+        self.window = TumblingWindow(window)
+
+    def update(self, value: float, ts: float) -> None:
+        self.overall.update(value)
+        self.decayed.update(value, ts)
+        self.window.update(value, ts)
+
+    def merge(self, other: 'MetricStream') -> None:
+        self.overall.merge(other.overall)
+        self.decayed.merge(other.decayed)
+        self.window.merge(other.window)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.overall.count,
+            'mean': self.overall.mean,
+            'std': self.overall.std,
+            'decayed_mean': self.decayed.value,
+            'window_start': self.window.start,
+            'window_mean': self.window.current.mean,
+            'window_count': self.window.current.count,
+            'previous_window_mean': self.window.previous.mean
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'overall': self.overall.to_dict(), 'decayed': self.decayed.to_dict(),
+                'window': self.window.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'MetricStream':
+        stream = cls.__new__(cls)
+        stream.overall = WelfordAccumulator.from_dict(state['overall'])
+        stream.decayed = DecayedMean.from_dict(state['decayed'])
+        stream.window = TumblingWindow.from_dict(state['window'])
+        return stream
+
+
+class OperationalizationMetrics:
+    """Streaming operationalization metrics for the five SYMBI dimensions"""
+
+    def __init__(self, half_life: float = 3600.0, window: float = 300.0):
+        self.metrics = {name: MetricStream(half_life, window) for name in METRIC_FIELDS.values()}
+
+    def update(self, receipt: Dict[str, Any]) -> None:
+        """Consume one receipt (flat scores or a ``framework_output`` wrapper)"""
+        scores = receipt.get('framework_output', receipt)
+        ts = _to_epoch(receipt.get('timestamp', scores.get('timestamp')))
+        for field, name in METRIC_FIELDS.items():
+            value = scores.get(field)
+            if value is not None:
+                self.metrics[name].update(float(value), ts)
+
+    def merge(self, other: 'OperationalizationMetrics') -> 'OperationalizationMetrics':
+        """Fold another partial state into this one"""
+        for name, stream in other.metrics.items():
+            self.metrics[name].merge(stream)
+        return self
+
+    def snapshot(self, live: bool = False) -> Dict[str, float]:
+        """Current value per metric: stream mean, or the decayed mean when ``live``"""
+        result = {}
+        for name, stream in self.metrics.items():
+            value = stream.decayed.value if live else stream.overall.mean
+            result[name] = min(1.0, max(0.0, float(value)))
+        return result
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {name: stream.summary() for name, stream in self.metrics.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: stream.to_dict() for name, stream in self.metrics.items()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'OperationalizationMetrics':
+        metrics = cls.__new__(cls)
+        metrics.metrics = {name: MetricStream.from_dict(s) for name, s in state.items()}
+        return metrics
@@ -0,0 +1,433 @@
+"""
+Pattern Guard
+
+Protects scoring latency from hostile inputs in two ways:
+
+1. A static checker walks each regex's parse tree and estimates its
+   worst-case backtracking cost. Unanchored searches cost one scan per start
+   position, and every unbounded wildcard (``.*``, ``.*?``, ``[^x]+``) in a
+   sequence adds another factor of n, so ``first.*?second.*?third`` is
+   O(n^3). A leading unbounded repeat (``\\d+\\.``) is rescanned from every
+   start position inside its run, which adds a factor too. Nested unbounded
+   repeats (``(a+)+``) and alternatives under an unbounded repeat that can
+   start with the same character (``(a|aa)*b``, which the parser turns into
+   ``a(?:|a)``) are exponential: the same text splits into iterations in
+   many ways.
+   ``audit_variant`` runs the checker over every pattern a variant uses.
+
+2. ``GuardedScorer`` runs a variant under a per-document time budget.
+   Python's ``re`` cannot be interrupted mid-match, so risky patterns are
+   never run unbounded on inputs where they could stall: for large
+   documents, or once the budget is spent, they are replaced by a
+   bounded-cost approximation and the result is marked ``degraded``.
+   Large documents with lines longer than ``max_line`` also degrade the
+   quadratic patterns, which would otherwise scan each long line squared.
+
+The approximation works line by line, which is exact for patterns whose
+wildcards cannot cross newlines (``.`` without DOTALL):
+
+- literal chains (``a.*?b.*?c``) become ordered ``str.find`` calls, O(n)
+- other patterns run per line, limited to ``max_line`` characters per line
+"""
+
+import ast
+import inspect
+import logging
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre
+    import sre_parse as _sre_parse
+
+from .variants import DEFAULT_VARIANT, create_tester, get_tester
+
+logger = logging.getLogger(__name__)
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT) + tuple(
+    op for op in (getattr(_sre, 'POSSESSIVE_REPEAT', None),) if op is not None)
+_RE_FUNCTIONS = ('search', 'match', 'findall', 'finditer')
+_SINGLE = (_sre.LITERAL, _sre.NOT_LITERAL, _sre.ANY, _sre.IN)
+# Characters first-character sets are computed over (the detectors' patterns are ASCII)
+_ALPHABET = ''.join(map(chr, range(128)))
+_CATEGORIES = {
+    _sre.CATEGORY_DIGIT: r'\d', _sre.CATEGORY_NOT_DIGIT: r'\D', _sre.CATEGORY_SPACE: r'\s',
+    _sre.CATEGORY_NOT_SPACE: r'\S', _sre.CATEGORY_WORD: r'\w', _sre.CATEGORY_NOT_WORD: r'\W'
+}
+
+
+class PatternRisk:
+    """Static backtracking estimate for one pattern"""
+
+    def __init__(self, pattern: str, degree: int, exponential: bool, reasons: List[str]):
+        self.pattern = pattern
+        self.degree = degree
+        self.exponential = exponential
+        self.reasons = reasons
+
+    @property
+    def complexity(self) -> str:
+        return 'exponential' if self.exponential else f'O(n^{self.degree})'
+
+    def is_risky(self, max_degree: int = 2) -> bool:
+        return self.exponential or self.degree > max_degree
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'pattern': self.pattern, 'complexity': self.complexity,
+                'degree': self.degree, 'reasons': self.reasons}
+
+
+def _is_wildcard(body) -> bool:
+    """Single-item body matching (almost) any character"""
+    if len(body) != 1:
+        return False
+    op, av = body[0]
+    if op in (_sre.ANY, _sre.NOT_LITERAL):
+        return True
+    return op == _sre.IN and any(item[0] == _sre.NEGATE for item in av)
+
+
+def _has_unbounded(seq) -> bool:
+    for op, av in seq:
+        if op in _REPEATS and av[1] == _sre.MAXREPEAT:
+            return True
+        if op == _sre.SUBPATTERN and _has_unbounded(av[-1]):
+            return True
+        if op == _sre.BRANCH and any(_has_unbounded(branch) for branch in av[1]):
+            return True
+    return False
+
+
+def _chars(op, av) -> frozenset:
+    """Characters a single-character item matches"""
+    if op == _sre.LITERAL:
+        return frozenset(chr(av))
+    if op == _sre.NOT_LITERAL:
+        return frozenset(_ALPHABET) - {chr(av)}
+    if op == _sre.ANY:
+        return frozenset(_ALPHABET) - {'\n'}
+    chars, negate = set(), False
+    for item_op, item_av in av:
+        if item_op == _sre.NEGATE:
+            negate = True
+        elif item_op == _sre.LITERAL:
+            chars.add(chr(item_av))
+        elif item_op == _sre.RANGE:
+            chars.update(map(chr, range(item_av[0], item_av[1] + 1)))
+        elif item_op == _sre.CATEGORY and item_av in _CATEGORIES:
+            chars.update(re.findall(_CATEGORIES[item_av], _ALPHABET))
+        else:
+            chars.update(_ALPHABET)
+    return frozenset(_ALPHABET) - chars if negate else frozenset(chars)
+
+
+def _flatten(seq) -> list:
+    """Sequence with group bodies inlined (groups do not change what matches)"""
+    items = []
+    for op, av in seq:
+        if op == _sre.SUBPATTERN:
+            items.extend(_flatten(av[-1]))
+        else:
+            items.append((op, av))
+    return items
+
+
+def _first(seq) -> Tuple[frozenset, bool]:
+    """(characters a match of ``seq`` can start with, whether it can match empty)"""
+    first = frozenset()
+    for op, av in seq:
+        if op in _SINGLE:
+            return first | _chars(op, av), False
+        if op == _sre.SUBPATTERN:
+            chars, nullable = _first(av[-1])
+        elif op == _sre.BRANCH:
+            results = [_first(branch) for branch in av[1]]
+            chars = frozenset().union(*(chars for chars, _ in results))
+            nullable = any(flag for _, flag in results)
+        elif op in _REPEATS:
+            chars, nullable = _first(av[2])
+            nullable = nullable or av[0] == 0
+        elif op in (_sre.AT, _sre.ASSERT, _sre.ASSERT_NOT):
+            continue
+        else:
+            return frozenset(_ALPHABET), True
+        first |= chars
+        if not nullable:
+            return first, False
+    return first, True
+
+
+def _ambiguous(body) -> bool:
+    """Repeated ``body`` has alternatives that can start with the same character"""
+    items = _flatten(body)
+    restart, _ = _first(items)
+    for index, (op, av) in enumerate(items):
+        if op != _sre.BRANCH:
+            continue
+        rest = items[index + 1:]
+        starts = []
+        for branch in av[1]:
+            chars, nullable = _first(list(branch) + rest)
+            # An alternative that matches empty continues with the next iteration
+            starts.append(chars | restart if nullable else chars)
+        if any(a & b for i, a in enumerate(starts) for b in starts[i + 1:]):
+            return True
+    return False
+
+
+def _walk(seq, reasons: List[str]) -> Tuple[int, bool]:
+    """(unbounded wildcards along the worst path, nested unbounded repeat found)"""
+    wildcards, nested = 0, False
+    for op, av in seq:
+        if op in _REPEATS:
+            _, high, body = av
+            body_wildcards, body_nested = _walk(body, reasons)
+            nested |= body_nested
+            if high == _sre.MAXREPEAT:
+                if _has_unbounded(body):
+                    reasons.append('nested unbounded repeat')
+                    nested = True
+                elif _ambiguous(body):
+                    reasons.append('overlapping alternatives under unbounded repeat')
+                    nested = True
+                if _is_wildcard(body):
+                    wildcards += 1
+                    continue
+            wildcards += body_wildcards
+        elif op == _sre.SUBPATTERN:
+            body_wildcards, body_nested = _walk(av[-1], reasons)
+            wildcards += body_wildcards
+            nested |= body_nested
+        elif op == _sre.BRANCH:
+            results = [_walk(branch, reasons) for branch in av[1]]
+            wildcards += max(count for count, _ in results)
+            nested |= any(flag for _, flag in results)
+    return wildcards, nested
+
+
+@lru_cache(maxsize=4096)
+def analyze_pattern(pattern: str, flags: int = 0) -> PatternRisk:
+    """Estimate the worst-case cost of ``re.search(pattern, text)``"""
+    reasons: List[str] = []
+    parsed = _sre_parse.parse(pattern, flags)
+    wildcards, nested = _walk(parsed, reasons)
+    if wildcards > 1:
+        reasons.append(f'{wildcards} unbounded wildcards in sequence')
+    items = _flatten(parsed)
+    leading = 0
+    if items and items[0][0] in _REPEATS:
+        _, high, body = items[0][1]
+        if high == _sre.MAXREPEAT and not _is_wildcard(body):
+            reasons.append('leading unbounded repeat rescanned from every start')
+            leading = 1
+    # One factor for the unanchored start position plus one per wildcard or leading repeat
+    return PatternRisk(pattern, 1 + wildcards + leading, nested, reasons)
+
+
+@lru_cache(maxsize=4096)
+def literal_chains(pattern: str) -> Optional[List[List[str]]]:
+    """Split ``a.*?b|c.*d`` into literal chains ``[['a', 'b'], ['c', 'd']]``, or None"""
+    parsed = list(_sre_parse.parse(pattern))
+    branches = parsed[0][1][1] if len(parsed) == 1 and parsed[0][0] == _sre.BRANCH else [parsed]
+    chains = []
+    for branch in branches:
+        chain, current = [], []
+        for op, av in branch:
+            if op == _sre.LITERAL:
+                current.append(chr(av))
+            elif (op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT) and av[0] == 0 and av[1] == _sre.MAXREPEAT
+                  and list(av[2]) == [(_sre.ANY, None)]):
+                if current:
+                    chain.append(''.join(current))
+                current = []
+            else:
+                return None
+        if current:
+            chain.append(''.join(current))
+        if not chain:
+            return None
+        chains.append(chain)
+    return chains
+
+
+def _re_calls_in(function: ast.AST) -> List[str]:
+    """String patterns passed to ``re.<fn>`` in a function, resolving loop variables"""
+    assignments: Dict[str, ast.AST] = {}
+    for node in ast.walk(function):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            assignments[node.targets[0].id] = node.value
+
+    def constant(node):
+        if isinstance(node, ast.Tuple) and node.elts:
+            node = node.elts[0]
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return None
+
+    def is_re(node: ast.AST) -> bool:
+        # ``re.<fn>`` or the tester's injected matcher, ``self.re.<fn>``
+        if isinstance(node, ast.Name):
+            return node.id == 're'
+        return (isinstance(node, ast.Attribute) and node.attr == 're'
+                and isinstance(node.value, ast.Name) and node.value.id == 'self')
+
+    def re_call_args(scope: ast.AST) -> Iterator[ast.AST]:
+        for node in ast.walk(scope):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and is_re(node.func.value) and node.args):
+                yield node.args[0]
+
+    patterns = [constant(arg) for arg in re_call_args(function) if constant(arg) is not None]
+    # ``for pattern in table: re.search(pattern, ...)`` resolves to the table's literals
+    for node in ast.walk(function):
+        if not (isinstance(node, ast.For) and isinstance(node.iter, ast.Name)):
+            continue
+        target = node.target.elts[0] if isinstance(node.target, ast.Tuple) else node.target
+        table = assignments.get(node.iter.id)
+        if not (isinstance(target, ast.Name) and isinstance(table, (ast.List, ast.Tuple))):
+            continue
+        uses_target = any(isinstance(arg, ast.Name) and arg.id == target.id
+                          for statement in node.body for arg in re_call_args(statement))
+        if uses_target:
+            patterns.extend(p for p in map(constant, table.elts) if p is not None)
+    return patterns
+
+
+def variant_patterns(variant: str = DEFAULT_VARIANT) -> List[str]:
+    """Every regex pattern the variant's tester evaluates (from its source tables)"""
+    tester = get_tester(variant)
+    tree = ast.parse(inspect.getsource(sys.modules[type(tester).__module__]))
+    patterns: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == type(tester).__name__:
+            for function in node.body:
+                if isinstance(function, ast.FunctionDef):
+                    patterns.extend(_re_calls_in(function))
+    return list(dict.fromkeys(patterns))
+
+
+def audit_variant(variant: str = DEFAULT_VARIANT, max_degree: int = 2) -> List[PatternRisk]:
+    """Static check of a variant's pattern tables; returns the risky patterns"""
+    return [risk for risk in map(analyze_pattern, variant_patterns(variant))
+            if risk.is_risky(max_degree)]
+
+
+class _ApproximateMatch:
+    """Truthy match stand-in returned by the literal-chain approximation"""
+
+    def __init__(self, string: str, start: int, end: int):
+        self.string = string
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def group(self, index: int = 0) -> str:
+        return self.string[self._start:self._end]
+
+
+def _lines(text: str, max_line: int) -> Iterator[Tuple[int, int]]:
+    start = 0
+    while start <= len(text):
+        end = text.find('\n', start)
+        end = len(text) if end < 0 else end
+        yield start, min(end, start + max_line)
+        start = end + 1
+
+
+def _chain_search(chains: List[List[str]], text: str) -> Optional[_ApproximateMatch]:
+    for start, end in _lines(text, len(text) + 1):
+        for chain in chains:
+            position, first = start, None
+            for segment in chain:
+                index = text.find(segment, position, end)
+                if index < 0:
+                    break
+                first = index if first is None else first
+                position = index + len(segment)
+            else:
+                return _ApproximateMatch(text, first, position)
+    return None
+
+
+class _GuardedRe:
+    """Stand-in for ``re`` that routes risky patterns to bounded approximations"""
+
+    def __init__(self, scorer: 'GuardedScorer', text: str, deadline: float):
+        self._scorer = scorer
+        self._large = len(text) > scorer.safe_length
+        # Even quadratic patterns stall on a single very long line
+        self._long_lines = self._large and any(
+            end - start >= scorer.max_line for start, end in _lines(text, scorer.max_line))
+        self._deadline = deadline
+        self.degraded: List[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(re, name)
+        if name not in _RE_FUNCTIONS:
+            return attr
+
+        def guarded(pattern, string, flags=0):
+            key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+            risk = analyze_pattern(key, flags)
+            over_budget = time.perf_counter() > self._deadline
+            if not ((risk.is_risky(self._scorer.max_degree) and (self._large or over_budget))
+                    or ((over_budget or self._long_lines) and risk.degree > 1)):
+                return attr(pattern, string, flags)
+            self.degraded.append(key)
+            return self._approximate(name, key, flags, string)
+
+        return guarded
+
+    def _approximate(self, name: str, pattern: str, flags: int, string: str):
+        chains = literal_chains(pattern) if name == 'search' and not flags else None
+        if chains is not None:
+            return _chain_search(chains, string)
+        compiled = re.compile(pattern, flags)
+        max_line = self._scorer.max_line
+        if name in ('search', 'match'):
+            for start, end in _lines(string, max_line):
+                found = getattr(compiled, name)(string, start, end)
+                if found or name == 'match':
+                    return found
+            return None
+        matches = []
+        for start, end in _lines(string, max_line):
+            matches.extend(compiled.finditer(string, start, end) if name == 'finditer'
+                           else compiled.findall(string, start, end))
+        return iter(matches) if name == 'finditer' else matches
+
+
+class GuardedScorer:
+    """Scores a variant under a per-document time budget with degraded fallbacks"""
+
+    def __init__(self, variant: str = DEFAULT_VARIANT, budget: float = 0.05,
+                 safe_length: int = 20000, max_line: int = 2000, max_degree: int = 2):
+        self.variant = variant
+        self.budget = budget
+        self.safe_length = safe_length
+        self.max_line = max_line
+        self.max_degree = max_degree
+        self.risky_patterns = audit_variant(variant, max_degree)
+        for risk in self.risky_patterns:
+            logger.warning('Pattern %r in variant %s has %s backtracking risk (%s)',
+                           risk.pattern, variant, risk.complexity, '; '.join(risk.reasons))
+
+    def score(self, content: str) -> Dict[str, Any]:
+        """Score one response; ``degraded`` marks results that used approximations"""
+        start = time.perf_counter()
+        proxy = _GuardedRe(self, content, start + self.budget)
+        results = create_tester(self.variant, proxy).score_response(content)
+        results['degraded'] = bool(proxy.degraded)
+        results['degraded_patterns'] = list(dict.fromkeys(proxy.degraded))
+        results['elapsed'] = time.perf_counter() - start
+        return results
@@ -0,0 +1,234 @@
+"""
+Detector Profiling
+
+Opt-in instrumentation that attributes scoring time to dimensions and to
+the individual patterns and terms the detector variants evaluate. Nothing is
+patched unless a profile is running, so disabled profiling costs nothing.
+
+While profiling a call:
+
+- a private tester instance is created with a proxy for ``re`` that times
+  every ``search``/``findall``/``finditer``/``match``/``split``/``sub`` per
+  pattern, so shared testers and the tester modules are never touched
+- its dimension methods (``calculate_*`` / ``detect_*``) are wrapped to
+  maintain a call stack
+- the content is passed as a ``str`` subclass whose ``lower()`` and ``in``
+  checks are timed per term
+
+Each node records call count, cumulative seconds and (approximate) bytes
+scanned. Profiles merge across worker processes and export as JSON or as
+collapsed stacks (``frame;frame;frame value``) for flame graph tools.
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .variants import DEFAULT_VARIANT, VARIANTS, create_tester
+
+_INSTRUMENTED_PREFIXES = ('calculate_', 'detect_')
+_RE_FUNCTIONS = ('search', 'match', 'fullmatch', 'findall', 'finditer', 'split', 'sub')
+
+Path = Tuple[str, ...]
+
+
+class _ProfiledText(str):
+    """Content whose lowercase copies and substring checks report to the profiler"""
+
+    def lower(self) -> '_ProfiledText':
+        start = time.perf_counter()
+        text = _ProfiledText(str.lower(self))
+        self._profiler.record('str:lower', time.perf_counter() - start, len(self))
+        text._profiler = self._profiler
+        return text
+
+    def __contains__(self, item: str) -> bool:
+        start = time.perf_counter()
+        found = str.__contains__(self, item)
+        elapsed = time.perf_counter() - start
+        scanned = str.find(self, item) + len(item) if found else len(self)
+        self._profiler.record(f'term:{item}', elapsed, scanned)
+        return found
+
+
+class _ProfiledRe:
+    """Stand-in for the ``re`` module that times calls per pattern"""
+
+    def __init__(self, profiler: 'Profiler'):
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(re, name)
+        if name not in _RE_FUNCTIONS:
+            return attr
+
+        def timed(pattern, string, *args, **kwargs):
+            start = time.perf_counter()
+            result = attr(pattern, string, *args, **kwargs)
+            if name == 'finditer':
+                result = iter(list(result))
+            elapsed = time.perf_counter() - start
+            if name in ('search', 'match', 'fullmatch') and result is not None:
+                scanned = result.end()
+            else:
+                scanned = len(string)
+            key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+            self._profiler.record(f're:{key}', elapsed, scanned)
+            return result
+
+        return timed
+
+
+def _dimension_name(method_name: str, variant: str) -> str:
+    for prefix in _INSTRUMENTED_PREFIXES:
+        if method_name.startswith(prefix):
+            method_name = method_name[len(prefix):]
+            break
+    suffix = f'_{variant}'
+    return method_name[:-len(suffix)] if method_name.endswith(suffix) else method_name
+
+
+class Profiler:
+    """Collects per-dimension and per-pattern statistics for detector runs"""
+
+    def __init__(self):
+        # path -> [calls, seconds, bytes]
+        self.nodes: Dict[Path, List[float]] = {}
+        self._stack: List[str] = []
+
+    def record(self, frame: str, seconds: float, scanned: int = 0) -> None:
+        path = tuple(self._stack) + (frame,)
+        node = self.nodes.get(path)
+        if node is None:
+            node = self.nodes[path] = [0, 0.0, 0]
+        node[0] += 1
+        node[1] += seconds
+        node[2] += scanned
+
+    @contextmanager
+    def _frame(self, frame: str) -> Iterator[None]:
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            self.record(frame, elapsed)
+
+    def _wrap_method(self, method, frame: str):
+        def wrapper(*args, **kwargs):
+            with self._frame(frame):
+                return method(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def instrument(self, tester, variant: str) -> Iterator[None]:
+        """Wrap one tester instance's dimension methods for the duration of the block"""
+        wrapped = []
+        for name in dir(type(tester)):
+            if name.startswith(_INSTRUMENTED_PREFIXES):
+                setattr(tester, name, self._wrap_method(getattr(tester, name),
+                                                        _dimension_name(name, variant)))
+                wrapped.append(name)
+        try:
+            yield
+        finally:
+            for name in wrapped:
+                delattr(tester, name)
+
+    def score(self, content: str, variant: str = DEFAULT_VARIANT) -> Dict[str, Any]:
+        """Score one response with instrumentation enabled"""
+        tester = create_tester(variant, _ProfiledRe(self))
+        text = _ProfiledText(content)
+        text._profiler = self
+        with self.instrument(tester, variant), self._frame(variant):
+            return tester.score_response(text)
+
+    def merge(self, other: 'Profiler') -> 'Profiler':
+        for path, (calls, seconds, scanned) in other.nodes.items():
+            node = self.nodes.setdefault(path, [0, 0.0, 0])
+            node[0] += calls
+            node[1] += seconds
+            node[2] += scanned
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'nodes': [
+                {'path': list(path), 'calls': calls, 'seconds': seconds, 'bytes': scanned}
+                for path, (calls, seconds, scanned) in sorted(self.nodes.items())
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'Profiler':
+        profiler = cls()
+        for node in state['nodes']:
+            profiler.nodes[tuple(node['path'])] = [node['calls'], node['seconds'], node['bytes']]
+        return profiler
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def top(self, n: int = 10, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most expensive leaves (``kind`` = 're' or 'term'), aggregated over call paths"""
+        totals: Dict[str, List[float]] = {}
+        for path, (calls, seconds, scanned) in self.nodes.items():
+            leaf = path[-1]
+            if ':' not in leaf or (kind is not None and not leaf.startswith(kind + ':')):
+                continue
+            total = totals.setdefault(leaf, [0, 0.0, 0])
+            total[0] += calls
+            total[1] += seconds
+            total[2] += scanned
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:n]
+        return [{'frame': leaf, 'calls': calls, 'seconds': seconds, 'bytes': scanned}
+                for leaf, (calls, seconds, scanned) in ranked]
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks with self time in microseconds (flamegraph.pl / speedscope)"""
+        child_time: Dict[Path, float] = {}
+        for path, node in self.nodes.items():
+            if len(path) > 1:
+                child_time[path[:-1]] = child_time.get(path[:-1], 0.0) + node[1]
+        lines = []
+        for path, node in sorted(self.nodes.items()):
+            self_time = max(0.0, node[1] - child_time.get(path, 0.0))
+            micros = int(round(self_time * 1e6))
+            if micros:
+                frames = [frame.replace(';', ':').replace(' ', '_') for frame in path]
+                lines.append(f"{';'.join(frames)} {micros}")
+        return '\n'.join(lines)
+
+
+def _profile_batch(contents: List[str], variant: str) -> Dict[str, Any]:
+    """Worker entry point: profile a batch and return the serialised profile"""
+    profiler = Profiler()
+    for content in contents:
+        profiler.score(content, variant)
+    return profiler.to_dict()
+
+
+def profile_contents(contents: List[str], variant: str = DEFAULT_VARIANT,
+                     workers: Optional[int] = None, batch_size: int = 64) -> Profiler:
+    """Profile many responses, merging the per-worker profiles"""
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}'. Available: {', '.join(VARIANTS)}")
+    workers = workers or os.cpu_count() or 1
+    batches = [contents[i:i + batch_size] for i in range(0, len(contents), batch_size)]
+    profile_batch = partial(_profile_batch, variant=variant)
+    if workers == 1 or len(batches) <= 1:
+        states = map(profile_batch, batches)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            states = list(pool.map(profile_batch, batches))
+    profiler = Profiler()
+    for state in states:
+        profiler.merge(Profiler.from_dict(state))
+    return profiler
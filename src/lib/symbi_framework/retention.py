@@ -0,0 +1,274 @@
+"""
+Retention Enforcement
+
+Enforces ``scope.max_retention_days`` of Context Bridge tickets without
+scanning the whole store. Tickets are appended to fixed-size segments and
+indexed by expiry time in coarse buckets (a time wheel), so a sweep only
+visits buckets that have come due:
+
+- a segment whose tickets have all expired is dropped in one step
+- a partially expired segment is queued for compaction once it is sealed
+  (at the sweep, or when it seals later), which rewrites it without the
+  expired tickets under a token-bucket rate limit, either inline
+  (``compact``) or from a ``CompactionWorker`` thread. A segment larger than
+  the bucket is still charged in full: the bucket goes into debt and later
+  rewrites wait until it has refilled
+
+The ``on_drop`` / ``on_compact`` hooks let a backing store (e.g. one audit
+bundle file per segment) mirror the segment lifecycle.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .operational_metrics import _to_epoch
+
+SECONDS_PER_DAY = 86400
+
+
+class TokenBucket:
+    """Token-bucket rate limiter (tokens per second, with a burst capacity)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return self.tokens
+
+    def consume(self, amount: float, now: Optional[float] = None, allow_debt: bool = False) -> bool:
+        """Take ``amount`` tokens; with ``allow_debt``, a full bucket covers any amount and goes negative"""
+        if self.refill(now) >= (min(amount, self.capacity) if allow_debt else amount):
+            self.tokens -= amount
+            return True
+        return False
+
+
+class Segment:
+    """Append-only group of tickets; expired tickets are tombstoned until compaction"""
+
+    __slots__ = ('segment_id', 'records', 'tombstones', 'sealed')
+
+    def __init__(self, segment_id: int):
+        self.segment_id = segment_id
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.tombstones: Set[str] = set()
+        self.sealed = False
+
+    @property
+    def live(self) -> int:
+        return len(self.records) - len(self.tombstones)
+
+
+class SweepResult:
+    """Outcome of a retention sweep"""
+
+    def __init__(self):
+        self.expired: List[str] = []
+        self.dropped_segments: List[int] = []
+        self.queued_segments: List[int] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'expired': len(self.expired),
+            'dropped_segments': self.dropped_segments,
+            'queued_segments': self.queued_segments
+        }
+
+
+class RetentionStore:
+    """Ticket store with bucketed expiry index and segment-level bulk deletion"""
+
+    def __init__(self, segment_size: int = 1024, bucket_seconds: int = 3600,
+                 compaction_threshold: float = 0.25, compaction_rate: float = 10000.0,
+                 default_retention_days: Optional[float] = None,
+                 on_drop: Optional[Callable[[int], None]] = None,
+                 on_compact: Optional[Callable[[int, List[str]], None]] = None):
+        self.segment_size = segment_size
+        self.bucket_seconds = bucket_seconds
+        self.compaction_threshold = compaction_threshold
+        self.default_retention_days = default_retention_days
+        self.on_drop = on_drop
+        self.on_compact = on_compact
+        self.limiter = TokenBucket(compaction_rate)
+
+        self._lock = threading.RLock()
+        self._segments: Dict[int, Segment] = {}
+        self._open: Optional[Segment] = None
+        self._next_segment = 0
+        self._location: Dict[str, Tuple[int, float]] = {}  # ticket id -> (segment, expires_at)
+        self._buckets: Dict[int, List[Tuple[float, int, str]]] = {}
+        self._bucket_heap: List[int] = []
+        self._compaction_queue: Deque[int] = deque()
+        self._queued: Set[int] = set()
+
+    def _expiry_for(self, ticket: Dict[str, Any], issued_at: Optional[float]) -> Optional[float]:
+        if issued_at is None:
+            log = ticket.get('transparency_log') or []
+            issued_at = _to_epoch(log[0].get('when')) if log else time.time()
+        days = ticket.get('scope', {}).get('max_retention_days', self.default_retention_days)
+        if days is None:
+            return None
+        return issued_at + float(days) * SECONDS_PER_DAY
+
+    def add(self, ticket_id: str, ticket: Dict[str, Any],
+            issued_at: Optional[float] = None) -> Optional[float]:
+        """Store a ticket and index its expiry; returns the expiry time (None = never)"""
+        expires_at = self._expiry_for(ticket, issued_at)
+        with self._lock:
+            if ticket_id in self._location:
+                raise ValueError(f'Duplicate ticket id: {ticket_id}')
+            if self._open is None or len(self._open.records) >= self.segment_size:
+                if self._open is not None:
+                    self._open.sealed = True
+                    # Tickets expired while it was open did not queue it
+                    self._queue_compaction(self._open)
+                self._open = Segment(self._next_segment)
+                self._segments[self._next_segment] = self._open
+                self._next_segment += 1
+            segment = self._open
+            segment.records[ticket_id] = ticket
+            self._location[ticket_id] = (segment.segment_id, expires_at)
+
+            if expires_at is not None:
+                key = int(expires_at // self.bucket_seconds)
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = []
+                    heapq.heappush(self._bucket_heap, key)
+                bucket.append((expires_at, segment.segment_id, ticket_id))
+        return expires_at
+
+    def get(self, ticket_id: str) -> Dict[str, Any]:
+        with self._lock:
+            segment_id, _ = self._location[ticket_id]
+            return self._segments[segment_id].records[ticket_id]
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._location
+
+    def __len__(self) -> int:
+        return len(self._location)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def sweep(self, now: Optional[float] = None) -> SweepResult:
+        """Expire due tickets; cost is proportional to the buckets that came due"""
+        now = time.time() if now is None else now
+        current_key = int(now // self.bucket_seconds)
+        result = SweepResult()
+        touched: Set[int] = set()
+
+        with self._lock:
+            while self._bucket_heap and self._bucket_heap[0] <= current_key:
+                key = self._bucket_heap[0]
+                bucket = self._buckets[key]
+                if key < current_key:
+                    due, remaining = bucket, []
+                else:
+                    # Only the current bucket needs per-entry comparison
+                    due = [entry for entry in bucket if entry[0] <= now]
+                    remaining = [entry for entry in bucket if entry[0] > now]
+                for _, segment_id, ticket_id in due:
+                    if self._location.pop(ticket_id, None) is None:
+                        continue
+                    self._segments[segment_id].tombstones.add(ticket_id)
+                    touched.add(segment_id)
+                    result.expired.append(ticket_id)
+                if remaining:
+                    self._buckets[key] = remaining
+                    break
+                heapq.heappop(self._bucket_heap)
+                del self._buckets[key]
+
+            for segment_id in sorted(touched):
+                segment = self._segments[segment_id]
+                if segment.live == 0:
+                    self._drop_segment(segment)
+                    result.dropped_segments.append(segment_id)
+                elif self._queue_compaction(segment):
+                    result.queued_segments.append(segment_id)
+        return result
+
+    def _queue_compaction(self, segment: Segment) -> bool:
+        """Queue a sealed segment whose tombstones reach the threshold; True if newly queued"""
+        if (segment.sealed and segment.tombstones and segment.segment_id not in self._queued
+                and len(segment.tombstones) >= self.compaction_threshold * len(segment.records)):
+            self._compaction_queue.append(segment.segment_id)
+            self._queued.add(segment.segment_id)
+            return True
+        return False
+
+    def _drop_segment(self, segment: Segment) -> None:
+        del self._segments[segment.segment_id]
+        self._queued.discard(segment.segment_id)
+        if segment is self._open:
+            self._open = None
+        if self.on_drop:
+            self.on_drop(segment.segment_id)
+
+    def compact(self, max_segments: Optional[int] = None, now: Optional[float] = None) -> int:
+        """Rewrite queued segments without their tombstones, within the rate limit"""
+        compacted = 0
+        with self._lock:
+            while self._compaction_queue and (max_segments is None or compacted < max_segments):
+                segment_id = self._compaction_queue[0]
+                segment = self._segments.get(segment_id)
+                if segment is None:
+                    self._compaction_queue.popleft()
+                    continue
+                if not self.limiter.consume(len(segment.records), now, allow_debt=True):
+                    break
+                self._compaction_queue.popleft()
+                self._queued.discard(segment_id)
+                segment.records = {
+                    ticket_id: ticket for ticket_id, ticket in segment.records.items()
+                    if ticket_id not in segment.tombstones
+                }
+                segment.tombstones = set()
+                compacted += 1
+                if self.on_compact:
+                    self.on_compact(segment_id, list(segment.records))
+        return compacted
+
+    @property
+    def pending_compactions(self) -> int:
+        return len(self._compaction_queue)
+
+
+class CompactionWorker:
+    """Background thread that periodically sweeps and compacts a RetentionStore"""
+
+    def __init__(self, store: RetentionStore, interval: float = 60.0):
+        self.store = store
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.store.sweep()
+            self.store.compact()
+            self._stop.wait(self.interval)
+
+    def start(self) -> 'CompactionWorker':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='retention-compaction', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,436 @@
+"""
+Scoring Specs
+
+Declarative form of a detector variant: a table of features (regex searches,
+regex match counts and substring terms), additive rules that turn feature
+counts into component scores, and a ``finalize`` step that rounds, clamps and
+combines components into the same result dict the tester returns.
+
+Splitting scoring into "extract feature counts" and "evaluate rules" lets
+feature extraction change strategy (windowed, sampled, bytes-level) without
+touching the scoring logic. ``extract_bytes`` serves only callers that
+already hold bytes (``LargeDocumentScorer`` windows, memory-mapped files):
+ASCII windows are matched with bytes-compiled patterns instead of being
+decoded, at the cost of one ``bytes.lower()`` copy per window. ``str`` input
+(testers, CLI, evaluation) stays on ``str.lower()`` and ``str`` patterns;
+routing it through bytes measured within 2% on sample-sized responses while
+doubling peak memory (encode plus lower), so it is not done.
+
+``BALANCED_SPEC`` mirrors ``BalancedSymbiFrameworkTester`` rule for rule, in
+the same order, so float accumulation and therefore rounding match exactly;
+``BALANCED_TESTER_DIGEST`` pins the tester source it was transcribed from,
+and a test fails when the two drift apart.
+
+A spec's ``version`` is derived from its feature and rule tables and the
+source of its ``finalize`` module, so caches and goldens keyed on it notice
+rule edits.
+"""
+
+import inspect
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .artifacts import compile_pattern
+
+# SHA-256 of the ``BalancedSymbiFrameworkTester`` class source that BALANCED_SPEC mirrors
+BALANCED_TESTER_DIGEST = '2655b14db40dd4cf621be72b28519df594db265a824071738202f172d1cbaf56'
+
+# Feature kinds and the text they run against
+REGEX, TERM = 'regex', 'term'
+LOWER, RAW = 'lower', 'raw'
+
+# ASCII code points that ``str`` patterns treat as whitespace but bytes patterns do not
+_UNIT_SEPARATORS = re.compile(rb'[\x1c-\x1f]')
+
+# Rule modes
+PRESENT = 'present'      # weight if count >= 1
+PER_COUNT = 'per_count'  # weight * count if count >= min_count, capped at ``cap``
+THRESHOLD = 'threshold'  # weight if count >= min_count
+
+
+class Feature:
+    """One thing to look for in a document"""
+
+    __slots__ = ('index', 'kind', 'source', 'target', 'count', '_compiled', '_compiled_bytes', '_needle')
+
+    def __init__(self, index: int, kind: str, source: str, target: str, count: bool):
+        self.index = index
+        self.kind = kind
+        self.source = source
+        self.target = target
+        self.count = count
+        self._compiled = None
+        self._compiled_bytes = None
+        self._needle = None
+
+    @property
+    def compiled(self) -> 're.Pattern':
+        if self._compiled is None:
+            self._compiled = compile_pattern(self.source)
+        return self._compiled
+
+    @property
+    def compiled_bytes(self) -> Optional['re.Pattern']:
+        """The pattern compiled for bytes, or None when its source is not ASCII"""
+        if self._compiled_bytes is None:
+            self._compiled_bytes = compile_pattern(self.source.encode('ascii')) if self.source.isascii() else False
+        return self._compiled_bytes or None
+
+    @property
+    def needle(self) -> bytes:
+        """UTF-8 form of a term (a non-ASCII term never occurs in ASCII bytes)"""
+        if self._needle is None:
+            self._needle = self.source.encode('utf-8')
+        return self._needle
+
+    @property
+    def key(self) -> str:
+        return f'{self.kind}:{self.target}:{self.source}'
+
+
+def ascii_safe(data: bytes) -> bool:
+    """Whether bytes patterns match ``data`` exactly as ``str`` patterns match its text
+
+    True for ASCII without the \\x1c-\\x1f separators (whitespace only to ``str`` patterns).
+    """
+    return data.isascii() and not _UNIT_SEPARATORS.search(data)
+
+
+Text = Any  # str, or bytes accepted by ``ascii_safe``
+
+
+def feature_operand(feature: Feature, raw: Text, lower: Text) -> Tuple[Text, Any]:
+    """The text a feature runs against and its needle or pattern, of the same type"""
+    text = lower if feature.target == LOWER else raw
+    if not isinstance(text, bytes):
+        return text, feature.source if feature.kind == TERM else feature.compiled
+    if feature.kind == TERM:
+        return text, feature.needle
+    pattern = feature.compiled_bytes
+    if pattern is None:
+        return text.decode('ascii'), feature.compiled
+    return text, pattern
+
+
+def count_feature(feature: Feature, raw: Text, lower: Text) -> int:
+    """A feature's count (presence features count 0 or 1)"""
+    text, matcher = feature_operand(feature, raw, lower)
+    if feature.kind == TERM:
+        return 1 if matcher in text else 0
+    if feature.count:
+        return len(matcher.findall(text))
+    return 1 if matcher.search(text) else 0
+
+
+def feature_spans(feature: Feature, raw: Text, lower: Text) -> List[Tuple[int, int]]:
+    """The matches ``count_feature`` counts: all of a count feature's, the first otherwise"""
+    text, matcher = feature_operand(feature, raw, lower)
+    if feature.kind == TERM:
+        position = text.find(matcher)
+        return [(position, position + len(matcher))] if position >= 0 else []
+    if feature.count:
+        return [match.span() for match in matcher.finditer(text)]
+    match = matcher.search(text)
+    return [match.span()] if match else []
+
+
+class Rule:
+    """Contribution of one feature to one component (``group`` labels related rules)"""
+
+    __slots__ = ('feature', 'weight', 'mode', 'min_count', 'cap', 'group')
+
+    def __init__(self, feature: int, weight: float, mode: str = PRESENT,
+                 min_count: int = 1, cap: Optional[float] = None, group: Optional[str] = None):
+        self.feature = feature
+        self.weight = weight
+        self.mode = mode
+        self.min_count = min_count
+        self.cap = cap
+        self.group = group
+
+    def contribution(self, count: int) -> float:
+        if count < self.min_count:
+            return 0
+        if self.mode == PER_COUNT:
+            value = count * self.weight
+            return value if self.cap is None else min(value, self.cap)
+        return self.weight
+
+
+class Component:
+    """Base score plus rule contributions, clamped to [low, high]"""
+
+    __slots__ = ('name', 'base', 'rules', 'low', 'high')
+
+    def __init__(self, name: str, base: float, rules: List[Rule],
+                 low: Optional[float] = None, high: Optional[float] = None):
+        self.name = name
+        self.base = base
+        self.rules = rules
+        self.low = low
+        self.high = high
+
+    def clamp(self, value: float) -> float:
+        if self.high is not None:
+            value = min(self.high, value)
+        if self.low is not None:
+            value = max(self.low, value)
+        return value
+
+    def value(self, counts: List[int]) -> float:
+        score = self.base
+        for rule in self.rules:
+            score += rule.contribution(counts[rule.feature])
+        return self.clamp(score)
+
+
+class ScoringSpec:
+    """Features, per-dimension components and the variant's finalize step"""
+
+    def __init__(self, name: str, features: List[Feature],
+                 dimensions: Dict[str, List[Component]],
+                 finalize: Callable[[Dict[str, Dict[str, float]]], Dict[str, Any]]):
+        self.name = name
+        self.features = features
+        self.dimensions = dimensions
+        self.finalize = finalize
+        self._version: Optional[str] = None
+
+    @property
+    def version(self) -> str:
+        """``name/digest`` of the feature and rule tables and the finalize module source"""
+        if self._version is None:
+            import hashlib  # Deferred: loading OpenSSL costs more than a warm artifact load
+
+            table = {
+                'features': [[f.kind, f.target, f.source, f.count] for f in self.features],
+                'dimensions': {dimension: [[c.name, c.base, c.low, c.high,
+                                            [[r.feature, r.weight, r.mode, r.min_count, r.cap, r.group]
+                                             for r in c.rules]] for c in components]
+                               for dimension, components in self.dimensions.items()}
+            }
+            digest = hashlib.sha256(json.dumps(table, sort_keys=True).encode('utf-8'))
+            try:
+                digest.update(inspect.getsource(inspect.getmodule(self.finalize)).encode('utf-8'))
+            except (OSError, TypeError):
+                digest.update(self.finalize.__qualname__.encode('utf-8'))
+            self._version = f'{self.name}/{digest.hexdigest()[:12]}'
+        return self._version
+
+    def extract(self, content: str, features: Optional[List[Feature]] = None) -> List[int]:
+        """Feature counts for one document (presence features count 0 or 1)
+
+        ``features`` restricts extraction to a subset; counts follow its order.
+        """
+        content_lower = content.lower()
+        return [count_feature(feature, content, content_lower)
+                for feature in (self.features if features is None else features)]
+
+    def extract_bytes(self, data: bytes, features: Optional[List[Feature]] = None) -> List[int]:
+        """``extract`` for bytes accepted by ``ascii_safe``, without decoding
+
+        For callers that already hold bytes; lowercase features still cost one
+        ``bytes.lower()`` copy of ``data``.
+        """
+        features = self.features if features is None else features
+        lower = data.lower() if any(feature.target == LOWER for feature in features) else data
+        return [count_feature(feature, data, lower) for feature in features]
+
+    def score(self, content: str) -> Dict[str, Any]:
+        return self.evaluate(self.extract(content))
+
+    def component_values(self, counts: List[int]) -> Dict[str, Dict[str, float]]:
+        values = {}
+        for dimension, components in self.dimensions.items():
+            values[dimension] = {}
+            for component in components:
+                values[dimension][component.name] = component.value(counts)
+        return values
+
+    def component(self, dimension: str, name: str) -> Component:
+        for component in self.dimensions[dimension]:
+            if component.name == name:
+                return component
+        raise KeyError(f'{dimension}.{name}')
+
+    def evaluate(self, counts: List[int]) -> Dict[str, Any]:
+        """Score from feature counts (the tester's ``score_response`` shape)"""
+        return self.finalize(self.component_values(counts))
+
+
+class SpecBuilder:
+    """Collects de-duplicated features while rule tables are declared"""
+
+    def __init__(self):
+        self.features: List[Feature] = []
+        self._index: Dict[Tuple[str, str, str], int] = {}
+
+    def _feature(self, kind: str, source: str, target: str, count: bool) -> int:
+        key = (kind, source, target)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.features)
+            self.features.append(Feature(index, kind, source, target, count))
+        elif count:
+            self.features[index].count = True
+        return index
+
+    def patterns(self, patterns: List[str], weight: float, target: str = LOWER,
+                 group: Optional[str] = None) -> List[Rule]:
+        return [Rule(self._feature(REGEX, p, target, False), weight, group=group) for p in patterns]
+
+    def terms(self, terms: List[str], weight: float, group: Optional[str] = None) -> List[Rule]:
+        return [Rule(self._feature(TERM, t, LOWER, False), weight, group=group) for t in terms]
+
+    def counted(self, pattern: str, weight: float, mode: str = PER_COUNT, target: str = RAW,
+                min_count: int = 1, cap: Optional[float] = None, group: Optional[str] = None) -> List[Rule]:
+        return [Rule(self._feature(REGEX, pattern, target, True), weight, mode, min_count, cap, group)]
+
+
+def _status(count: float) -> str:
+    # The balanced thresholds: any evidence passes, otherwise partial
+    return 'PASS' if count >= 1 else 'PARTIAL'
+
+
+def _finalize_balanced(values: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    reality = values['reality_index']
+    base_score = (reality['mission_alignment'] + reality['contextual_coherence']
+                  + reality['technical_accuracy'] + reality['authenticity']) / 4
+    calibration_adjustment = 0.8
+    reality_overall = min(10.0, base_score + reality['emergence_bonus'] + calibration_adjustment)
+    reality_index = {
+        'overall': round(reality_overall, 1),
+        'mission_alignment': round(reality['mission_alignment'], 1),
+        'contextual_coherence': round(reality['contextual_coherence'], 1),
+        'technical_accuracy': round(reality['technical_accuracy'], 1),
+        'authenticity': round(reality['authenticity'], 1),
+        'emergence_bonus': round(reality['emergence_bonus'], 2),
+        'calibration_adjustment': calibration_adjustment
+    }
+
+    trust = values['trust_protocol']
+    statuses = [_status(trust['verification_methods']), _status(trust['boundary_maintenance']),
+                _status(trust['security_awareness'])]
+    if statuses.count('FAIL') > 0:
+        trust_overall = 'FAIL'
+    elif statuses.count('PASS') >= 2:
+        trust_overall = 'PASS'
+    else:
+        trust_overall = 'PARTIAL'
+    trust_protocol = {
+        'overall': trust_overall,
+        'verification_methods': statuses[0],
+        'boundary_maintenance': statuses[1],
+        'security_awareness': statuses[2]
+    }
+
+    canvas = values['canvas_parity']
+    canvas_base = round((canvas['human_agency'] + canvas['ai_contribution']
+                         + canvas['transparency'] + canvas['collaboration_quality']) / 4)
+    canvas_adjustment = 5
+    canvas_parity = {
+        'overall': min(100, canvas_base + canvas_adjustment),
+        'human_agency': canvas['human_agency'],
+        'ai_contribution': canvas['ai_contribution'],
+        'transparency': canvas['transparency'],
+        'collaboration_quality': canvas['collaboration_quality'],
+        'calibration_adjustment': canvas_adjustment
+    }
+
+    trust_score = 100 if trust_overall == 'PASS' else 60 if trust_overall == 'PARTIAL' else 20
+    weighted_score = (reality_index['overall'] * 10 * 0.4) + (trust_score * 0.2) + (canvas_parity['overall'] * 0.4)
+    return {
+        'overall_score': round(min(100, weighted_score)),
+        'reality_index': reality_index,
+        'trust_protocol': trust_protocol,
+        'canvas_parity': canvas_parity
+    }
+
+
+def _build_balanced() -> ScoringSpec:
+    b = SpecBuilder()
+    reality = [
+        Component('mission_alignment', 5.5,
+                  b.patterns([r'let me explain', r'i\'ll explain', r'here\'s how', r'to understand'], 0.6)
+                  + b.patterns([r'explain.*?in simple terms', r'help.*?understand', r'break.*?down'], 0.8),
+                  high=10.0),
+        Component('contextual_coherence', 5.5,
+                  b.patterns([r'first.*?second.*?third', r'at their core', r'the key.*?include',
+                              r'this is where', r'why.*?important'], 0.6)
+                  + b.counted(r'##\s+', 0.25, min_count=2)
+                  + b.patterns([r'for example|such as|like.*?sentence'], 0.8),
+                  high=10.0),
+        Component('technical_accuracy', 5.5,
+                  b.terms(['self-attention', 'multi-head', 'positional encoding',
+                           'transformer', 'neural network', 'architecture'], 0.4)
+                  + b.patterns([r'attention.*?mechanism.*?allows'], 0.8)
+                  + b.patterns([r'parallel.*?processing'], 0.6)
+                  + b.patterns([r'vaswani.*?et al|attention is all you need|2017'], 1.2),
+                  high=10.0),
+        Component('authenticity', 6.0,
+                  b.patterns([r'i should note', r'let me', r'i\'ll', r'myself \(claude\)'], 0.6)
+                  + b.patterns([r'does this.*?help'], 0.8)
+                  + b.patterns([r'would you like'], 0.6)
+                  + b.terms(['at the end of the day', 'best practices', 'going forward',
+                             'state-of-the-art', 'cutting-edge'], -0.8),
+                  low=0.0, high=10.0),
+        Component('emergence_bonus', 0,
+                  b.patterns([r'like.*?(?:party|conversation|brain|imagine)', r'think of.*?as',
+                              r'similar to', r'imagine.*?you'], 0.2, group='analogy')
+                  + b.counted(r'##\s+', 0.15, THRESHOLD, min_count=3, group='structure')
+                  + b.counted(r'\*\*.*?\*\*', 0.15, THRESHOLD, min_count=3, group='structure')
+                  + b.counted(r'\d+\.\s+\*\*.*?\*\*', 0.15, THRESHOLD, min_count=3, group='structure')
+                  + b.patterns([r'this allows', r'this means', r'in other words',
+                                r'put simply', r'conceptually'], 0.15, group='synthesis'),
+                  high=1.0)
+    ]
+    trust = [
+        Component('verification_methods', 0,
+                  b.terms(['reference', 'paper', 'study', 'vaswani', 'et al', 'source'], 1)),
+        Component('boundary_maintenance', 0,
+                  b.terms(['limitation', 'simplified', 'note that', 'should note', 'involves concepts'], 1)),
+        Component('security_awareness', 0,
+                  b.terms(['limitation', 'simplified', 'complex', 'involves'], 1))
+    ]
+    canvas = [
+        Component('human_agency', 55,
+                  b.counted(r'\?', 6)
+                  + b.patterns([r'does this.*?help', r'would you like', r'you.*?understand',
+                                r'your.*?brain', r'imagine.*?you'], 8)
+                  + b.counted(r'\byou\b', 2, target=LOWER, min_count=0, cap=12),
+                  high=100),
+        Component('ai_contribution', 55,
+                  b.patterns([r'mechanism.*?allows', r'architecture.*?revolutionized',
+                              r'process.*?simultaneously'], 6)
+                  + b.patterns([r'myself.*?\(claude\)'], 8)
+                  + b.patterns([r'models like.*?bert.*?gpt'], 4),
+                  high=100),
+        Component('transparency', 55,
+                  b.patterns([r'i should note', r'limitations.*?explanation',
+                              r'simplified.*?here', r'involves concepts.*?simplified'], 10)
+                  + b.patterns([r'actual mathematics.*?complex'], 8)
+                  + b.patterns([r'conceptually.*?think of'], 6),
+                  high=100),
+        Component('collaboration_quality', 55,
+                  b.patterns([r'does this.*?help', r'would you like.*?elaborate',
+                              r'any particular aspect'], 12)
+                  + b.patterns([r'let me explain'], 6)
+                  + b.patterns([r'help.*?understand'], 8),
+                  high=100)
+    ]
+    return ScoringSpec('balanced', b.features,
+                       {'reality_index': reality, 'trust_protocol': trust, 'canvas_parity': canvas},
+                       _finalize_balanced)
+
+
+BALANCED_SPEC = _build_balanced()
+
+SPECS = {'balanced': BALANCED_SPEC}
+
+
+def get_spec(variant: str = 'balanced') -> ScoringSpec:
+    try:
+        return SPECS[variant]
+    except KeyError:
+        raise ValueError(f"No scoring spec for variant '{variant}'. Available: {', '.join(SPECS)}") from None
@@ -0,0 +1,206 @@
+"""
+Interned Token Streams
+
+Word-level matching for term lists. A document's lowercase text is split
+into ``\\w+`` words, each interned to a ``uint32`` ID in a shared
+``Vocabulary``, and stored as an ``array('I')`` viewed as a NumPy array.
+
+Term presence then becomes set membership on IDs instead of a substring
+scan per term, which gives word-boundary semantics (``'ai'`` no longer
+matches inside "explain", ``'note'`` not inside "denote"):
+
+- single words match against the document's ID set
+- two-word phrases match against its bigrams, packed as ``uint64``
+- longer phrases check the bigram first, then verify at candidate offsets
+
+Term lists are resolved to IDs once and cached on the vocabulary. One
+document uses hashed set lookups; ``TermSet.matrix`` checks a whole batch
+with one ``searchsorted`` over sorted (document, word) keys.
+
+Streams tokenized without an explicit vocabulary share a default one. Once
+it holds ``MAX_VOCABULARY`` words it is replaced by a fresh one (with an
+empty term set cache), so a long-running process does not grow it without
+bound; existing streams keep the vocabulary they were encoded with. Batch
+tools can pass their own ``Vocabulary`` and drop it with the batch.
+"""
+
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r'\w+')
+
+
+class Vocabulary:
+    """Interns words to dense ``uint32`` IDs"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.words: List[str] = []
+        self._term_sets: Dict[Tuple[str, ...], 'TermSet'] = {}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def intern(self, word: str) -> int:
+        index = self._ids.get(word)
+        if index is None:
+            index = self._ids[word] = len(self.words)
+            self.words.append(word)
+        return index
+
+    def encode(self, words: Iterable[str]) -> array:
+        ids = array('I')
+        get = self._ids.get
+        for word in words:
+            index = get(word)
+            ids.append(self.intern(word) if index is None else index)
+        return ids
+
+    def phrase(self, term: str) -> Tuple[int, ...]:
+        """IDs of a (lowercase) term's words"""
+        return tuple(self.encode(_WORD.findall(term.lower())))
+
+    def term_set(self, terms: Sequence[str]) -> 'TermSet':
+        """Cached ``TermSet`` for a term list"""
+        key = tuple(terms)
+        term_set = self._term_sets.get(key)
+        if term_set is None:
+            term_set = self._term_sets[key] = TermSet(key, self)
+        return term_set
+
+
+# Words in the shared default vocabulary before it is replaced by a fresh one
+MAX_VOCABULARY = 50000
+
+_default_vocabulary = Vocabulary()
+
+
+def default_vocabulary() -> Vocabulary:
+    """The shared vocabulary, replaced once it has grown past ``MAX_VOCABULARY`` words"""
+    global _default_vocabulary
+    if len(_default_vocabulary) >= MAX_VOCABULARY:
+        _default_vocabulary = Vocabulary()
+    return _default_vocabulary
+
+
+def _pack(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return (first.astype(np.uint64) << np.uint64(32)) | second.astype(np.uint64)
+
+
+class TokenStream:
+    """One document as a ``uint32`` ID stream with cached unique words and bigrams"""
+
+    __slots__ = ('ids', 'vocabulary', '_unique', '_id_set', '_bigrams')
+
+    def __init__(self, ids: np.ndarray, vocabulary: Vocabulary):
+        self.ids = ids
+        self.vocabulary = vocabulary
+        self._unique: Optional[np.ndarray] = None
+        self._id_set: Optional[frozenset] = None
+        self._bigrams: Optional[frozenset] = None
+
+    @classmethod
+    def from_text(cls, text: str, vocabulary: Optional[Vocabulary] = None) -> 'TokenStream':
+        """Tokenize already-lowercased text"""
+        vocabulary = default_vocabulary() if vocabulary is None else vocabulary
+        ids = vocabulary.encode(_WORD.findall(text))
+        return cls(np.frombuffer(ids, dtype=np.uint32) if ids else np.zeros(0, dtype=np.uint32), vocabulary)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def unique(self) -> np.ndarray:
+        if self._unique is None:
+            self._unique = np.unique(self.ids)
+        return self._unique
+
+    @property
+    def id_set(self) -> frozenset:
+        if self._id_set is None:
+            self._id_set = frozenset(self.unique.tolist())
+        return self._id_set
+
+    @property
+    def bigrams(self) -> frozenset:
+        """Packed ``first << 32 | second`` keys of adjacent word pairs"""
+        if self._bigrams is None:
+            self._bigrams = frozenset(_pack(self.ids[:-1], self.ids[1:]).tolist())
+        return self._bigrams
+
+    def present(self, terms: Sequence[str]) -> np.ndarray:
+        """Boolean per term: does the term occur as whole words"""
+        return self.vocabulary.term_set(terms).present(self)
+
+    def count_present(self, terms: Sequence[str]) -> int:
+        return self.vocabulary.term_set(terms).count_present(self)
+
+    def contains(self, term: str) -> bool:
+        return bool(self.present((term,))[0])
+
+    def count(self, term: str) -> int:
+        """Occurrences of a whole-word term"""
+        phrase = self.vocabulary.phrase(term)
+        if not phrase or len(phrase) > len(self.ids):
+            return 0
+        hits = self.ids[:len(self.ids) - len(phrase) + 1] == phrase[0]
+        for offset, index in enumerate(phrase[1:], 1):
+            hits &= self.ids[offset:len(self.ids) - len(phrase) + 1 + offset] == index
+        return int(hits.sum())
+
+
+class TermSet:
+    """A term list resolved to word IDs and bigram keys for vectorized lookups"""
+
+    def __init__(self, terms: Sequence[str], vocabulary: Vocabulary):
+        self.terms = list(terms)
+        self.vocabulary = vocabulary
+        phrases = [vocabulary.phrase(term) for term in self.terms]
+        # (term index, word ID) for single words; (term index, bigram key, long?) for phrases
+        self._words = [(i, p[0]) for i, p in enumerate(phrases) if len(p) == 1]
+        self._phrases = [(i, (p[0] << 32) | p[1], len(p) > 2) for i, p in enumerate(phrases) if len(p) >= 2]
+        self._word_index = np.array([i for i, _ in self._words], dtype=np.int64)
+        self._word_ids = np.array([w for _, w in self._words], dtype=np.uint64)
+
+    def present(self, stream: TokenStream) -> np.ndarray:
+        if stream.vocabulary is not self.vocabulary:
+            return stream.vocabulary.term_set(self.terms).present(stream)
+        result = np.zeros(len(self.terms), dtype=bool)
+        ids = stream.id_set
+        for i, word in self._words:
+            result[i] = word in ids
+        if self._phrases:
+            bigrams = stream.bigrams
+            for i, key, long_phrase in self._phrases:
+                result[i] = key in bigrams and (not long_phrase or stream.count(self.terms[i]) > 0)
+        return result
+
+    def count_present(self, stream: TokenStream) -> int:
+        return int(self.present(stream).sum())
+
+    def matrix(self, streams: Sequence[TokenStream]) -> np.ndarray:
+        """``(documents, terms)`` presence matrix; single words in one vectorized lookup"""
+        result = np.zeros((len(streams), len(self.terms)), dtype=bool)
+        if not streams:
+            return result
+        if any(stream.vocabulary is not self.vocabulary for stream in streams):
+            for row, stream in enumerate(streams):
+                result[row] = self.present(stream)
+            return result
+        if self._words and any(len(stream) for stream in streams):
+            uniques = [stream.unique for stream in streams]
+            documents = np.repeat(np.arange(len(streams), dtype=np.uint64), [len(u) for u in uniques])
+            keys = (documents << np.uint64(32)) | np.concatenate(uniques).astype(np.uint64)
+            query = ((np.arange(len(streams), dtype=np.uint64)[:, None] << np.uint64(32))
+                     | self._word_ids[None, :])
+            # Keys are already sorted (document-major, unique IDs ascending)
+            found = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+            result[:, self._word_index] = keys[found] == query
+        if self._phrases:
+            columns = [i for i, _, _ in self._phrases]
+            for row, stream in enumerate(streams):
+                result[row, columns] = self.present(stream)[columns]
+        return result
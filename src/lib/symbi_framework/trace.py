@@ -0,0 +1,169 @@
+"""
+Match Traces
+
+Explains a spec score: which pattern or term fired, where, and what each
+firing contributed to which component (``canvas_parity.transparency: 75`` =
+base 55 + the rules listed for it).
+
+A trace explains a ``ScoringSpec`` score (what ``ScoringSpec.score`` and
+the large-document and approximate scorers compute), not the tester scripts
+behind ``score_dimensions`` and the CLI's default scores. Only the balanced variant
+has a spec; it reproduces ``BalancedSymbiFrameworkTester`` exactly, so its
+traces also explain that tester's results. Other variants cannot be traced.
+
+Tracing is a separate entry point, ``score_traced``; ``ScoringSpec.score``
+and ``extract`` are untouched, so scoring with tracing off costs exactly
+what it did before. A traced call makes the same single pass over the
+features through ``spec.feature_spans``, the offset-reporting twin of the
+``count_feature`` that ``extract`` uses (both select text and matcher with
+``feature_operand``), and appends the spans to flat ``array`` columns:
+
+- matches: feature index, start and end byte offsets (UTF-8), grouped by
+  feature so a feature's matches are one slice
+- contributions: flat rule index and value for every rule that fired
+
+Count features record every match; presence features record the first
+match, which is all the scorer looks at. Offsets refer to the original
+content even for patterns run on its lowercase copy. Everything is linear
+in the document length plus the number of matches.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .spec import LOWER, Rule, ScoringSpec, feature_spans, get_spec
+
+
+def _rule_table(spec: ScoringSpec) -> List[Tuple[str, str, Rule]]:
+    return [(dimension, component.name, rule)
+            for dimension, components in spec.dimensions.items()
+            for component in components
+            for rule in component.rules]
+
+
+def _lower_origins(content: str, lower: str) -> Optional[List[int]]:
+    """Original index of every lowercase character, when lowercasing changed lengths"""
+    if len(lower) == len(content):
+        return None
+    origins = []
+    for index, char in enumerate(content):
+        origins.extend([index] * len(char.lower()))
+    origins.append(len(content))
+    return origins
+
+
+def _byte_offsets(content: str, offsets: array) -> array:
+    """UTF-8 byte offsets for character offsets, in one pass over the sorted offsets"""
+    result = array('q', offsets)
+    order = sorted(range(len(offsets)), key=offsets.__getitem__)
+    position = size = 0
+    for i in order:
+        target = offsets[i]
+        size += len(content[position:target].encode('utf-8', errors='surrogatepass'))
+        position = target
+        result[i] = size
+    return result
+
+
+class MatchTrace:
+    """Array-backed matches and rule contributions of one traced scoring pass"""
+
+    __slots__ = ('spec', 'counts', 'match_features', 'match_starts', 'match_ends',
+                 'feature_slices', 'rules', 'values', '_rule_table')
+
+    def __init__(self, spec: ScoringSpec):
+        self.spec = spec
+        self.counts: List[int] = []
+        self.match_features = array('H')
+        self.match_starts = array('q')
+        self.match_ends = array('q')
+        # Matches of feature i are match_*[feature_slices[i]:feature_slices[i + 1]]
+        self.feature_slices = array('q', [0])
+        self.rules = array('H')
+        self.values = array('d')
+        self._rule_table = _rule_table(spec)
+
+    def __len__(self) -> int:
+        return len(self.match_starts)
+
+    def matches(self, feature: int) -> List[Tuple[int, int]]:
+        lo, hi = self.feature_slices[feature], self.feature_slices[feature + 1]
+        return list(zip(self.match_starts[lo:hi], self.match_ends[lo:hi]))
+
+    def explain(self, dimension: Optional[str] = None,
+                component: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fired rules with their feature, matches and contribution, largest first"""
+        entries = []
+        for rule_index, value in zip(self.rules, self.values):
+            rule_dimension, rule_component, rule = self._rule_table[rule_index]
+            if dimension not in (None, rule_dimension) or component not in (None, rule_component):
+                continue
+            feature = self.spec.features[rule.feature]
+            entries.append({
+                'dimension': rule_dimension,
+                'component': rule_component,
+                'kind': feature.kind,
+                'source': feature.source,
+                'count': self.counts[rule.feature],
+                'contribution': value,
+                'matches': self.matches(rule.feature)
+            })
+        return sorted(entries, key=lambda entry: -abs(entry['contribution']))
+
+    def components(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Base, summed contributions and clamped value of every component"""
+        totals: Dict[Tuple[str, str], float] = {}
+        for rule_index, value in zip(self.rules, self.values):
+            dimension, name, _ = self._rule_table[rule_index]
+            totals[(dimension, name)] = totals.get((dimension, name), 0.0) + value
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for dimension, components in self.spec.dimensions.items():
+            for component in components:
+                result.setdefault(dimension, {})[component.name] = {
+                    'base': component.base,
+                    'contributions': totals.get((dimension, component.name), 0.0),
+                    'value': component.value(self.counts)
+                }
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'spec': self.spec.version, 'matches': len(self), 'components': self.components(),
+                'rules': self.explain()}
+
+
+def _match_features(spec: ScoringSpec, content: str, trace: MatchTrace) -> None:
+    """One pass over the spec's features, recording counts and match offsets"""
+    lower = content.lower()
+    origins = _lower_origins(content, lower)
+
+    starts, ends = trace.match_starts, trace.match_ends
+    for feature in spec.features:
+        first = len(starts)
+        for start, end in feature_spans(feature, content, lower):
+            starts.append(start)
+            ends.append(end)
+        found = len(starts) - first
+        trace.counts.append(found)
+        trace.match_features.extend([feature.index] * found)
+        trace.feature_slices.append(len(starts))
+        if origins is not None and feature.target == LOWER:
+            for i in range(first, len(starts)):
+                starts[i], ends[i] = origins[starts[i]], origins[ends[i]]
+
+    if not content.isascii():
+        trace.match_starts = _byte_offsets(content, starts)
+        trace.match_ends = _byte_offsets(content, ends)
+
+
+def score_traced(content: str, variant: str = 'balanced',
+                 spec: Optional[ScoringSpec] = None) -> Tuple[Dict[str, Any], MatchTrace]:
+    """Score one document and return the result with its match trace"""
+    spec = spec or get_spec(variant)
+    trace = MatchTrace(spec)
+    _match_features(spec, content, trace)
+    for rule_index, (_, _, rule) in enumerate(trace._rule_table):
+        value = rule.contribution(trace.counts[rule.feature])
+        if value:
+            trace.rules.append(rule_index)
+            trace.values.append(value)
+    return spec.evaluate(trace.counts), trace
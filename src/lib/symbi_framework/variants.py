@@ -0,0 +1,131 @@
+"""
+Detector Variants
+
+Name-based access to the detector variants implemented by the tester
+scripts at the repository root, so batch tooling (evaluation, comparison,
+CLI) can pick a variant by name and get results in one shape. The scripts
+are loaded from their files, so importing the package leaves ``sys.path``
+alone.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, List
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PACKAGE = 'src.lib.symbi_framework'
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(_PACKAGE_DIR)))
+
+# Variant name -> (module, tester class)
+VARIANTS = {
+    'original': ('test_detection', 'SymbiFrameworkTester'),
+    'enhanced': ('test_enhanced_detection', 'EnhancedSymbiFrameworkTester'),
+    'calibrated': ('test_calibrated_detection', 'CalibratedSymbiFrameworkTester'),
+    'balanced': ('test_balanced_detection', 'BalancedSymbiFrameworkTester')
+}
+
+DEFAULT_VARIANT = 'balanced'
+
+# Trust status as a number, for dimensions compared or aggregated numerically
+TRUST_SCORES = {'PASS': 100, 'PARTIAL': 60, 'FAIL': 20}
+
+_testers: Dict[str, Any] = {}
+_versions: Dict[str, str] = {}
+
+
+def _tester_module(module_name: str) -> ModuleType:
+    """A tester script as a module, loaded from the repository root once"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(_REPO_ROOT, module_name + '.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return module
+
+
+def create_tester(variant: str = DEFAULT_VARIANT, matcher: Any = None):
+    """New tester instance; ``matcher`` stands in for the ``re`` module in its pattern calls"""
+    try:
+        module_name, class_name = VARIANTS[variant]
+    except KeyError:
+        raise ValueError(f"Unknown variant '{variant}'. Available: {', '.join(VARIANTS)}") from None
+    tester_class = getattr(_tester_module(module_name), class_name)
+    return tester_class() if matcher is None else tester_class(matcher)
+
+
+def get_tester(variant: str = DEFAULT_VARIANT):
+    """Shared tester instance for a variant (testers are stateless)"""
+    tester = _testers.get(variant)
+    if tester is None:
+        tester = _testers[variant] = create_tester(variant)
+    return tester
+
+
+def scoring_sources(variant: str = DEFAULT_VARIANT) -> List[str]:
+    """The tester script plus every package module it imports, directly or through others"""
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}'. Available: {', '.join(VARIANTS)}")
+    sources = [os.path.join(_REPO_ROOT, VARIANTS[variant][0] + '.py')]
+    for path in sources:
+        with open(path, encoding='utf-8') as handle:
+            tree = ast.parse(handle.read())
+        in_package = os.path.dirname(path) == _PACKAGE_DIR
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ''
+                if node.level:
+                    if not in_package:
+                        continue
+                    base = f'{_PACKAGE}.{base}' if base else _PACKAGE
+                # ``from package import module`` names modules too
+                modules = [base] + [f'{base}.{alias.name}' for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                if module.startswith(_PACKAGE + '.'):
+                    candidate = os.path.join(_PACKAGE_DIR, *module[len(_PACKAGE) + 1:].split('.')) + '.py'
+                    if os.path.isfile(candidate) and candidate not in sources:
+                        sources.append(candidate)
+    return sources
+
+
+def variant_version(variant: str = DEFAULT_VARIANT) -> str:
+    """``<variant>/<digest>`` of the scoring source; changes whenever scores may change"""
+    version = _versions.get(variant)
+    if version is None:
+        digest = hashlib.sha256()
+        for path in scoring_sources(variant):
+            with open(path, 'rb') as handle:
+                digest.update(handle.read())
+        version = _versions[variant] = f'{variant}/{digest.hexdigest()[:16]}'
+    return version
+
+
+def score(content: str, variant: str = DEFAULT_VARIANT) -> Dict[str, Any]:
+    """Full tester result for one response"""
+    return get_tester(variant).score_response(content)
+
+
+def to_dimensions(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten tester results to assessment dimension names (as used by ``expected``)"""
+    return {
+        'realityIndex': results['reality_index']['overall'],
+        'trustProtocol': results['trust_protocol']['overall'],
+        'canvasParity': results['canvas_parity']['overall'],
+        'overallScore': results['overall_score']
+    }
+
+
+def score_dimensions(content: str, variant: str = DEFAULT_VARIANT) -> Dict[str, Any]:
+    return to_dimensions(score(content, variant))
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+symbi-score - bulk scoring entry point
+See src/lib/symbi_framework/cli.py for subcommands and input formats
+"""
+
+import sys
+
+from src.lib.symbi_framework.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
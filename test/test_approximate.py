@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Approximate Scoring Tests
+Tests stratified window sampling, its error bounds and the exact fallback
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.approximate import ApproximateScorer, score_approximate
+from src.lib.symbi_framework.confidence import DOCUMENT_DIMENSIONS, dimension_values
+from src.lib.symbi_framework.spec import get_spec
+from src.lib.symbi_framework.variants import to_dimensions
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+def long_document(size=1_000_000):
+    samples = []
+    for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md"))):
+        with open(path, encoding="utf-8") as f:
+            samples.append(f.read())
+    filler = "The meeting continued with routine updates on the schedule. " * 20
+    parts = []
+    while sum(map(len, parts)) < size:
+        parts.extend(samples)
+        parts.append(filler)
+    return "\n\n".join(parts)
+
+
+class TestApproximateScoring(unittest.TestCase):
+    """Test approximate results against exact scores"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.content = long_document()
+        cls.exact = to_dimensions(get_spec().score(cls.content))
+
+    def test_sampled_document(self):
+        """Test a sampled score stays near the exact one with reproducible bounds"""
+        result = score_approximate(self.content, seed=0)
+        approximation = result["approximation"]
+        self.assertFalse(approximation["exact"])
+        self.assertLess(approximation["sampled_fraction"], 0.05)
+        self.assertGreaterEqual(approximation["windows"], 8)
+        self.assertEqual(approximation["rounds"], 1)
+        self.assertEqual(set(approximation["intervals"]), set(DOCUMENT_DIMENSIONS))
+        for dim, (lower, upper) in approximation["intervals"].items():
+            self.assertLessEqual(lower, upper)
+            self.assertAlmostEqual(approximation["error"][dim], (upper - lower) / 2)
+        self.assertLessEqual(abs(to_dimensions(result)["overallScore"] - self.exact["overallScore"]), 10)
+
+        again = score_approximate(self.content, seed=0)
+        self.assertEqual(again["approximation"]["intervals"], approximation["intervals"])
+
+    def test_bounds_cover_exact_scores(self):
+        """Test the bounds contain the exact scores across seeds, rare presence features included"""
+        filler = "The meeting continued with routine updates on the schedule. " * 20000
+        with open(os.path.join(SAMPLES_DIR, "claude_transformer_explanation.md"), encoding="utf-8") as f:
+            response = f.read()
+        # One response in two windows of filler: its presence features are unseen in most samples
+        rare = filler[:len(filler) // 2] + response + filler[len(filler) // 2:]
+        for content in (self.content, rare):
+            exact = dict(zip(DOCUMENT_DIMENSIONS, dimension_values(get_spec().score(content))))
+            for seed in range(30):
+                intervals = score_approximate(content, seed=seed)["approximation"]["intervals"]
+                for dim, (lower, upper) in intervals.items():
+                    self.assertTrue(lower <= exact[dim] <= upper, (seed, dim, lower, upper, exact[dim]))
+
+    def test_target_error_and_budget(self):
+        """Test a target error adds rounds and a time budget stops them"""
+        first = ApproximateScorer(seed=1).score(self.content)["approximation"]
+        self.assertGreater(first["error"]["overallScore"], 0)
+        result = ApproximateScorer(target_error=0.0, seed=1).score(self.content)["approximation"]
+        self.assertGreater(result["windows"], first["windows"])
+        self.assertTrue(result["exact"] or result["error"]["overallScore"] == 0)
+
+        budgeted = ApproximateScorer(target_error=0.0, time_budget=0.0, seed=1).score(self.content)
+        self.assertEqual(budgeted["approximation"]["rounds"], 1)
+
+    def test_large_fraction_is_exact(self):
+        """Test large fractions fall back to an exact pass"""
+        result = ApproximateScorer(fraction=0.3).score(self.content)
+        self.assertTrue(result["approximation"]["exact"])
+        self.assertEqual(to_dimensions(result), self.exact)
+        self.assertEqual(result["approximation"]["error"]["overallScore"], 0.0)
+
+    def test_short_document_is_exact(self):
+        """Test short documents are scored exactly"""
+        content = "Let me explain how this works. Does this help you understand?"
+        result = score_approximate(content)
+        self.assertTrue(result["approximation"]["exact"])
+        self.assertEqual(to_dimensions(result), to_dimensions(get_spec().score(content)))
+
+    def test_score_file(self):
+        """Test memory-mapped files score like their content"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "transcript.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.content)
+            scorer = ApproximateScorer(seed=3)
+            self.assertEqual(scorer.score_file(path)["approximation"]["intervals"],
+                             ApproximateScorer(seed=3).score(self.content)["approximation"]["intervals"])
+
+    def test_invalid_arguments(self):
+        """Test invalid fractions and dimensions are rejected"""
+        with self.assertRaises(ValueError):
+            ApproximateScorer(fraction=0)
+        with self.assertRaises(ValueError):
+            ApproximateScorer(target_dimension="promptCoverage")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Matcher Artifact Tests
+Tests serialized regex programs and NumPy-free cold starts
+"""
+
+import marshal
+import re
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework import artifacts
+from src.lib.symbi_framework.spec import BALANCED_SPEC
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestMatcherArtifacts(unittest.TestCase):
+    """Test building, loading and invalidating matcher artifacts"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "matchers.bin")
+        self.saved = dict(artifacts._programs)
+        artifacts._programs.clear()
+
+    def tearDown(self):
+        artifacts._programs.clear()
+        artifacts._programs.update(self.saved)
+        self.tmpdir.cleanup()
+
+    def test_programs_match_re_compile(self):
+        """Test artifact programs behave like re.compile for every spec source"""
+        artifacts.build_artifact(self.path, [BALANCED_SPEC])
+        self.assertEqual(artifacts.load_artifact(self.path), {"balanced": artifacts.spec_digest(BALANCED_SPEC)})
+        text = "You? Let me explain. 1. **Attention** is like a party, similar to a brain."
+        for source in artifacts.spec_sources(BALANCED_SPEC):
+            self.assertIn((source, 0), artifacts._programs)
+            sample = text if isinstance(source, str) else text.encode("ascii")
+            compiled = artifacts.compile_pattern(source)
+            self.assertEqual(compiled.pattern, source)
+            self.assertEqual(compiled.findall(sample.lower()), re.compile(source).findall(sample.lower()))
+
+    def test_warm_rebuilds_stale_or_foreign_artifacts(self):
+        """Test warm rebuilds missing, stale and foreign-runtime artifacts"""
+        self.assertFalse(artifacts.warm(self.path, [BALANCED_SPEC]))
+        self.assertTrue(artifacts.warm(self.path, [BALANCED_SPEC]))
+
+        with open(self.path, "rb") as handle:
+            artifact = marshal.load(handle)
+        artifact["runtime"] = ((2, 7), 0, 4)
+        with open(self.path, "wb") as handle:
+            marshal.dump(artifact, handle)
+        artifacts._programs.clear()
+        self.assertIsNone(artifacts.load_artifact(self.path))
+        self.assertEqual(artifacts._programs, {})
+        self.assertFalse(artifacts.warm(self.path, [BALANCED_SPEC]))
+        self.assertIsNone(artifacts.load_artifact(os.path.join(self.tmpdir.name, "missing.bin")))
+
+    def test_warm_process_honours_disable_variable(self):
+        """Test the process hook warms the cache once unless disabled"""
+        env = {"SYMBI_CACHE_DIR": self.tmpdir.name, artifacts.DISABLE_ENV: "1"}
+        with mock.patch.dict(os.environ, env), mock.patch.object(artifacts, "_warmed", False):
+            artifacts.warm_process()
+            self.assertFalse(os.path.exists(artifacts.default_path()))
+            del os.environ[artifacts.DISABLE_ENV]
+            artifacts.warm_process()
+            self.assertTrue(os.path.exists(artifacts.default_path()))
+            os.remove(artifacts.default_path())
+            artifacts.warm_process()
+            self.assertFalse(os.path.exists(artifacts.default_path()))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX ownership only")
+    def test_untrusted_artifacts_are_ignored(self):
+        """Test that artifacts writable by other users are not loaded"""
+        artifacts.build_artifact(self.path, [BALANCED_SPEC])
+        os.chmod(self.path, 0o666)
+        self.assertIsNone(artifacts.load_artifact(self.path))
+        self.assertEqual(artifacts._programs, {})
+        os.chmod(self.path, 0o644)
+        os.chmod(self.tmpdir.name, 0o777)
+        self.assertIsNone(artifacts.load_artifact(self.path))
+        os.chmod(self.tmpdir.name, 0o700)
+        self.assertIsNotNone(artifacts.load_artifact(self.path))
+
+    def test_cold_start_does_not_import_numpy(self):
+        """Test a warm start scores without importing NumPy"""
+        code = ("import sys\n"
+                "from src.lib.symbi_framework import artifacts\n"
+                "artifacts.warm()\n"
+                "from src.lib.symbi_framework.multilingual import MultilingualScorer\n"
+                "from src.lib.symbi_framework.variants import score\n"
+                "MultilingualScorer().score('¿Te ayuda? Por ejemplo, es complejo.')\n"
+                "score('Hello, let me explain.')\n"
+                "print('numpy' in sys.modules)\n")
+        env = dict(os.environ, SYMBI_CACHE_DIR=self.tmpdir.name)
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
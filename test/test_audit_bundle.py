@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Audit Bundle Container Tests
+Tests streaming writes and selective reads of chunked audit bundles
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.audit_bundle import (
+    AuditBundleReader, AuditBundleWriter, BundleFormatError
+)
+
+
+def make_ticket(i: int) -> dict:
+    return {
+        "ticket_version": "1.0",
+        "summary": f"SYMBI Framework Audit Report {i}",
+        "scope": {"allow_raw": False, "allow_training": False, "max_retention_days": 90},
+        "transparency_log": [{"who": "agent-system", "what": "generated-sybi-receipt",
+                              "when": "2025-09-26T07:45:00Z", "cbt_id": f"cbt_{i:06d}"}]
+    }
+
+
+class TestAuditBundle(unittest.TestCase):
+    """Test the audit bundle container"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "bundle.sbdl")
+        with AuditBundleWriter(self.path, chunk_size=4) as writer:
+            for i in range(25):
+                writer.add(f"cbt_{i:06d}", make_ticket(i))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_single_ticket(self):
+        """Test fetching one ticket by id"""
+        with AuditBundleReader(self.path) as reader:
+            self.assertEqual(len(reader), 25)
+            self.assertIn("cbt_000013", reader)
+            self.assertEqual(reader.get("cbt_000013"), make_ticket(13))
+            with self.assertRaises(KeyError):
+                reader.get("cbt_999999")
+
+    def test_iter_range_across_chunks(self):
+        """Test range iteration spanning chunk boundaries"""
+        with AuditBundleReader(self.path) as reader:
+            summaries = [t["summary"] for t in reader.iter_range(3, 10)]
+            self.assertEqual(summaries, [make_ticket(i)["summary"] for i in range(3, 10)])
+            self.assertEqual(len(list(reader)), 25)
+            self.assertEqual(list(reader.iter_range(30, 40)), [])
+
+    def test_paged_id_index(self):
+        """Test that lookups read a single id index page"""
+        path = os.path.join(self.tmpdir.name, "paged.sbdl")
+        with AuditBundleWriter(path, chunk_size=4, index_page_size=3) as writer:
+            for i in reversed(range(25)):
+                writer.add(f"cbt_{i:06d}", make_ticket(i))
+        with AuditBundleReader(path) as reader:
+            self.assertEqual(len(reader._pages), 9)
+            self.assertEqual(reader.get("cbt_000013"), make_ticket(13))
+            self.assertEqual(reader._cached_page[0], 4)
+            self.assertNotIn("cbt_0000135", reader)
+            self.assertNotIn("cbt_", reader)
+            self.assertEqual(reader.ids(), [f"cbt_{i:06d}" for i in reversed(range(25))])
+
+    def test_duplicate_ids_rejected(self):
+        """Test that ticket ids must be unique"""
+        writer = AuditBundleWriter(io.BytesIO())
+        writer.add("cbt_1", make_ticket(1))
+        with self.assertRaises(ValueError):
+            writer.add("cbt_1", make_ticket(1))
+
+    def test_failed_export_is_incomplete(self):
+        """Test that a writer left by an exception produces no readable bundle"""
+        path = os.path.join(self.tmpdir.name, "failed.sbdl")
+        with self.assertRaises(RuntimeError):
+            with AuditBundleWriter(path, chunk_size=4) as writer:
+                for i in range(10):
+                    writer.add(f"cbt_{i:06d}", make_ticket(i))
+                raise RuntimeError("export failed")
+        with self.assertRaises(BundleFormatError):
+            AuditBundleReader(path)
+        with self.assertRaises(BundleFormatError):
+            AuditBundleReader(io.BytesIO(b"SYMBIBDL\x02\x00"))
+
+    def test_rejects_invalid_file(self):
+        """Test that non-bundle files are rejected"""
+        with self.assertRaises(BundleFormatError):
+            AuditBundleReader(io.BytesIO(b"{\"not\": \"a bundle\"}" * 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,18 @@ SYMBI Audit System Tests
 Tests the operationalization of SYMBI dimensions into concrete, auditable receipts
 """
 
+import os
+import sys
 import unittest
 import json
 from typing import Dict, Any
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.calibration import ReliabilityHistogram
+from src.lib.symbi_framework.fairness import GroupFairnessAccumulator
+from src.lib.symbi_framework.operational_metrics import OperationalizationMetrics
+
 class TestSYMBIAuditSystem(unittest.TestCase):
     """Test the SYMBI audit system implementation"""
 
@@ -27,6 +35,13 @@ class TestSYMBIAuditSystem(unittest.TestCase):
                 "bias_checked": True,
                 "ui_verified": True,
                 "docs_aligned": True
+            },
+            "evaluation_data": {
+                "labels":      [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1],
+                "predictions": [0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0, 0],
+                "groups":      ["en"] * 8 + ["es"] * 8,
+                "confidences": [0.12, 0.35, 0.08, 0.71, 0.93, 0.88, 0.97, 0.42,
+                                0.22, 0.15, 0.64, 0.55, 0.91, 0.99, 0.38, 0.47]
             }
         }
 
@@ -52,6 +67,23 @@ class TestSYMBIAuditSystem(unittest.TestCase):
         self.assertIsInstance(receipt["confidence"], float)
         self.assertGreaterEqual(receipt["confidence"], 0.0)
         self.assertLessEqual(receipt["confidence"], 1.0)
+        self.assertEqual(receipt["calibration_bucket"], "0.9-1.0")
+        self.assertGreaterEqual(receipt["ece"], 0.0)
+        self.assertLessEqual(receipt["ece"], receipt["mce"])
+
+    def test_calibration_histogram_merge(self):
+        """Test that reliability histograms from workers merge to the single-pass result"""
+        evaluation = self.test_data["evaluation_data"]
+        correct = [int(label == p) for label, p in zip(evaluation["labels"], evaluation["predictions"])]
+        single = ReliabilityHistogram().update(evaluation["confidences"], correct)
+
+        merged = ReliabilityHistogram().update(evaluation["confidences"][:9], correct[:9])
+        merged.merge(ReliabilityHistogram.from_dict(
+            ReliabilityHistogram().update(evaluation["confidences"][9:], correct[9:]).to_dict()))
+
+        self.assertEqual(merged.counts.tolist(), single.counts.tolist())
+        self.assertAlmostEqual(merged.ece(), single.ece())
+        self.assertEqual(single.assign([0.0, 0.1, 0.95, 1.0]).tolist(), [0, 1, 9, 9])
 
     def test_ethics_receipt_generation(self):
         """Test Ethical Alignment operationalization"""
@@ -63,6 +95,26 @@ class TestSYMBIAuditSystem(unittest.TestCase):
         self.assertIn("dataset_lineage", receipt)
         self.assertIsInstance(receipt["langs_tested"], list)
         self.assertGreater(len(receipt["langs_tested"]), 0)
+        self.assertEqual(receipt["bias_metrics"]["group_fpr"], {"en": 0.25, "es": 0.5})
+        self.assertEqual(receipt["bias_metrics"]["group_fnr"], {"en": 0.25, "es": 0.5})
+        self.assertAlmostEqual(receipt["eo_gap"], 0.25)
+
+    def test_group_fairness_streaming_accumulation(self):
+        """Test that batched and merged confusion counts match a single pass"""
+        evaluation = self.test_data["evaluation_data"]
+        single = GroupFairnessAccumulator().update(
+            evaluation["labels"], evaluation["predictions"], evaluation["groups"])
+
+        first, second = GroupFairnessAccumulator(), GroupFairnessAccumulator()
+        first.update(evaluation["labels"][:5], evaluation["predictions"][:5], evaluation["groups"][:5])
+        first.update(evaluation["labels"][5:10], evaluation["predictions"][5:10], evaluation["groups"][5:10])
+        second.update(evaluation["labels"][10:], evaluation["predictions"][10:], evaluation["groups"][10:])
+        first.merge(second)
+
+        self.assertEqual(first.counts.tolist(), single.counts.tolist())
+        report = first.report()
+        low, high = report.fpr_ci
+        self.assertTrue(((low <= report.fpr) & (report.fpr <= high)).all())
 
     def test_resonance_receipt_generation(self):
         """Test Resonance Quality operationalization"""
@@ -121,6 +173,32 @@ class TestSYMBIAuditSystem(unittest.TestCase):
             self.assertGreaterEqual(value, 0.0)
             self.assertLessEqual(value, 1.0)
 
+    def test_operationalization_metrics_merge(self):
+        """Test that partial metric states from parallel workers merge exactly"""
+        receipts = [
+            {"reality_score": 0.5 + i / 40, "trust_score": 0.9, "timestamp": 1_700_000_000 + i * 60}
+            for i in range(20)
+        ]
+        combined = OperationalizationMetrics()
+        for receipt in receipts:
+            combined.update(receipt)
+
+        left, right = OperationalizationMetrics(), OperationalizationMetrics()
+        for receipt in receipts[:7]:
+            left.update(receipt)
+        for receipt in receipts[7:]:
+            right.update(receipt)
+        merged = OperationalizationMetrics.from_dict(json.loads(json.dumps(left.to_dict())))
+        merged.merge(right)
+
+        for name, value in combined.snapshot().items():
+            self.assertAlmostEqual(merged.snapshot()[name], value)
+            self.assertAlmostEqual(merged.snapshot(live=True)[name], combined.snapshot(live=True)[name])
+        reality = merged.summary()["reality_index"]
+        self.assertEqual(reality["count"], 20)
+        self.assertAlmostEqual(reality["std"], combined.summary()["reality_index"]["std"])
+        self.assertEqual(reality["window_count"], combined.summary()["reality_index"]["window_count"])
+
     def generate_reality_receipt(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate reality receipt for testing"""
         return {
@@ -132,10 +210,16 @@ class TestSYMBIAuditSystem(unittest.TestCase):
 
     def generate_trust_receipt(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate trust receipt for testing"""
+        evaluation = data["evaluation_data"]
+        correct = [int(label == p) for label, p in zip(evaluation["labels"], evaluation["predictions"])]
+        calibration = ReliabilityHistogram().update(evaluation["confidences"], correct)
+        confidence = data["framework_output"]["trust_score"]
         return {
             "ensemble_members": ["mlp_v3", "llm_guard_v2", "ruleset_kappa"],
-            "confidence": 0.93,
-            "calibration_bucket": "0.9-1.0",
+            "confidence": confidence,
+            "calibration_bucket": calibration.bucket_label(int(calibration.assign(confidence))),
+            "ece": round(calibration.ece(), 3),
+            "mce": round(calibration.mce(), 3),
             "abstained": False,
             "fallback_path": ["manual_review"],
             "human_review_required": False
@@ -143,15 +227,16 @@ class TestSYMBIAuditSystem(unittest.TestCase):
 
     def generate_ethics_receipt(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate ethics receipt for testing"""
+        evaluation = data["evaluation_data"]
+        fairness = GroupFairnessAccumulator().update(
+            evaluation["labels"], evaluation["predictions"], evaluation["groups"]
+        ).report().to_receipt()
         return {
             "langs_tested": ["en", "es", "fr", "ar", "hi", "zh"],
-            "eo_gap": 0.031,
+            "eo_gap": fairness["eo_gap"],
             "safety_guardrails": ["toxicity_check", "privacy_filter"],
             "dataset_lineage": ["open_source_licensed", "consent_verified"],
-            "bias_metrics": {
-                "group_fpr": {"group_a": 0.05, "group_b": 0.06},
-                "group_fnr": {"group_a": 0.03, "group_b": 0.04}
-            }
+            "bias_metrics": fairness["bias_metrics"]
         }
 
     def generate_resonance_receipt(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -201,13 +286,9 @@ class TestSYMBIAuditSystem(unittest.TestCase):
 
     def calculate_operationalization_metrics(self, data: Dict[str, Any]) -> Dict[str, float]:
         """Calculate operationalization metrics for SYMBI dimensions"""
-        return {
-            "reality_index": 0.95,
-            "trust_protocol": 0.93,
-            "ethical_alignment": 0.91,
-            "resonance_quality": 0.94,
-            "canvas_parity": 0.92
-        }
+        metrics = OperationalizationMetrics()
+        metrics.update(data)
+        return metrics.snapshot()
 
     def validate_audit_bundle(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
         """Validate audit bundle"""
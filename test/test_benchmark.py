@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Incremental Benchmark Tests
+Tests that benchmark re-runs only rescore changed files
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework import benchmark
+from src.lib.symbi_framework.benchmark import BenchmarkRunner
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test manifest-driven incremental scoring"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.responses = os.path.join(self.tmp, "responses")
+        shutil.copytree(SAMPLES_DIR, self.responses)
+        self.cache = os.path.join(self.tmp, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def run_benchmark(self, variants=("balanced",)):
+        return BenchmarkRunner(self.responses, self.cache, variants, workers=1).run()
+
+    def test_incremental_runs(self):
+        """Test that re-runs rescore only changed files and drop removed ones"""
+        first = self.run_benchmark()
+        self.assertEqual(first.scored, {"balanced": 4})
+        self.assertEqual([row["model"] for row in first.leaderboards["balanced"]][0], "claude")
+
+        second = self.run_benchmark()
+        self.assertEqual(second.scored, {"balanced": 0})
+        self.assertEqual(second.reused, {"balanced": 4})
+        self.assertEqual(second.leaderboards, first.leaderboards)
+
+        path = os.path.join(self.responses, "deepseek_ethical_reasoning.md")
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write("\nI should note the limitations of this analysis.\n")
+        os.remove(os.path.join(self.responses, "claude_transformer_explanation.md"))
+        third = self.run_benchmark()
+        self.assertEqual(third.scored, {"balanced": 1})
+        self.assertEqual(third.removed, 1)
+        self.assertEqual(third.files, 3)
+
+    def test_touch_without_change_is_not_rescored(self):
+        """Test that a new mtime with the same content reuses the cached results"""
+        self.run_benchmark()
+        path = os.path.join(self.responses, "claude_ethical_reasoning.md")
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(self.run_benchmark().scored, {"balanced": 0})
+
+    def test_scorer_version_change_rescores_variant(self):
+        """Test that a changed variant version rescores only that variant"""
+        self.run_benchmark(("balanced", "original"))
+        real_version = benchmark.variant_version
+        with mock.patch.object(benchmark, "variant_version",
+                               lambda v: real_version(v) + ("-changed" if v == "original" else "")):
+            run = self.run_benchmark(("balanced", "original"))
+        self.assertEqual(run.scored, {"balanced": 0, "original": 4})
+
+    def test_interrupted_run_keeps_checkpoints(self):
+        """Test that results journaled before an interruption are not rescored"""
+        real_stream = benchmark.score_stream
+
+        def interrupted(contents, *args, **kwargs):
+            for count, result in enumerate(real_stream(contents, *args, **kwargs)):
+                if count == 2:
+                    raise KeyboardInterrupt
+                yield result
+
+        with mock.patch.object(benchmark, "CHECKPOINT", 1), \
+                mock.patch.object(benchmark, "score_stream", interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                self.run_benchmark()
+        self.assertEqual(self.run_benchmark().scored, {"balanced": 2})
+
+    def test_journal_holds_only_changes(self):
+        """Test that runs append changed entries to the journal instead of rewriting the manifest"""
+        self.run_benchmark()
+        manifest = os.path.join(self.cache, benchmark.MANIFEST_NAME)
+        journal = os.path.join(self.cache, benchmark.JOURNAL_NAME)
+        written = os.stat(manifest).st_mtime_ns
+        self.run_benchmark()
+        self.assertFalse(os.path.exists(journal))
+
+        path = os.path.join(self.responses, "deepseek_ethical_reasoning.md")
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write("\nI should note the limitations of this analysis.\n")
+        self.run_benchmark()
+        self.assertEqual(os.stat(manifest).st_mtime_ns, written)
+        with open(journal, encoding="utf-8") as handle:
+            changes = [json.loads(line) for line in handle]
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(list(changes[0]["files"]), ["deepseek_ethical_reasoning.md"])
+
+        runner = BenchmarkRunner(self.responses, self.cache, ("balanced",), workers=1)
+        self.assertEqual(runner.manifest["files"]["deepseek_ethical_reasoning.md"]["sha256"],
+                         benchmark._file_digest(path))
+        self.assertEqual(runner.run().scored, {"balanced": 0})
+
+        real_size = os.path.getsize
+        with mock.patch("os.path.getsize", lambda p: real_size(p) * (1000 if p == journal else 1)):
+            self.run_benchmark(("original",))
+        self.assertFalse(os.path.exists(journal))
+        self.assertEqual(self.run_benchmark(("balanced", "original")).scored, {"balanced": 0, "original": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Command Line Tests
+Tests the symbi-score subcommands, input readers and output formats
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.cli import main, read_documents
+from src.lib.symbi_framework.variants import score_dimensions
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+def run(argv, stdin=""):
+    out = io.StringIO()
+    with mock.patch("sys.stdin", io.StringIO(stdin)):
+        status = main(argv, out)
+    return status, out.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test symbi-score end to end"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cache = tempfile.TemporaryDirectory()
+        cls.env = mock.patch.dict(os.environ, {"SYMBI_CACHE_DIR": cls.cache.name})
+        cls.env.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.stop()
+        cls.cache.cleanup()
+
+    def test_score_directory_formats(self):
+        """Test directory scoring in every output format"""
+        status, output = run(["score", SAMPLES_DIR, "-v", "balanced", "-v", "original", "-w", "1", "-f", "ndjson"])
+        self.assertEqual(status, 0)
+        rows = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(len(rows), 8)
+        path = os.path.join(SAMPLES_DIR, "claude_ethical_reasoning.md")
+        with open(path, encoding="utf-8") as handle:
+            expected = score_dimensions(handle.read(), "original")
+        row = next(r for r in rows if r["id"] == path and r["variant"] == "original")
+        self.assertEqual({k: row[k] for k in expected}, expected)
+
+        _, table = run(["score", SAMPLES_DIR, "-w", "1"])
+        self.assertEqual(len(table.splitlines()), 6)
+        _, columnar = run(["score", SAMPLES_DIR, "-w", "1", "-f", "columnar"])
+        self.assertEqual(len(json.loads(columnar)["overallScore"]), 4)
+
+    def test_stdin_text_and_ndjson(self):
+        """Test plain and NDJSON stdin inputs and their ids"""
+        _, output = run(["score", "-f", "json"], stdin="Let me explain. Does this help you?")
+        self.assertEqual(json.loads(output)[0]["id"], "<stdin>")
+        records = '{"id": "a", "content": "One."}\n\n{"input": {"content": "Two?"}}\n'
+        _, output = run(["score", "--ndjson", "-f", "ndjson"], stdin=records)
+        self.assertEqual([json.loads(line)["id"] for line in output.splitlines()], ["a", "<stdin>:3"])
+        with self.assertRaises(SystemExit):
+            run(["score", "--ndjson"], stdin='{"text": "no content"}\n')
+
+    def test_ndjson_file_with_field(self):
+        """Test NDJSON files with a dotted content field"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "batch.jsonl")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"name": "x", "response": {"text": "Hello."}}) + "\n")
+            documents = read_documents([path], field="response.text")
+        self.assertEqual([(d.id, d.content) for d in documents], [("x", "Hello.")])
+
+    def test_ndjson_rows_stream(self):
+        """Test NDJSON rows are written before the whole input is read"""
+        consumed = []
+        lines = (consumed.append(i) or json.dumps({"id": str(i), "content": "Let me explain?"}) + "\n"
+                 for i in range(300))
+        first_write = []
+
+        class Output(io.StringIO):
+            def write(self, text):
+                first_write.append(len(consumed))
+                return super().write(text)
+
+        out = Output()
+        with mock.patch("sys.stdin", lines):
+            main(["score", "--ndjson", "-w", "1", "-f", "ndjson"], out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [str(i) for i in range(300)])
+        self.assertLess(first_write[0], 300)
+
+    def test_compare_bench_and_profile(self):
+        """Test the compare, bench and profile subcommands"""
+        _, output = run(["compare", SAMPLES_DIR, "-w", "1", "-f", "json", "--dimension", "promptCoverage"])
+        self.assertEqual(json.loads(output)["models"], ["claude", "deepseek"])
+        self.assertTrue(all(row["mean"] > 0 for row in json.loads(output)["leaderboard"]))
+        with tempfile.TemporaryDirectory() as tmp:
+            _, output = run(["bench", SAMPLES_DIR, "--cache", tmp, "-w", "1", "-f", "json"])
+            self.assertEqual(json.loads(output)["scored"], {"balanced": 4})
+            _, output = run(["bench", SAMPLES_DIR, "--cache", tmp, "-w", "1"])
+            self.assertIn("reused {'balanced': 4}", output)
+        _, output = run(["profile", SAMPLES_DIR, "-w", "1", "--top", "3", "-f", "ndjson"])
+        self.assertEqual(len(output.splitlines()), 3)
+
+    def test_approximate_score(self):
+        """Test approximate scoring adds an error column"""
+        _, output = run(["score", SAMPLES_DIR, "--approximate", "-w", "2", "-f", "ndjson"])
+        rows = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(len(rows), 4)
+        path = os.path.join(SAMPLES_DIR, "claude_ethical_reasoning.md")
+        with open(path, encoding="utf-8") as handle:
+            expected = score_dimensions(handle.read())
+        row = next(r for r in rows if r["id"] == path)
+        self.assertEqual(row["error"], 0.0)
+        self.assertEqual(row["overallScore"], expected["overallScore"])
+        with self.assertRaises(SystemExit):
+            run(["score", SAMPLES_DIR, "--approximate", "-v", "original"])
+
+    def test_unknown_variant(self):
+        """Test unknown variants exit with an error"""
+        with self.assertRaises(SystemExit):
+            run(["score", SAMPLES_DIR, "-v", "nope"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Model Comparison Tests
+Tests the model-by-prompt comparison matrix and its pairwise statistics
+"""
+
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.comparison import (
+    ComparisonMatrix, DIMENSIONS, compare, find_benchmark_prompts, load_benchmark_prompts,
+    load_responses, match_prompt_texts, response_key, response_keys
+)
+from src.lib.symbi_framework.confidence import student_t_sf2
+from src.lib.symbi_framework.variants import score_dimensions
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLES_DIR = os.path.join(TEST_DIR, "sample_responses")
+
+
+class TestComparisonMatrix(unittest.TestCase):
+    """Test scoring of a response table and the derived matrices"""
+
+    def test_sample_responses(self):
+        """Test the matrix built from the sample response directory"""
+        responses = load_responses(SAMPLES_DIR)
+        self.assertIn(("claude", "transformer_explanation"), responses)
+        matrix = compare(responses, workers=1,
+                         prompt_texts={"transformer_explanation": "Explain transformer attention and architecture"})
+        self.assertEqual(matrix.models, ["claude", "deepseek"])
+        self.assertEqual(matrix.scores.shape, (2, 2, len(DIMENSIONS)))
+
+        content = responses[("deepseek", "ethical_reasoning")]
+        i, j = matrix.models.index("deepseek"), matrix.prompts.index("ethical_reasoning")
+        self.assertEqual(matrix.dimension("overallScore")[i, j], score_dimensions(content)["overallScore"])
+        coverage = matrix.dimension("promptCoverage")
+        self.assertTrue(np.isnan(coverage[:, matrix.prompts.index("ethical_reasoning")]).all())
+        self.assertTrue((coverage[:, matrix.prompts.index("transformer_explanation")] > 0).all())
+
+        deltas = matrix.deltas()
+        np.testing.assert_allclose(deltas, -deltas.T)
+        self.assertEqual(matrix.to_dict()["models"], ["claude", "deepseek"])
+
+    def test_statistics_with_missing_cells(self):
+        """Test deltas, significance and ranks when some responses are missing"""
+        scores = np.full((3, 4, len(DIMENSIONS)), np.nan)
+        scores[0, :, 0] = [80, 70, 90, 60]
+        scores[1, :, 0] = [70, 60, 80, 50]
+        scores[2, :3, 0] = [70, 75, 85]
+        matrix = ComparisonMatrix(["a", "b", "c"], ["p1", "p2", "p3", "p4"], scores)
+
+        deltas = matrix.deltas()
+        self.assertAlmostEqual(deltas[0, 1], 10.0)
+        self.assertAlmostEqual(deltas[0, 2], 10 / 3)
+        self.assertTrue(np.isnan(deltas[0, 0]) or deltas[0, 0] == 0)
+
+        t, p = matrix.significance()
+        self.assertEqual(t[0, 1], np.inf)
+        self.assertEqual(p[0, 1], 0.0)
+        self.assertTrue(0 < p[0, 2] < 1)
+        # Three shared prompts: two degrees of freedom, p = 1 - |t| / sqrt(2 + t^2)
+        self.assertAlmostEqual(p[0, 2], 1 - abs(t[0, 2]) / math.sqrt(2 + t[0, 2] ** 2))
+
+        ranks = matrix.ranks()
+        np.testing.assert_array_equal(ranks[:, 0], [1.0, 2.5, 2.5])
+        self.assertTrue(np.isnan(ranks[2, 3]))
+        self.assertEqual(matrix.leaderboard()[0]["model"], "a")
+
+    def test_small_sample_p_values(self):
+        """Test p-values follow Student t at few shared prompts"""
+        scores = np.full((2, 2, len(DIMENSIONS)), np.nan)
+        scores[0, :, 0] = [90, 70]
+        scores[1, :, 0] = [60, 50]
+        t, p = ComparisonMatrix(["a", "b"], ["p1", "p2"], scores).significance()
+        self.assertAlmostEqual(t[0, 1], 5.0)
+        self.assertAlmostEqual(p[0, 1], 1 - 2 / math.pi * math.atan(5.0))
+
+        # Two-sided 5% critical values from the t table
+        critical = {1: 12.706, 2: 4.303, 5: 2.571, 10: 2.228, 30: 2.042}
+        p = student_t_sf2(np.array(list(critical.values())), np.array(list(critical)))
+        np.testing.assert_allclose(p, 0.05, atol=2e-4)
+        np.testing.assert_array_equal(student_t_sf2(np.array([0.0, np.inf, np.nan]), 3), [1.0, 0.0, np.nan])
+
+    def test_model_names_with_underscores(self):
+        """Test file names split before the prompt names they share"""
+        keys = response_keys(["gpt_4o_ethics.md", "claude_ethics.md", "gpt_4o_code_review.md",
+                              "claude_code_review.md"])
+        self.assertEqual(keys["gpt_4o_ethics.md"], ("gpt_4o", "ethics"))
+        self.assertEqual(keys["gpt_4o_code_review.md"], ("gpt_4o", "code_review"))
+        self.assertEqual(keys["claude_code_review.md"], ("claude", "code_review"))
+        self.assertEqual(response_key("gpt_4o_mini_summary.md", {"summary"}), ("gpt_4o_mini", "summary"))
+        self.assertEqual(response_key("claude_ethical_reasoning.md"), ("claude", "ethical_reasoning"))
+
+    def test_duplicate_responses_scored_once(self):
+        """Test identical responses from different models score identically"""
+        records = [{"model": m, "prompt": "p", "content": "Same answer. I should note a limitation."}
+                   for m in ("x", "y")]
+        matrix = compare(records, workers=1)
+        self.assertEqual(matrix.deltas()[0, 1], 0.0)
+
+    def test_benchmark_prompts(self):
+        """Test loading benchmark prompts and matching them to response prompt names"""
+        prompts = load_benchmark_prompts(os.path.join(TEST_DIR, "benchmark_prompts.md"))
+        self.assertTrue(prompts)
+        self.assertTrue(all(prompt.get("text") for prompt in prompts.values()))
+
+        names = ["transformer_explanation", "ethical_reasoning", "trust_and_verification-2", "agency_balance", "zzz"]
+        texts = match_prompt_texts(names, prompts)
+        self.assertTrue(texts["transformer_explanation"].startswith("Explain how transformer"))
+        self.assertTrue(texts["ethical_reasoning"].startswith("Is it ethical to use AI for automated hiring"))
+        self.assertEqual(texts["trust_and_verification-2"], prompts["trust_and_verification-2"]["text"])
+        self.assertIn("agency_balance", texts)
+        self.assertNotIn("zzz", texts)
+        self.assertEqual(find_benchmark_prompts(SAMPLES_DIR), os.path.join(TEST_DIR, "benchmark_prompts.md"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Score Confidence Tests
+Tests bootstrap and analytic intervals for aggregate and per-document scores
+"""
+
+import glob
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.comparison import DIMENSIONS, ComparisonMatrix
+from src.lib.symbi_framework.confidence import (
+    aggregate_intervals, analytic_intervals, bootstrap_intervals, component_arrays,
+    document_intervals, group_values, matrix_intervals, student_t_quantile
+)
+from src.lib.symbi_framework.spec import get_spec
+from src.lib.symbi_framework.variants import score_dimensions
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLES_DIR = os.path.join(TEST_DIR, "sample_responses")
+
+
+class TestAggregateIntervals(unittest.TestCase):
+    """Test vectorized intervals over many rows with missing values"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.values = rng.normal(70, 10, size=(300, 60))
+        self.values[rng.random(self.values.shape) < 0.25] = np.nan
+
+    def test_bootstrap_matches_analytic(self):
+        """Test bootstrap intervals agree with analytic ones"""
+        bootstrap = bootstrap_intervals(self.values, seed=1)
+        analytic = analytic_intervals(self.values)
+        np.testing.assert_allclose(bootstrap.estimate, np.nanmean(self.values, axis=1))
+        np.testing.assert_allclose(bootstrap.estimate, analytic.estimate)
+        self.assertTrue((bootstrap.lower < bootstrap.estimate).all())
+        self.assertTrue((bootstrap.upper > bootstrap.estimate).all())
+        self.assertAlmostEqual(bootstrap.width.mean() / analytic.width.mean(), 1.0, delta=0.1)
+
+        again = bootstrap_intervals(self.values, seed=1)
+        np.testing.assert_array_equal(again.lower, bootstrap.lower)
+
+    def test_small_sample_coverage(self):
+        """Test analytic intervals use Student t critical values and cover at small n"""
+        np.testing.assert_allclose(student_t_quantile(0.95, np.array([1, 2, 4, 29])),
+                                   [12.706, 4.303, 2.776, 2.045], atol=1e-3)
+        self.assertTrue(np.isnan(student_t_quantile(0.95, np.array([0]))[0]))
+
+        values = np.random.default_rng(3).normal(50, 10, size=(4000, 3))
+        result = analytic_intervals(values)
+        covered = ((result.lower <= 50) & (result.upper >= 50)).mean()
+        self.assertAlmostEqual(covered, 0.95, delta=0.015)
+
+    def test_sparse_rows(self):
+        """Test rows with no or one value"""
+        values = np.array([[np.nan, np.nan, np.nan], [5.0, np.nan, np.nan], [1.0, 2.0, 3.0]])
+        bootstrap = bootstrap_intervals(values, ["none", "one", "three"], seed=0)
+        self.assertTrue(np.isnan(bootstrap.lower[0]))
+        self.assertEqual(bootstrap.interval("one"), (5.0, 5.0))
+        self.assertEqual(bootstrap.rows()[0]["estimate"], None)
+        self.assertEqual(bootstrap.support.tolist(), [0, 1, 3])
+        self.assertTrue(np.isnan(analytic_intervals(values).lower[1]))
+
+    def test_grouped_observations(self):
+        """Test observations grouped by label"""
+        labels, matrix = group_values(["b", "a", "b", "c"], [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(labels, ["a", "b", "c"])
+        np.testing.assert_array_equal(matrix, [[2.0, np.nan], [1.0, 3.0], [4.0, np.nan]])
+
+        result = aggregate_intervals(["b", "a", "b", "c"], [1.0, 2.0, 3.0, 4.0], method="analytic")
+        self.assertEqual(result.labels, ["a", "b", "c"])
+        self.assertEqual(result.estimate.tolist(), [2.0, 2.0, 4.0])
+        with self.assertRaises(ValueError):
+            aggregate_intervals(["a"], [1.0], method="jackknife")
+
+    def test_comparison_matrix(self):
+        """Test model and prompt intervals from a comparison matrix"""
+        scores = np.full((2, 3, len(DIMENSIONS)), np.nan)
+        scores[0, :, 0] = [80, 70, 90]
+        scores[1, :2, 0] = [60, 50]
+        matrix = ComparisonMatrix(["a", "b"], ["p1", "p2", "p3"], scores)
+
+        models = matrix_intervals(matrix, seed=0)
+        self.assertEqual(models.labels, ["a", "b"])
+        self.assertEqual(models.estimate.tolist(), [80.0, 55.0])
+        self.assertLessEqual(models.upper[1], 60)
+        prompts = matrix_intervals(matrix, axis="prompt", method="analytic")
+        self.assertEqual(prompts.support.tolist(), [2, 2, 1])
+        self.assertEqual(prompts.to_dict()["intervals"][2]["lower"], None)
+
+
+class TestDocumentIntervals(unittest.TestCase):
+    """Test sentence-resampling intervals for single documents"""
+
+    def test_component_arrays_match_spec(self):
+        """Test vectorized components match the spec row by row"""
+        spec = get_spec()
+        rng = np.random.default_rng(3)
+        counts = rng.integers(0, 4, size=(5, len(spec.features))).astype(np.float64)
+        arrays = component_arrays(spec, counts)
+        for row in range(len(counts)):
+            expected = spec.component_values(counts[row].astype(int).tolist())
+            for dimension, components in expected.items():
+                for name, value in components.items():
+                    self.assertAlmostEqual(arrays[dimension][name][row], value)
+
+    def test_sample_document(self):
+        """Test document intervals around the exact score"""
+        path = sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md")))[0]
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        result = document_intervals(content, seed=0)
+        expected = score_dimensions(content)
+        self.assertEqual(result.estimate[0], expected["overallScore"])
+        self.assertEqual(result.estimate[1], expected["realityIndex"])
+        self.assertTrue((result.lower <= result.upper).all())
+        self.assertGreater(result.support[0], 1)
+        self.assertTrue(((result.score() >= 0) & (result.score() <= 1)).all())
+
+    def test_single_sentence(self):
+        """Test single-sentence and empty documents"""
+        result = document_intervals("I can help verify this with a source, but I am not certain.", seed=0)
+        np.testing.assert_array_equal(result.lower, result.estimate)
+        np.testing.assert_array_equal(result.upper, result.estimate)
+        empty = document_intervals("", seed=0)
+        self.assertTrue(np.isnan(empty.lower).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
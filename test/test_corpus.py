@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Sharded Corpus Tests
+Tests lazy iteration, sampling and context filtering of test-case corpora
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.corpus import CorpusReader, write_corpus
+
+CONTEXTS = ["Educational", "Opinion", "Creative"]
+
+
+def make_case(i: int) -> dict:
+    return {
+        "name": f"case-{i}",
+        "input": {"content": f"Sample content {i}.",
+                  "metadata": {"source": "Test Model", "context": CONTEXTS[i % 3]}},
+        "expected": {"realityIndex": {"min": 3.0, "max": 10.0}}
+    }
+
+
+class TestShardedCorpus(unittest.TestCase):
+    """Test the sharded corpus format"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        write_corpus(self.tmpdir.name, (make_case(i) for i in range(20)), shard_size=6)
+        self.reader = CorpusReader(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_manifest_and_iteration(self):
+        """Test manifest counts and lazy iteration order"""
+        self.assertEqual(len(self.reader), 20)
+        self.assertEqual(len(self.reader.shards), 4)
+        self.assertEqual(self.reader.contexts(), {"Educational": 7, "Opinion": 7, "Creative": 6})
+        self.assertEqual([c["name"] for c in self.reader], [f"case-{i}" for i in range(20)])
+        self.assertEqual(self.reader[13], make_case(13))
+
+    def test_filter_by_context(self):
+        """Test filtering by metadata.context"""
+        names = [c["name"] for c in self.reader.filter("Creative")]
+        self.assertEqual(names, [f"case-{i}" for i in range(2, 20, 3)])
+        self.assertEqual(list(self.reader.filter("Technical")), [])
+
+    def test_sampling(self):
+        """Test reproducible random sampling"""
+        sample = self.reader.sample(5, seed=7)
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(sample, self.reader.sample(5, seed=7))
+        opinion = self.reader.sample(3, seed=1, context="Opinion")
+        self.assertTrue(all(c["input"]["metadata"]["context"] == "Opinion" for c in opinion))
+
+
+if __name__ == "__main__":
+    unittest.main()
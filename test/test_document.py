@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Document Tests
+Tests span-based sentence segmentation and per-document caching
+"""
+
+import glob
+import os
+import re
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.document import Document, segment_sentences
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+class TestDocument(unittest.TestCase):
+    """Test sentence spans and cached document views"""
+
+    def test_matches_regex_split_on_plain_text(self):
+        """Test spans agree with re.split when no abbreviations or decimals occur"""
+        text = "First point. Second point!  Third?! \n Fourth...   "
+        expected = [s.strip() for s in re.split(r"[.!?]+", text) if s.strip()]
+        self.assertEqual(list(Document(text).sentences()), expected)
+
+    def test_abbreviations_and_decimals(self):
+        """Test that et al., e.g. and decimals do not split sentences"""
+        text = "Vaswani et al. introduced it in 2017. Version 1.18 uses e.g. caching. Done"
+        self.assertEqual(list(Document(text).sentences()),
+                         ["Vaswani et al. introduced it in 2017", "Version 1.18 uses e.g. caching", "Done"])
+        self.assertEqual(list(Document("The answer is no. We move on. Done.").sentences()),
+                         ["The answer is no", "We move on", "Done"])
+        self.assertEqual(list(Document("See No. 5 for details. Done").sentences()),
+                         ["See No. 5 for details", "Done"])
+        starts, ends = segment_sentences("")
+        self.assertEqual((len(starts), len(ends)), (0, 0))
+
+    def test_spans_and_caching(self):
+        """Test spans index the original text and views are shared within a scope"""
+        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md"))):
+            with open(path, encoding="utf-8") as handle:
+                text = handle.read()
+            with Document.scope(text) as document:
+                starts, ends = document.sentence_spans
+                self.assertGreater(document.sentence_count, 3)
+                self.assertTrue((starts < ends).all() and (ends[:-1] <= starts[1:]).all())
+                self.assertIs(Document.of(text), document)
+                self.assertIs(document.lower, document.lower)
+                self.assertIs(Document.of(document), document)
+            self.assertIsNot(Document.of(text), document)
+
+
+if __name__ == "__main__":
+    unittest.main()
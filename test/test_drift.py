@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Drift Monitor Tests
+Tests incremental EWMA/window drift detection over scored streams
+"""
+
+import math
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.drift import DriftMonitor, result_dimensions
+
+
+def detect_drift(values, alpha=0.3, limit=3.0):
+    """Reference port of drift.ts detectDrift (full recomputation)"""
+    history, last = values[:-1], values[-1]
+    n = len(history)
+    mean = sum(history) / n
+    std = math.sqrt(sum((v - mean) ** 2 for v in history) / max(1, n - 1))
+    smoothed = history[0]
+    for v in history[1:]:
+        smoothed = alpha * v + (1 - alpha) * smoothed
+    threshold = (std or 0.05) * limit
+    return abs(last - smoothed) > threshold, threshold, smoothed
+
+
+class TestDriftMonitor(unittest.TestCase):
+    """Test incremental drift detection against the full recomputation"""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.values = ([rng.gauss(70, 3) for _ in range(120)] + [96]
+                       + [rng.gauss(70, 3) for _ in range(30)])
+
+    def test_matches_detect_drift(self):
+        """Test events and thresholds match detectDrift on the growing series"""
+        monitor = DriftMonitor(window=len(self.values))
+        for t, value in enumerate(self.values):
+            event = monitor.update("claude", "overallScore", value)
+            if t < 2:
+                self.assertIsNone(event)
+                continue
+            drifting, threshold, smoothed = detect_drift(self.values[:t + 1])
+            self.assertEqual(event is not None, drifting)
+            if event is not None:
+                self.assertAlmostEqual(event.threshold, threshold)
+                self.assertAlmostEqual(event.ewma, smoothed)
+        self.assertIn(120, [event.observation for event in monitor.events])
+
+    def test_window_stats_and_state(self):
+        """Test ring-buffer window stats, many series and serialisation"""
+        monitor = DriftMonitor(window=20, capacity=2)
+        for value in self.values:
+            for model in ("claude", "deepseek", "gpt"):
+                monitor.update(model, "realityIndex", value)
+        window = self.values[-20:]
+        mean = sum(window) / 20
+        stats = monitor.stats("gpt", "realityIndex")
+        self.assertEqual(stats["count"], len(self.values))
+        self.assertAlmostEqual(stats["mean"], mean)
+        self.assertAlmostEqual(stats["std"], math.sqrt(sum((v - mean) ** 2 for v in window) / 19))
+        self.assertAlmostEqual(stats["slope"], (window[-1] - window[0]) / 19)
+
+        restored = DriftMonitor.from_dict(monitor.to_dict())
+        self.assertEqual(restored.stats("claude", "realityIndex"), monitor.stats("claude", "realityIndex"))
+        with self.assertRaises(ValueError):
+            DriftMonitor(capacity=0)
+        with self.assertRaises(ValueError):
+            DriftMonitor(window=0)
+
+    def test_observe_results(self):
+        """Test feeding tester results and the drift callback"""
+        seen = []
+        monitor = DriftMonitor(on_drift=seen.append)
+        result = {"overall_score": 74, "reality_index": {"overall": 8.1},
+                  "trust_protocol": {"overall": "PASS"}, "canvas_parity": {"overall": 71}}
+        self.assertEqual(result_dimensions(result)["trustProtocol"], 100.0)
+        for _ in range(10):
+            self.assertEqual(monitor.observe("claude", result), [])
+        events = monitor.observe("claude", dict(result, trust_protocol={"overall": "FAIL"}))
+        self.assertEqual([event.dimension for event in events], ["trustProtocol"])
+        self.assertEqual(seen, events)
+
+
+if __name__ == "__main__":
+    unittest.main()
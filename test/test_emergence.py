@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Conversation Emergence Tests
+Tests sliding-window emergence aggregates over multi-turn conversations
+"""
+
+import glob
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.emergence import ConversationEmergence, analyze_conversation
+from src.lib.symbi_framework.variants import get_tester
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+class TestConversationEmergence(unittest.TestCase):
+    """Test incremental window aggregates against whole-text scoring"""
+
+    def setUp(self):
+        self.turns = []
+        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md"))):
+            with open(path, encoding="utf-8") as handle:
+                self.turns.extend(part for part in handle.read().split("\n\n") if part.strip())
+        self.tester = get_tester("balanced")
+
+    def test_turn_and_window_scores(self):
+        """Test turn scores and window scores match the tester's emergence bonus"""
+        analyzer = ConversationEmergence(window=4)
+        for i, turn in enumerate(self.turns):
+            result = analyzer.add_turn(turn)
+            self.assertAlmostEqual(result["score"], self.tester.detect_emergence_patterns(turn))
+            recent = self.turns[max(0, i - 3):i + 1]
+            window = result["window"]
+            self.assertEqual(window["turns"], len(recent))
+            self.assertAlmostEqual(window["score"], self.tester.detect_emergence_patterns("\n".join(recent)))
+
+    def test_hits_slide_with_window(self):
+        """Test group hits enter and leave the window"""
+        turns = ["Think of attention as a spotlight. In other words, focus.",
+                 "Plain text.", "More plain text.", "Still plain."]
+        results = analyze_conversation([{"content": t, "role": "assistant"} for t in turns], window=2)
+        self.assertEqual(results[0]["hits"], {"analogy": 1, "structure": 0, "synthesis": 1})
+        self.assertEqual(results[1]["window"]["hits"]["analogy"], 1)
+        self.assertEqual(results[2]["window"]["hits"]["analogy"], 0)
+        self.assertEqual(results[3]["window"]["score"], 0)
+        self.assertEqual(results[0]["role"], "assistant")
+
+    def test_invalid_window(self):
+        """Test that windows smaller than one turn are rejected"""
+        for window in (0, -1):
+            with self.assertRaises(ValueError):
+                ConversationEmergence(window=window)
+
+
+if __name__ == "__main__":
+    unittest.main()
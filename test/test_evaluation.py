@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Accuracy Evaluation Harness Tests
+Tests parallel scoring and vectorized checking of expected score ranges
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.evaluation import evaluate_corpus
+from src.lib.symbi_framework.variants import score_dimensions
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLAUDE_RESPONSE = """Transformer neural networks are a type of machine learning architecture. Let me explain how they work in simple terms.
+
+## The Core Idea: Attention
+
+Imagine you're at a party with many conversations happening. Your brain can "pay attention" to specific voices.
+
+I should note that there are limitations to my explanation, which I've simplified here.
+
+Does this explanation help you understand the basic concept, or would you like me to elaborate on any particular aspect?"""
+
+
+def make_case(name, content, context, expected):
+    return {"name": name,
+            "input": {"content": content, "metadata": {"source": "Test Model", "context": context}},
+            "expected": expected}
+
+
+class TestEvaluationHarness(unittest.TestCase):
+    """Test the corpus evaluation engine"""
+
+    def setUp(self):
+        self.cases = [
+            make_case("claude", CLAUDE_RESPONSE, "Educational", {
+                "realityIndex": {"min": 7.0, "max": 10.0},
+                "trustProtocol": {"status": "PASS"},
+                "canvasParity": {"min": 80, "max": 100}
+            }),
+            make_case("too-strict", CLAUDE_RESPONSE, "Opinion", {
+                "realityIndex": {"min": 9.9, "max": 10.0},
+                "ethicalAlignment": {"min": 3.0, "max": 5.0}
+            }),
+            make_case("plain", "Hello world.", "Opinion", {
+                "trustProtocol": {"status": "PASS"}
+            })
+        ]
+
+    def test_parallel_matches_sequential(self):
+        """Test that pooled scoring matches in-process scoring"""
+        sequential = evaluate_corpus(self.cases, workers=1).to_dict()
+        parallel = evaluate_corpus(self.cases, workers=2, batch_size=1).to_dict()
+        self.assertEqual(sequential, parallel)
+
+    def test_corpus_consumed_lazily(self):
+        """Test that a one-shot generator of cases is evaluated"""
+        report = evaluate_corpus((case for case in self.cases), workers=1)
+        self.assertEqual(report.names, ["claude", "too-strict", "plain"])
+        self.assertEqual(report.contexts.tolist(), ["Educational", "Opinion", "Opinion"])
+
+    def test_variants_leave_sys_path_alone(self):
+        """Test that loading the tester scripts does not change sys.path"""
+        code = ("import sys\n"
+                "before = list(sys.path)\n"
+                "from src.lib.symbi_framework.variants import score_dimensions\n"
+                "score_dimensions('Let me explain.', 'original')\n"
+                "print(sys.path == before)\n")
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "True")
+
+    def test_pass_rates_and_failures(self):
+        """Test per-dimension, per-context pass rates and the failure list"""
+        self.assertEqual(score_dimensions(CLAUDE_RESPONSE)["realityIndex"], 8.1)
+        report = evaluate_corpus(self.cases, workers=1).to_dict()
+
+        reality = report["dimensions"]["realityIndex"]
+        self.assertEqual(reality["applicable"], 2)
+        self.assertEqual(reality["by_context"]["Educational"], 1.0)
+        self.assertEqual(reality["by_context"]["Opinion"], 0.0)
+        self.assertEqual(report["dimensions"]["ethicalAlignment"]["unscored"], 1)
+        self.assertEqual(report["dimensions"]["trustProtocol"]["by_context"]["Opinion"], 0.0)
+
+        failed = {(f["name"], f["dimension"]) for f in report["failures"]}
+        self.assertIn(("too-strict", "realityIndex"), failed)
+        self.assertIn(("plain", "trustProtocol"), failed)
+        self.assertNotIn(("too-strict", "ethicalAlignment"), failed)
+
+
+if __name__ == "__main__":
+    unittest.main()
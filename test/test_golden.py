@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Golden Snapshot Tests
+Tests columnar golden score snapshots and tolerance diffing
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.golden import GoldenSnapshot, GoldenStore, snapshot_contents
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+def result(overall, reality, canvas, trust):
+    return {"overallScore": overall, "realityIndex": reality, "canvasParity": canvas, "trustProtocol": trust}
+
+
+class TestGoldenSnapshots(unittest.TestCase):
+    """Test snapshot round trips and diffs against golden versions"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.store = GoldenStore(os.path.join(self.tmp, "golden"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_sample_round_trip(self):
+        """Test that a saved snapshot loads back and diffs clean against itself"""
+        paths = sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md")))
+        contents = [open(path, encoding="utf-8").read() for path in paths]
+        ids = [os.path.basename(path) for path in paths]
+        snapshot = snapshot_contents("2025.09.26-rc1", ids, contents, ("balanced", "original"), workers=1)
+        self.store.save(snapshot)
+        self.assertEqual(self.store.versions(), ["2025.09.26-rc1"])
+
+        loaded = self.store.load("2025.09.26-rc1")
+        self.assertEqual(loaded.variants, ["balanced", "original"])
+        self.assertEqual(loaded.scorers, snapshot.scorers)
+        diff = self.store.compare("2025.09.26-rc1", snapshot)
+        self.assertTrue(diff.clean)
+        self.assertEqual(diff.changes(), [])
+
+    def test_diff_reports_only_changed_documents(self):
+        """Test that only documents moved beyond tolerance are reported"""
+        golden = GoldenSnapshot.from_results("v1", ["a", "b", "c"], {"balanced": [
+            result(80, 7.5, 70, "PASS"), result(60, 5.0, 50, "PARTIAL"), result(40, 3.0, 30, "FAIL")]})
+        current = GoldenSnapshot.from_results("v2", ["c", "b", "d"], {"balanced": [
+            result(42, 3.0, 30, "FAIL"), result(60, 5.4, 50, "PASS"), result(90, 9.0, 90, "PASS")]})
+
+        diff = golden.diff(current, {"overallScore": 2})
+        self.assertEqual(diff.counts()["balanced"],
+                         {"overallScore": 0, "realityIndex": 1, "canvasParity": 0, "trustProtocol": 1})
+        changes = diff.changes()
+        self.assertEqual([change["id"] for change in changes], ["b"])
+        self.assertEqual(changes[0]["changes"]["balanced"]["trustProtocol"],
+                         {"golden": "PARTIAL", "current": "PASS"})
+        report = diff.to_dict()
+        self.assertEqual((report["added"], report["removed"]), (["d"], ["a"]))
+        self.assertFalse(diff.clean)
+        loose = {"overallScore": 2, "realityIndex": 0.5, "trustProtocol": 1}
+        self.assertEqual(golden.diff(current, loose).changes(), [])
+
+    def test_large_diff_is_vectorized(self):
+        """Test a diff over many reordered documents"""
+        n = 200000
+        ids = np.array([b"doc-%07d" % i for i in range(n)])
+        columns = {"balanced": {"overallScore": np.full(n, 70, dtype=np.int16),
+                                "realityIndex": np.full(n, 7.0),
+                                "canvasParity": np.full(n, 60, dtype=np.int16),
+                                "trustProtocol": np.full(n, 2, dtype=np.int8)}}
+        golden = GoldenSnapshot("v1", ids, columns)
+        moved = {variant: {dim: column.copy() for dim, column in dims.items()} for variant, dims in columns.items()}
+        moved["balanced"]["overallScore"][::1000] += 5
+        diff = golden.diff(GoldenSnapshot("v2", ids[::-1].copy(), {
+            "balanced": {dim: column[::-1].copy() for dim, column in moved["balanced"].items()}}))
+        self.assertEqual(int(diff.changed_mask.sum()), n // 1000)
+
+    def test_missing_columns_are_changes(self):
+        """Test that variants and dimensions absent from the current run are reported"""
+        golden = GoldenSnapshot.from_results("v1", ["a", "b"], {
+            "balanced": [result(80, 7.5, 70, "PASS"), result(60, 5.0, 50, "PARTIAL")],
+            "original": [result(70, 7.0, 60, "PASS"), result(50, 4.0, 40, "FAIL")]})
+        columns = {dim: column.copy() for dim, column in golden.columns["balanced"].items()
+                   if dim != "canvasParity"}
+        diff = golden.diff(GoldenSnapshot("v2", golden.ids.copy(), {"balanced": columns}))
+
+        self.assertFalse(diff.clean)
+        self.assertEqual(diff.missing, {"balanced": ["canvasParity"],
+                                        "original": list(golden.columns["original"])})
+        self.assertEqual(diff.counts()["balanced"]["canvasParity"], 2)
+        self.assertEqual(diff.counts()["balanced"]["overallScore"], 0)
+        change = diff.changes()[0]["changes"]
+        self.assertEqual(change["balanced"]["canvasParity"], {"golden": 70, "current": None})
+        self.assertEqual(change["original"]["trustProtocol"], {"golden": "PASS", "current": None})
+        self.assertEqual(diff.to_dict()["missing"]["balanced"], ["canvasParity"])
+
+    def test_invalid_version(self):
+        """Test that version names cannot escape the store directory"""
+        with self.assertRaises(ValueError):
+            self.store.path("../escape")
+
+
+if __name__ == "__main__":
+    unittest.main()
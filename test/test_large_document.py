@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Large Document Tests
+Tests the balanced scoring spec and windowed memory-mapped scoring
+"""
+
+import glob
+import hashlib
+import inspect
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.large_document import LargeDocumentScorer, score_large_document
+from src.lib.symbi_framework import spec as spec_module
+from src.lib.symbi_framework.spec import BALANCED_SPEC, BALANCED_TESTER_DIGEST, LOWER, TERM, get_spec
+from src.lib.symbi_framework.variants import get_tester, score
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+def str_counts(content):
+    """Feature counts computed on str copies only"""
+    lowered = content.lower()
+    counts = []
+    for feature in BALANCED_SPEC.features:
+        text = lowered if feature.target == LOWER else content
+        if feature.kind == TERM:
+            counts.append(int(feature.source in text))
+        elif feature.count:
+            counts.append(len(feature.compiled.findall(text)))
+        else:
+            counts.append(int(bool(feature.compiled.search(text))))
+    return counts
+
+
+class TestLargeDocument(unittest.TestCase):
+    """Test spec equivalence and window merge semantics"""
+
+    def setUp(self):
+        self.samples = [open(path, encoding="utf-8").read()
+                        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md")))]
+
+    def test_spec_matches_tester(self):
+        """Test the declarative spec reproduces the balanced tester"""
+        for content in self.samples + ["", "Do you? You, you... ## A ## B ## C"]:
+            self.assertEqual(BALANCED_SPEC.score(content), score(content, "balanced"))
+        with self.assertRaises(ValueError):
+            get_spec("unknown")
+
+    def test_spec_tracks_tester_source(self):
+        """Test the tester the spec was transcribed from is unchanged"""
+        source = inspect.getsource(type(get_tester("balanced")))
+        self.assertEqual(hashlib.sha256(source.encode("utf-8")).hexdigest(), BALANCED_TESTER_DIGEST,
+                         "test_balanced_detection.py changed: update BALANCED_SPEC to match, "
+                         "then BALANCED_TESTER_DIGEST")
+
+    def test_spec_matches_tester_on_mixed_documents(self):
+        """Test spec parity on documents mixing sample lines and spec terms"""
+        rng = random.Random(0)
+        lines = [line for sample in self.samples for line in sample.splitlines() if line.strip()]
+        terms = [feature.source for feature in BALANCED_SPEC.features if feature.kind == TERM]
+        for _ in range(200):
+            parts = rng.sample(lines, rng.randint(1, 20)) + rng.sample(terms, rng.randint(0, 6))
+            rng.shuffle(parts)
+            content = "\n".join(part.upper() if rng.random() < 0.1 else part for part in parts)
+            self.assertEqual(BALANCED_SPEC.score(content), score(content, "balanced"))
+
+    def test_version_follows_rules(self):
+        """Test the spec version changes with its rules only"""
+        rebuilt = spec_module._build_balanced()
+        self.assertEqual(rebuilt.version, BALANCED_SPEC.version)
+        rebuilt.dimensions["canvas_parity"][0].rules[0].weight += 1
+        rebuilt._version = None
+        self.assertNotEqual(rebuilt.version, BALANCED_SPEC.version)
+        self.assertTrue(rebuilt.version.startswith("balanced/"))
+
+    def test_ascii_bytes_path(self):
+        """Test ASCII documents scored as bytes match the str path"""
+        for content in self.samples + ["YOU?? Let Me EXPLAIN. ## A", "Unit\x1fsep: you\x1cunderstand"]:
+            if content.isascii():
+                self.assertEqual(BALANCED_SPEC.extract_bytes(content.encode("ascii")), str_counts(content))
+        self.assertEqual(BALANCED_SPEC.score("YOU?? Let Me EXPLAIN."), score("YOU?? Let Me EXPLAIN.", "balanced"))
+
+    def test_windows_match_full_scan(self):
+        """Test small windows merge to the same feature counts as one pass"""
+        scorer = LargeDocumentScorer(window_size=256, max_reach=300)
+        documents = self.samples + ["\n".join(self.samples), "Σίσυφος naïve café? " * 40 + self.samples[0]]
+        for content in documents:
+            self.assertEqual(scorer.counts(content.encode("utf-8")), BALANCED_SPEC.extract(content))
+        self.assertGreater(scorer.windows, 1)
+
+    def test_long_lines_pair_like_full_scan(self):
+        """Test count pairings that depend on the scan start match the balanced tester"""
+        tokens = ["**bold**", "**", "1. **Item** text", "word", "you?", "x" * 50]
+        lines = []
+        for i in range(120):
+            lines.append(" ".join(tokens[(i * 7 + j * j) % len(tokens)] for j in range(40 + i * 5)))
+        content = "\n".join(lines)
+        scorer = LargeDocumentScorer(window_size=4096, max_reach=300)
+        for document in (content, "é " + content):
+            counts = scorer.counts(document.encode("utf-8"))
+            self.assertEqual(counts, BALANCED_SPEC.extract(document))
+            self.assertEqual(BALANCED_SPEC.evaluate(counts), score(document, "balanced"))
+        self.assertGreater(scorer.windows, 10)
+
+    def test_score_file(self):
+        """Test scoring a memory-mapped file"""
+        content = "\n".join(self.samples) * 20
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "transcript.md")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(content)
+            results = score_large_document(path, window_size=64 * 1024)
+            empty = os.path.join(tmp, "empty.md")
+            open(empty, "w").close()
+            empty_results = score_large_document(empty)
+
+        self.assertGreater(results.pop("windows"), 1)
+        self.assertEqual(results, BALANCED_SPEC.score(content))
+        self.assertEqual(empty_results.pop("windows"), 0)
+        self.assertEqual(empty_results, BALANCED_SPEC.score(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Memory-Mapped Corpus Tests
+Tests offset indexing, zero-copy records and range-based parallel scoring
+"""
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework import mapped_corpus
+from src.lib.symbi_framework.mapped_corpus import MappedCorpus, build_offsets, score_mapped
+from src.lib.symbi_framework.variants import score_dimensions
+
+CONTENTS = [
+    "I should note that this explanation is simplified.",
+    "Transformers use attention. Does this help you understand?",
+    "Résumé: naïve café prose — still one record.",
+]
+
+
+class TestMappedCorpus(unittest.TestCase):
+    """Test the memory-mapped corpus reader"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.jsonl = os.path.join(self.tmpdir.name, "cases.jsonl")
+        with open(self.jsonl, "w", encoding="utf-8", newline="") as handle:
+            for i, content in enumerate(CONTENTS):
+                handle.write(json.dumps({"name": f"case-{i}", "input": {"content": content}}))
+                handle.write("\r\n" if i == 0 else "\n\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_records_are_zero_copy_views(self):
+        """Test that records are memoryview slices and decode to the written contents"""
+        with MappedCorpus(self.jsonl, field="input.content") as corpus:
+            self.assertEqual(len(corpus), 3)
+            record = corpus.record(1)
+            self.assertIsInstance(record, memoryview)
+            self.assertEqual(json.loads(bytes(record))["name"], "case-1")
+            self.assertEqual([corpus.content(i) for i in range(3)], CONTENTS)
+            self.assertEqual(len(corpus.records(1)), 2)
+        self.assertTrue(os.path.exists(self.jsonl + ".offsets.npz"))
+
+    def test_index_reused_and_invalidated(self):
+        """Test that the persisted index is reused until the file changes"""
+        with mock.patch.object(mapped_corpus, "build_offsets", wraps=build_offsets) as build:
+            MappedCorpus(self.jsonl).close()
+            with MappedCorpus(self.jsonl) as corpus:
+                self.assertEqual(len(corpus), 3)
+            self.assertEqual(build.call_count, 1)
+            with open(self.jsonl, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"name": "case-3", "input": {"content": "More."}}) + "\n")
+            os.utime(self.jsonl, ns=(1, 1))
+            with MappedCorpus(self.jsonl) as corpus:
+                self.assertEqual(len(corpus), 4)
+            self.assertEqual(build.call_count, 2)
+
+    def test_chunked_scan(self):
+        """Test that separators are found across scan chunk boundaries"""
+        data = b"ab\ncd\n\nefg\nh" * 5
+        expected = build_offsets(data)
+        with mock.patch.object(mapped_corpus, "SCAN_CHUNK", 4):
+            chunked = build_offsets(data)
+        self.assertEqual([a.tolist() for a in chunked], [a.tolist() for a in expected])
+        self.assertEqual(len(expected[0]), 16)
+
+    def test_multibyte_separator_and_empty_file(self):
+        """Test multi-byte separators and an empty file"""
+        starts, ends = build_offsets(b"one\x1e\x1etwo\x1e\x1e\x1e\x1ethree", b"\x1e\x1e")
+        self.assertEqual(list(zip(starts.tolist(), ends.tolist())), [(0, 3), (5, 8), (12, 17)])
+        empty = os.path.join(self.tmpdir.name, "empty.txt")
+        open(empty, "wb").close()
+        with MappedCorpus(empty) as corpus:
+            self.assertEqual(len(corpus), 0)
+
+    def test_pickles_by_path_and_scores_ranges(self):
+        """Test pickling by path and scoring record ranges in-process and in a pool"""
+        with MappedCorpus(self.jsonl, field="input.content") as corpus:
+            clone = pickle.loads(pickle.dumps(corpus))
+            self.assertEqual(clone.content(2), CONTENTS[2])
+            clone.close()
+        expected = [score_dimensions(content) for content in CONTENTS]
+        self.assertEqual(score_mapped(self.jsonl, field="input.content", workers=1), expected)
+        self.assertEqual(score_mapped(self.jsonl, field="input.content", workers=2, batch_size=1), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,6 +19,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import detector modules
 from src.lib.symbi_framework.ml_enhanced_detector import MLEnhancedSymbiFrameworkDetector
 from src.lib.symbi_framework.types import AssessmentInput, AssessmentResult
+from src.lib.symbi_framework.corpus import CorpusReader, MANIFEST_NAME, write_corpus
 
 class TestMLEnhancedDetection(unittest.TestCase):
     """Test cases for ML-Enhanced SYMBI Framework Detection"""
@@ -35,26 +36,23 @@ class TestMLEnhancedDetection(unittest.TestCase):
             'min_time': float('inf')
         }
 
-    def _load_test_cases(self) -> List[Dict[str, Any]]:
-        """Load test cases from JSON file"""
-        test_cases_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'data',
-            'ml_test_cases.json'
-        )
+    def _load_test_cases(self) -> CorpusReader:
+        """Load test cases from the sharded corpus"""
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+        corpus_dir = os.path.join(data_dir, 'ml_test_cases')
+        legacy_path = os.path.join(data_dir, 'ml_test_cases.json')
         
-        # Create test cases directory if it doesn't exist
-        os.makedirs(os.path.dirname(test_cases_path), exist_ok=True)
+        # If the corpus doesn't exist, build it from the legacy JSON file or sample data
+        if not os.path.exists(os.path.join(corpus_dir, MANIFEST_NAME)):
+            if os.path.exists(legacy_path):
+                with open(legacy_path, 'r') as f:
+                    cases = json.load(f)
+            else:
+                cases = self._generate_sample_test_cases()
+            write_corpus(corpus_dir, cases)
         
-        # If test cases file doesn't exist, create it with sample data
-        if not os.path.exists(test_cases_path):
-            sample_test_cases = self._generate_sample_test_cases()
-            with open(test_cases_path, 'w') as f:
-                json.dump(sample_test_cases, f, indent=2)
-        
-        # Load test cases from file
-        with open(test_cases_path, 'r') as f:
-            return json.load(f)
+        # Cases are parsed lazily as the tests iterate
+        return CorpusReader(corpus_dir)
 
     def _generate_sample_test_cases(self) -> List[Dict[str, Any]]:
         """Generate sample test cases for testing"""
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Multilingual Scoring Tests
+Tests language identification and per-language term automata
+"""
+
+import glob
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.multilingual import MultilingualScorer, TermAutomaton, detect_language
+from src.lib.symbi_framework.spec import BALANCED_SPEC
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+RESPONSES = {
+    "es": "Déjame explicar cómo funciona la arquitectura. Por ejemplo, en otras palabras, esto significa "
+          "que el modelo es complejo. Cabe señalar que es una explicación simplificada. ¿Te ayuda esto?",
+    "fr": "Laissez-moi expliquer comment fonctionne l'architecture. Par exemple, autrement dit, cela signifie "
+          "que le modèle est complexe. Notez que cette explication est simplifiée. Est-ce que cela aide ?",
+    "ar": "دعني أشرح كيف تعمل البنية. على سبيل المثال، بعبارة أخرى، هذا يعني أن النموذج معقد. "
+          "تجدر الإشارة إلى أن هذا شرح مبسط. هل يساعدك هذا؟",
+    "hi": "मुझे समझाने दीजिए कि आर्किटेक्चर कैसे काम करता है। उदाहरण के लिए, दूसरे शब्दों में, इसका मतलब है "
+          "कि मॉडल जटिल है। ध्यान दें कि यह सरलीकृत व्याख्या है। क्या इससे मदद मिली?",
+    "zh": "让我解释一下变换器架构。例如，换句话说，这意味着模型很复杂。需要注意，这是简化的解释。这有帮助吗？"
+}
+
+
+class TestMultilingualScoring(unittest.TestCase):
+    """Test language detection, automata and scoring across languages"""
+
+    def setUp(self):
+        self.scorer = MultilingualScorer()
+        self.english = [open(path, encoding="utf-8").read()
+                        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md")))]
+
+    def test_detect_language(self):
+        """Test the script and stopword pre-pass"""
+        for language, text in RESPONSES.items():
+            self.assertEqual(detect_language(text), language)
+        for text in self.english:
+            self.assertEqual(detect_language(text), "en")
+        self.assertEqual(detect_language(""), "en")
+
+    def test_english_is_unchanged(self):
+        """Test English responses score exactly as the spec"""
+        for text in self.english:
+            results = self.scorer.score(text)
+            self.assertEqual(results.pop("language"), "en")
+            self.assertEqual(results, BALANCED_SPEC.score(text))
+
+    def test_native_terms_score(self):
+        """Test native markers lift scores above the English-only tables"""
+        for language, text in RESPONSES.items():
+            results = self.scorer.score(text)
+            self.assertEqual(results["language"], language)
+            self.assertEqual(results["trust_protocol"]["overall"], "PASS")
+            self.assertGreater(results["overall_score"], BALANCED_SPEC.score(text)["overall_score"])
+
+    def test_automaton_overlaps_and_boundaries(self):
+        """Test longest-match terms still report their prefixes, and word starts"""
+        automaton = TermAutomaton({"red": [0], "red neuronal": [1], "uso": [2]}, word_start=True)
+        self.assertEqual(automaton.scan("Una RED NEURONAL y otra red"), {0: 2, 1: 1})
+        self.assertEqual(automaton.scan("abuso"), {})
+        cjk = TermAutomaton({"神经网络": [0], "网络": [1]})
+        self.assertEqual(cjk.scan("神经网络和网络"), {0: 1, 1: 2})
+        with self.assertRaises(ValueError):
+            self.scorer.automaton("de")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pattern Guard Tests
+Tests the backtracking-risk checker and time-budgeted scoring fallbacks
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.pattern_guard import (
+    GuardedScorer, analyze_pattern, literal_chains
+)
+from src.lib.symbi_framework.variants import get_tester, score
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "sample_responses", "claude_transformer_explanation.md")
+
+
+class TestPatternGuard(unittest.TestCase):
+    """Test static pattern analysis and the runtime guard"""
+
+    def test_static_analysis(self):
+        """Test complexity estimates for known pattern shapes"""
+        self.assertEqual(analyze_pattern(r"let me explain").complexity, "O(n^1)")
+        self.assertEqual(analyze_pattern(r"help.*?understand").complexity, "O(n^2)")
+        self.assertEqual(analyze_pattern(r"first.*?second.*?third").complexity, "O(n^3)")
+        self.assertEqual(analyze_pattern(r"(a+)+b").complexity, "exponential")
+        self.assertEqual(analyze_pattern(r"\d+\.").complexity, "O(n^2)")
+        self.assertEqual(analyze_pattern(r"^\d+\.").complexity, "O(n^1)")
+
+    def test_overlapping_alternatives(self):
+        """Test that alternatives sharing a first character under a repeat are exponential"""
+        self.assertTrue(analyze_pattern(r"(a|aa)*b").exponential)
+        self.assertTrue(analyze_pattern(r"(?:a|\w\w)*b").exponential)
+        self.assertFalse(analyze_pattern(r"(ab|a)*b").exponential)
+        self.assertFalse(analyze_pattern(r"(?:cat|dog)+s").exponential)
+
+    def test_variant_audit(self):
+        """Test that the balanced variant's risky patterns are flagged at load time"""
+        flagged = {risk.pattern for risk in GuardedScorer("balanced").risky_patterns}
+        self.assertIn("first.*?second.*?third", flagged)
+        self.assertIn(r"\d+\.\s+\*\*.*?\*\*", flagged)
+        self.assertNotIn("let me explain", flagged)
+
+    def test_literal_chains(self):
+        """Test decomposition of wildcard-separated literals"""
+        self.assertEqual(literal_chains(r"vaswani.*?et al|2017"), [["vaswani", "et al"], ["2017"]])
+        self.assertIsNone(literal_chains(r"like.*?(?:party|brain)"))
+
+    def test_hostile_input_is_degraded_within_budget(self):
+        """Test that a backtracking-heavy document is scored quickly and marked degraded"""
+        scorer = GuardedScorer("balanced", budget=0.05, safe_length=5000)
+        result = scorer.score("first attention models like " * 3000)
+        self.assertTrue(result["degraded"])
+        self.assertIn("first.*?second.*?third", result["degraded_patterns"])
+        self.assertLess(result["elapsed"], 2.0)
+        self.assertIs(get_tester("balanced").re, re)
+
+    def test_normal_input_is_exact(self):
+        """Test that ordinary responses are scored exactly"""
+        with open(SAMPLE_PATH) as f:
+            content = f.read()
+        result = GuardedScorer("balanced", budget=1.0).score(content)
+        self.assertFalse(result["degraded"])
+        self.assertEqual(result["overall_score"], score(content)["overall_score"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Detector Profiling Tests
+Tests per-dimension and per-pattern instrumentation of the detector variants
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.profiling import Profiler
+from src.lib.symbi_framework.variants import get_tester, score
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "sample_responses", "claude_transformer_explanation.md")
+
+
+class TestProfiling(unittest.TestCase):
+    """Test the opt-in profiling layer"""
+
+    def setUp(self):
+        with open(SAMPLE_PATH) as f:
+            self.content = f.read()
+
+    def test_profiled_scores_match_and_instrumentation_is_removed(self):
+        """Test that profiling does not change scores and unpatches afterwards"""
+        profiler = Profiler()
+        self.assertEqual(profiler.score(self.content, "balanced"), score(self.content, "balanced"))
+
+        tester = get_tester("balanced")
+        module = sys.modules[type(tester).__module__]
+        self.assertIs(module.re, re)
+        self.assertIs(tester.re, re)
+        self.assertNotIn("calculate_reality_index_balanced", vars(tester))
+
+    def test_records_patterns_terms_and_dimensions(self):
+        """Test that nodes are attributed to dimensions and exported"""
+        profiler = Profiler()
+        profiler.score(self.content, "balanced")
+        paths = set(profiler.nodes)
+
+        self.assertIn(("balanced", "reality_index", "emergence_patterns", r"re:this allows"), paths)
+        self.assertIn(("balanced", "trust_protocol", "term:vaswani"), paths)
+        self.assertEqual(profiler.nodes[("balanced", "canvas_parity")][0], 1)
+
+        for line in profiler.to_collapsed().splitlines():
+            self.assertRegex(line, r"^balanced(;[^; ]+)* \d+$")
+
+        merged = Profiler.from_dict(profiler.to_dict()).merge(profiler)
+        self.assertEqual(merged.nodes[("balanced",)][0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Retention Enforcement Tests
+Tests expiry of Context Bridge tickets by scope.max_retention_days
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.retention import RetentionStore, SECONDS_PER_DAY
+
+T0 = 1_700_000_000.0
+
+
+def make_ticket(days: int) -> dict:
+    return {
+        "ticket_version": "1.0",
+        "scope": {"allow_raw": False, "allow_training": False,
+                  "max_retention_days": days, "purpose": "academic_research"}
+    }
+
+
+class TestRetentionStore(unittest.TestCase):
+    """Test the retention enforcement engine"""
+
+    def test_whole_segment_dropped_when_expired(self):
+        """Test that fully expired segments are dropped in bulk"""
+        dropped = []
+        store = RetentionStore(segment_size=4, on_drop=dropped.append)
+        for i in range(8):
+            store.add(f"cbt_{i}", make_ticket(90), issued_at=T0)
+
+        self.assertEqual(store.sweep(T0 + 89 * SECONDS_PER_DAY).expired, [])
+        result = store.sweep(T0 + 90 * SECONDS_PER_DAY)
+        self.assertEqual(len(result.expired), 8)
+        self.assertEqual(sorted(dropped), [0, 1])
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.segment_count, 0)
+
+    def test_partial_segment_compacted_with_rate_limit(self):
+        """Test that partially expired segments are compacted under the rate limit"""
+        compacted = {}
+        store = RetentionStore(segment_size=4, compaction_rate=4,
+                               on_compact=lambda sid, ids: compacted.update({sid: ids}))
+        for i in range(8):
+            store.add(f"cbt_{i}", make_ticket(30 if i % 2 else 90), issued_at=T0)
+
+        result = store.sweep(T0 + 31 * SECONDS_PER_DAY)
+        self.assertEqual(sorted(result.expired), ["cbt_1", "cbt_3", "cbt_5", "cbt_7"])
+        self.assertEqual(result.queued_segments, [0])  # open segment is not compacted
+        self.assertNotIn("cbt_1", store)
+        with self.assertRaises(KeyError):
+            store.get("cbt_1")
+        self.assertEqual(store.get("cbt_2")["scope"]["max_retention_days"], 90)
+
+        store.limiter.tokens = 0
+        self.assertEqual(store.compact(now=store.limiter.updated), 0)
+        self.assertEqual(store.compact(now=store.limiter.updated + 1.0), 1)
+        self.assertEqual(compacted, {0: ["cbt_0", "cbt_2"]})
+
+    def test_segment_queued_when_sealed_after_expiry(self):
+        """Test that tickets expired in an open segment queue it once it seals"""
+        store = RetentionStore(segment_size=10)
+        for i in range(6):
+            store.add(f"old_{i}", make_ticket(30 if i else 90), issued_at=T0)
+        self.assertEqual(len(store.sweep(T0 + 31 * SECONDS_PER_DAY).expired), 5)
+        self.assertEqual(store.pending_compactions, 0)
+        for i in range(5):
+            store.add(f"new_{i}", make_ticket(90), issued_at=T0)
+        self.assertEqual(store.pending_compactions, 1)
+        store.sweep(T0 + 32 * SECONDS_PER_DAY)
+        self.assertEqual(store.pending_compactions, 1)
+
+    def test_oversized_segment_charged_in_full(self):
+        """Test that a segment larger than the bucket leaves it in debt"""
+        store = RetentionStore(segment_size=8, compaction_rate=2)
+        for i in range(12):
+            store.add(f"cbt_{i}", make_ticket(30 if i % 2 else 90), issued_at=T0)
+        store.sweep(T0 + 31 * SECONDS_PER_DAY)
+        now = store.limiter.updated
+        self.assertEqual(store.compact(now=now), 1)
+        self.assertEqual(store.limiter.tokens, 2 - 8)
+        self.assertFalse(store.limiter.consume(1, now + 3.0))
+        self.assertTrue(store.limiter.consume(1, now + 3.5))
+
+    def test_expiry_from_transparency_log(self):
+        """Test that issue time defaults to the first transparency log entry"""
+        store = RetentionStore()
+        ticket = make_ticket(90)
+        ticket["transparency_log"] = [{"when": "2025-09-26T07:45:00Z", "cbt_id": "cbt_123456"}]
+        expires_at = store.add("cbt_123456", ticket)
+        self.assertEqual(expires_at, 1758872700.0 + 90 * SECONDS_PER_DAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Token Stream Tests
+Tests interned tokenization and word-boundary term matching
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.document import Document
+from src.lib.symbi_framework import tokens
+from src.lib.symbi_framework.tokens import TokenStream, Vocabulary
+
+
+class TestTokenStreams(unittest.TestCase):
+    """Test ID streams, phrase lookups and batch matrices"""
+
+    def setUp(self):
+        self.vocabulary = Vocabulary()
+
+    def test_interning(self):
+        """Test words map to stable dense uint32 IDs"""
+        stream = TokenStream.from_text("the model and the data", self.vocabulary)
+        self.assertEqual(stream.ids.dtype, np.uint32)
+        self.assertEqual(stream.ids.tolist(), [0, 1, 2, 0, 3])
+        self.assertEqual(self.vocabulary.words, ["the", "model", "and", "data"])
+        self.assertEqual(len(TokenStream.from_text("", self.vocabulary)), 0)
+
+    def test_word_boundaries(self):
+        """Test terms match whole words only, unlike substring checks"""
+        text = "let me explain: to denote a value, i should note the ai model"
+        stream = TokenStream.from_text(text, self.vocabulary)
+        terms = ["ai", "note", "plain", "i should note", "should note the", "model ai", "denote"]
+        self.assertEqual(stream.present(terms).tolist(), [True, True, False, True, True, False, True])
+        self.assertFalse(TokenStream.from_text("explain it", self.vocabulary).contains("ai"))
+        self.assertEqual(stream.count("note"), 1)
+        self.assertEqual(stream.count("i should note"), 1)
+
+    def test_matrix_and_document_cache(self):
+        """Test the batch presence matrix and the cached document stream"""
+        streams = [TokenStream.from_text(text, self.vocabulary)
+                   for text in ["you can help", "no match here", "help you understand"]]
+        term_set = self.vocabulary.term_set(["you", "help you", "understand"])
+        self.assertIs(self.vocabulary.term_set(["you", "help you", "understand"]), term_set)
+        self.assertEqual(term_set.matrix(streams).tolist(),
+                         [[True, False, False], [False, False, False], [True, True, True]])
+
+        empty = [TokenStream.from_text("", self.vocabulary), TokenStream.from_text("...", self.vocabulary)]
+        self.assertEqual(term_set.matrix(empty).tolist(), [[False] * 3] * 2)
+
+        document = Document("Does This Help You?")
+        self.assertIs(document.tokens, document.tokens)
+        self.assertTrue(document.tokens.contains("help you"))
+
+    def test_default_vocabulary_is_bounded(self):
+        """Test the shared vocabulary is replaced once full and old streams still match"""
+        with mock.patch.object(tokens, "MAX_VOCABULARY", 3):
+            old = TokenStream.from_text("alpha beta gamma delta")
+            new = TokenStream.from_text("alpha beta")
+            self.assertIsNot(new.vocabulary, old.vocabulary)
+            self.assertLess(len(new.vocabulary), 3)
+            term_set = new.vocabulary.term_set(["delta", "beta"])
+            self.assertEqual(term_set.matrix([old, new]).tolist(), [[True, True], [False, True]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Match Trace Tests
+Tests traced scoring: same results, byte offsets and rule contributions
+"""
+
+import glob
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lib.symbi_framework.spec import BALANCED_SPEC, LOWER, count_feature, feature_spans
+from src.lib.symbi_framework.trace import score_traced
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_responses")
+
+
+class TestMatchTrace(unittest.TestCase):
+    """Test traces against untraced scoring"""
+
+    def setUp(self):
+        self.samples = [open(path, encoding="utf-8").read()
+                        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.md")))]
+
+    def assert_offsets(self, content, trace):
+        data = content.encode("utf-8")
+        for feature in BALANCED_SPEC.features:
+            for start, end in trace.matches(feature.index):
+                self.assertLessEqual(0, start)
+                self.assertLessEqual(start, end)
+                if feature.kind == "term":
+                    found = data[start:end].decode("utf-8")
+                    self.assertEqual(found.lower() if feature.target == LOWER else found, feature.source)
+
+    def test_same_results_as_untraced(self):
+        """Test traced scoring returns the untraced results"""
+        for content in self.samples + ["", "İstanbul: I should NOTE that, you know, ÇOK limitation. 1. **A**"]:
+            results, trace = score_traced(content)
+            self.assertEqual(results, BALANCED_SPEC.score(content))
+            self.assertEqual(trace.counts, BALANCED_SPEC.extract(content))
+            self.assert_offsets(content, trace)
+
+    def test_spans_match_counts(self):
+        """Test spans and counts come from the same dispatch for str and bytes"""
+        for content in self.samples:
+            variants = [(content, content.lower())]
+            if content.isascii():
+                data = content.encode("ascii")
+                variants.append((data, data.lower()))
+            for raw, lower in variants:
+                for feature in BALANCED_SPEC.features:
+                    self.assertEqual(len(feature_spans(feature, raw, lower)), count_feature(feature, raw, lower))
+
+    def test_explains_component_scores(self):
+        """Test trace entries add up to the component scores"""
+        content = max(self.samples, key=lambda c: BALANCED_SPEC.score(c)["canvas_parity"]["transparency"])
+        results, trace = score_traced(content)
+        transparency = trace.components()["canvas_parity"]["transparency"]
+        self.assertEqual(transparency["value"], results["canvas_parity"]["transparency"])
+        rules = trace.explain("canvas_parity", "transparency")
+        self.assertTrue(rules)
+        self.assertAlmostEqual(sum(r["contribution"] for r in rules), transparency["contributions"])
+        self.assertEqual(min(100, transparency["base"] + transparency["contributions"]), transparency["value"])
+        self.assertTrue(all(r["matches"] for r in rules))
+        self.assertEqual(trace.to_dict()["spec"], BALANCED_SPEC.version)
+
+    def test_non_ascii_offsets_are_utf8_bytes(self):
+        """Test match offsets are UTF-8 byte offsets"""
+        content = "Ünïcödé prefix — I should note this."
+        _, trace = score_traced(content)
+        entry = next(r for r in trace.explain() if r["source"] == "should note")
+        start, end = entry["matches"][0]
+        self.assertEqual(content.encode("utf-8")[start:end], b"should note")
+
+
+if __name__ == "__main__":
+    unittest.main()
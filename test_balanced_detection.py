@@ -8,8 +8,8 @@ import re
 from typing import Dict, List, Tuple
 
 class BalancedSymbiFrameworkTester:
-    def __init__(self):
-        pass
+    def __init__(self, matcher=re):
+        self.re = matcher
     
     def calculate_reality_index_balanced(self, content: str) -> Dict[str, float]:
         """Balanced Reality Index calculation with emergence detection"""
@@ -23,7 +23,7 @@ class BalancedSymbiFrameworkTester:
             r'let me explain', r'i\'ll explain', r'here\'s how', r'to understand'
         ]
         for pattern in direct_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 mission_score += 0.6
         
         # Contextual goals
@@ -31,7 +31,7 @@ class BalancedSymbiFrameworkTester:
             r'explain.*?in simple terms', r'help.*?understand', r'break.*?down'
         ]
         for pattern in contextual_goals:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 mission_score += 0.8
                 
         mission_score = min(10.0, mission_score)
@@ -45,16 +45,16 @@ class BalancedSymbiFrameworkTester:
             r'this is where', r'why.*?important'
         ]
         for pattern in flow_indicators:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 coherence_score += 0.6
         
         # Detect section transitions
-        transitions = re.findall(r'##\s+', content)
+        transitions = self.re.findall(r'##\s+', content)
         if transitions and len(transitions) > 1:
             coherence_score += len(transitions) * 0.25
         
         # Detect coherent examples
-        if re.search(r'for example|such as|like.*?sentence', content_lower):
+        if self.re.search(r'for example|such as|like.*?sentence', content_lower):
             coherence_score += 0.8
             
         coherence_score = min(10.0, coherence_score)
@@ -72,13 +72,13 @@ class BalancedSymbiFrameworkTester:
                 technical_score += 0.4
         
         # Detect technical explanations with examples
-        if re.search(r'attention.*?mechanism.*?allows', content_lower):
+        if self.re.search(r'attention.*?mechanism.*?allows', content_lower):
             technical_score += 0.8
-        if re.search(r'parallel.*?processing', content_lower):
+        if self.re.search(r'parallel.*?processing', content_lower):
             technical_score += 0.6
         
         # Citations and references
-        if re.search(r'vaswani.*?et al|attention is all you need|2017', content_lower):
+        if self.re.search(r'vaswani.*?et al|attention is all you need|2017', content_lower):
             technical_score += 1.2
             
         technical_score = min(10.0, technical_score)
@@ -91,13 +91,13 @@ class BalancedSymbiFrameworkTester:
             r'i should note', r'let me', r'i\'ll', r'myself \(claude\)'
         ]
         for pattern in personal_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 authenticity_score += 0.6
         
         # Detect conversational elements
-        if re.search(r'does this.*?help', content_lower):
+        if self.re.search(r'does this.*?help', content_lower):
             authenticity_score += 0.8
-        if re.search(r'would you like', content_lower):
+        if self.re.search(r'would you like', content_lower):
             authenticity_score += 0.6
         
         # Penalize generic phrases
@@ -144,7 +144,7 @@ class BalancedSymbiFrameworkTester:
             r'imagine.*?you'
         ]
         for pattern in analogy_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 emergence_score += 0.2
         
         # Detect structural sophistication
@@ -154,7 +154,7 @@ class BalancedSymbiFrameworkTester:
             (r'\d+\.\s+\*\*.*?\*\*', 'numbered_emphasis')
         ]
         for pattern, name in structure_patterns:
-            matches = re.findall(pattern, content)
+            matches = self.re.findall(pattern, content)
             if matches and len(matches) > 2:
                 emergence_score += 0.15
         
@@ -164,7 +164,7 @@ class BalancedSymbiFrameworkTester:
             r'put simply', r'conceptually'
         ]
         for pattern in synthesis_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 emergence_score += 0.15
         
         return min(1.0, emergence_score)  # Moderate maximum emergence bonus
@@ -233,7 +233,7 @@ class BalancedSymbiFrameworkTester:
         agency_score = 55  # Moderate base score
         
         # Direct questions to reader
-        questions = re.findall(r'\?', content)
+        questions = self.re.findall(r'\?', content)
         if questions:
             agency_score += len(questions) * 6
         
@@ -243,11 +243,11 @@ class BalancedSymbiFrameworkTester:
             r'your.*?brain', r'imagine.*?you'
         ]
         for pattern in engagement_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 agency_score += 8
         
         # Second person pronouns
-        you_count = len(re.findall(r'\byou\b', content_lower))
+        you_count = len(self.re.findall(r'\byou\b', content_lower))
         agency_score += min(you_count * 2, 12)
         
         agency_score = min(100, agency_score)
@@ -261,13 +261,13 @@ class BalancedSymbiFrameworkTester:
             r'process.*?simultaneously'
         ]
         for pattern in technical_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 ai_score += 6
         
         # AI self-reference
-        if re.search(r'myself.*?\(claude\)', content_lower):
+        if self.re.search(r'myself.*?\(claude\)', content_lower):
             ai_score += 8
-        if re.search(r'models like.*?bert.*?gpt', content_lower):
+        if self.re.search(r'models like.*?bert.*?gpt', content_lower):
             ai_score += 4
             
         ai_score = min(100, ai_score)
@@ -281,13 +281,13 @@ class BalancedSymbiFrameworkTester:
             r'simplified.*?here', r'involves concepts.*?simplified'
         ]
         for pattern in transparency_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 transparency_score += 10
         
         # Acknowledgment of complexity
-        if re.search(r'actual mathematics.*?complex', content_lower):
+        if self.re.search(r'actual mathematics.*?complex', content_lower):
             transparency_score += 8
-        if re.search(r'conceptually.*?think of', content_lower):
+        if self.re.search(r'conceptually.*?think of', content_lower):
             transparency_score += 6
             
         transparency_score = min(100, transparency_score)
@@ -301,13 +301,13 @@ class BalancedSymbiFrameworkTester:
             r'any particular aspect'
         ]
         for pattern in interactive_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 collab_score += 12
         
         # Collaborative language
-        if re.search(r'let me explain', content_lower):
+        if self.re.search(r'let me explain', content_lower):
             collab_score += 6
-        if re.search(r'help.*?understand', content_lower):
+        if self.re.search(r'help.*?understand', content_lower):
             collab_score += 8
             
         collab_score = min(100, collab_score)
@@ -344,28 +344,34 @@ class BalancedSymbiFrameworkTester:
         # No additional calibration needed
         return round(min(100, weighted_score))
     
-    def test_response_balanced(self, content: str, model_name: str) -> Dict:
-        """Test a response with balanced detection"""
-        print(f"\n=== Balanced Testing {model_name} Response ===")
-        
+    def score_response(self, content: str) -> Dict:
+        """Score a response across all dimensions without printing"""
         reality_index = self.calculate_reality_index_balanced(content)
         trust_protocol = self.calculate_trust_protocol_balanced(content)
         canvas_parity = self.calculate_canvas_parity_balanced(content)
         
-        # Calculate balanced overall score
         overall_score = self.calculate_overall_score_balanced(
             reality_index['overall'],
             trust_protocol['overall'],
             canvas_parity['overall']
         )
         
-        results = {
-            'model': model_name,
+        return {
             'overall_score': overall_score,
             'reality_index': reality_index,
             'trust_protocol': trust_protocol,
             'canvas_parity': canvas_parity
         }
+    
+    def test_response_balanced(self, content: str, model_name: str) -> Dict:
+        """Test a response with balanced detection"""
+        print(f"\n=== Balanced Testing {model_name} Response ===")
+        
+        results = {'model': model_name, **self.score_response(content)}
+        overall_score = results['overall_score']
+        reality_index = results['reality_index']
+        trust_protocol = results['trust_protocol']
+        canvas_parity = results['canvas_parity']
         
         # Print results
         print(f"Overall Score: {overall_score}/100")
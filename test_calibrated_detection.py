@@ -8,8 +8,8 @@ import re
 from typing import Dict, List, Tuple
 
 class CalibratedSymbiFrameworkTester:
-    def __init__(self):
-        pass
+    def __init__(self, matcher=re):
+        self.re = matcher
     
     def calculate_reality_index_calibrated(self, content: str) -> Dict[str, float]:
         """Calibrated Reality Index calculation with emergence detection"""
@@ -23,7 +23,7 @@ class CalibratedSymbiFrameworkTester:
             r'let me explain', r'i\'ll explain', r'here\'s how', r'to understand'
         ]
         for pattern in direct_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 mission_score += 0.8
         
         # Contextual goals
@@ -31,7 +31,7 @@ class CalibratedSymbiFrameworkTester:
             r'explain.*?in simple terms', r'help.*?understand', r'break.*?down'
         ]
         for pattern in contextual_goals:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 mission_score += 1.0
                 
         mission_score = min(10.0, mission_score)
@@ -45,16 +45,16 @@ class CalibratedSymbiFrameworkTester:
             r'this is where', r'why.*?important'
         ]
         for pattern in flow_indicators:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 coherence_score += 0.8
         
         # Detect section transitions
-        transitions = re.findall(r'##\s+', content)
+        transitions = self.re.findall(r'##\s+', content)
         if transitions and len(transitions) > 1:
             coherence_score += len(transitions) * 0.3
         
         # Detect coherent examples
-        if re.search(r'for example|such as|like.*?sentence', content_lower):
+        if self.re.search(r'for example|such as|like.*?sentence', content_lower):
             coherence_score += 1.0
             
         coherence_score = min(10.0, coherence_score)
@@ -72,13 +72,13 @@ class CalibratedSymbiFrameworkTester:
                 technical_score += 0.5
         
         # Detect technical explanations with examples
-        if re.search(r'attention.*?mechanism.*?allows', content_lower):
+        if self.re.search(r'attention.*?mechanism.*?allows', content_lower):
             technical_score += 1.0
-        if re.search(r'parallel.*?processing', content_lower):
+        if self.re.search(r'parallel.*?processing', content_lower):
             technical_score += 0.8
         
         # Citations and references
-        if re.search(r'vaswani.*?et al|attention is all you need|2017', content_lower):
+        if self.re.search(r'vaswani.*?et al|attention is all you need|2017', content_lower):
             technical_score += 1.5
             
         technical_score = min(10.0, technical_score)
@@ -91,13 +91,13 @@ class CalibratedSymbiFrameworkTester:
             r'i should note', r'let me', r'i\'ll', r'myself \(claude\)'
         ]
         for pattern in personal_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 authenticity_score += 0.8
         
         # Detect conversational elements
-        if re.search(r'does this.*?help', content_lower):
+        if self.re.search(r'does this.*?help', content_lower):
             authenticity_score += 1.0
-        if re.search(r'would you like', content_lower):
+        if self.re.search(r'would you like', content_lower):
             authenticity_score += 0.8
         
         # Penalize generic phrases
@@ -144,7 +144,7 @@ class CalibratedSymbiFrameworkTester:
             r'imagine.*?you'
         ]
         for pattern in analogy_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 emergence_score += 0.3
         
         # Detect structural sophistication
@@ -154,7 +154,7 @@ class CalibratedSymbiFrameworkTester:
             (r'\d+\.\s+\*\*.*?\*\*', 'numbered_emphasis')
         ]
         for pattern, name in structure_patterns:
-            matches = re.findall(pattern, content)
+            matches = self.re.findall(pattern, content)
             if matches and len(matches) > 2:
                 emergence_score += 0.2
         
@@ -164,7 +164,7 @@ class CalibratedSymbiFrameworkTester:
             r'put simply', r'conceptually'
         ]
         for pattern in synthesis_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 emergence_score += 0.2
         
         return min(1.5, emergence_score)  # Increased maximum emergence bonus
@@ -233,7 +233,7 @@ class CalibratedSymbiFrameworkTester:
         agency_score = 60  # Higher base score
         
         # Direct questions to reader
-        questions = re.findall(r'\?', content)
+        questions = self.re.findall(r'\?', content)
         if questions:
             agency_score += len(questions) * 8
         
@@ -243,11 +243,11 @@ class CalibratedSymbiFrameworkTester:
             r'your.*?brain', r'imagine.*?you'
         ]
         for pattern in engagement_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 agency_score += 10
         
         # Second person pronouns
-        you_count = len(re.findall(r'\byou\b', content_lower))
+        you_count = len(self.re.findall(r'\byou\b', content_lower))
         agency_score += min(you_count * 3, 15)
         
         agency_score = min(100, agency_score)
@@ -261,13 +261,13 @@ class CalibratedSymbiFrameworkTester:
             r'process.*?simultaneously'
         ]
         for pattern in technical_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 ai_score += 8
         
         # AI self-reference
-        if re.search(r'myself.*?\(claude\)', content_lower):
+        if self.re.search(r'myself.*?\(claude\)', content_lower):
             ai_score += 10
-        if re.search(r'models like.*?bert.*?gpt', content_lower):
+        if self.re.search(r'models like.*?bert.*?gpt', content_lower):
             ai_score += 5
             
         ai_score = min(100, ai_score)
@@ -281,13 +281,13 @@ class CalibratedSymbiFrameworkTester:
             r'simplified.*?here', r'involves concepts.*?simplified'
         ]
         for pattern in transparency_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 transparency_score += 12
         
         # Acknowledgment of complexity
-        if re.search(r'actual mathematics.*?complex', content_lower):
+        if self.re.search(r'actual mathematics.*?complex', content_lower):
             transparency_score += 10
-        if re.search(r'conceptually.*?think of', content_lower):
+        if self.re.search(r'conceptually.*?think of', content_lower):
             transparency_score += 8
             
         transparency_score = min(100, transparency_score)
@@ -301,13 +301,13 @@ class CalibratedSymbiFrameworkTester:
             r'any particular aspect'
         ]
         for pattern in interactive_patterns:
-            if re.search(pattern, content_lower):
+            if self.re.search(pattern, content_lower):
                 collab_score += 15
         
         # Collaborative language
-        if re.search(r'let me explain', content_lower):
+        if self.re.search(r'let me explain', content_lower):
             collab_score += 8
-        if re.search(r'help.*?understand', content_lower):
+        if self.re.search(r'help.*?understand', content_lower):
             collab_score += 10
             
         collab_score = min(100, collab_score)
@@ -345,28 +345,34 @@ class CalibratedSymbiFrameworkTester:
         calibration_adjustment = 10  # Adjust overall score upward
         return round(min(100, weighted_score + calibration_adjustment))
     
-    def test_response_calibrated(self, content: str, model_name: str) -> Dict:
-        """Test a response with calibrated detection"""
-        print(f"\n=== Calibrated Testing {model_name} Response ===")
-        
+    def score_response(self, content: str) -> Dict:
+        """Score a response across all dimensions without printing"""
         reality_index = self.calculate_reality_index_calibrated(content)
         trust_protocol = self.calculate_trust_protocol_calibrated(content)
         canvas_parity = self.calculate_canvas_parity_calibrated(content)
         
-        # Calculate calibrated overall score
         overall_score = self.calculate_overall_score_calibrated(
             reality_index['overall'],
             trust_protocol['overall'],
             canvas_parity['overall']
         )
         
-        results = {
-            'model': model_name,
+        return {
             'overall_score': overall_score,
             'reality_index': reality_index,
             'trust_protocol': trust_protocol,
             'canvas_parity': canvas_parity
         }
+    
+    def test_response_calibrated(self, content: str, model_name: str) -> Dict:
+        """Test a response with calibrated detection"""
+        print(f"\n=== Calibrated Testing {model_name} Response ===")
+        
+        results = {'model': model_name, **self.score_response(content)}
+        overall_score = results['overall_score']
+        reality_index = results['reality_index']
+        trust_protocol = results['trust_protocol']
+        canvas_parity = results['canvas_parity']
         
         # Print results
         print(f"Overall Score: {overall_score}/100")
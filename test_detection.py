@@ -7,13 +7,15 @@ This will help us identify the gaps between manual analysis and automated detect
 import re
 from typing import Dict, List, Tuple
 
+from src.lib.symbi_framework.document import Document
+
 class SymbiFrameworkTester:
-    def __init__(self):
-        pass
+    def __init__(self, matcher=re):
+        self.re = matcher
     
     def calculate_reality_index(self, content: str) -> Dict[str, float]:
         """Calculate Reality Index components"""
-        content_lower = content.lower()
+        content_lower = Document.of(content).lower
         
         # Mission alignment - check for goal-oriented language
         goal_terms = ['goal', 'mission', 'purpose', 'objective', 'aim', 'target', 'explain', 'understand']
@@ -29,11 +31,10 @@ class SymbiFrameworkTester:
         mission_score = min(10.0, mission_score)
         
         # Contextual coherence - analyze sentence structure
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentence_count = Document.of(content).sentence_count
         
         coherence_score = 5.0
-        if len(sentences) >= 3:
+        if sentence_count >= 3:
             # Simple coherence check - look for connecting words
             connecting_words = ['however', 'therefore', 'thus', 'furthermore', 'moreover', 'additionally', 'also', 'since', 'because']
             for word in connecting_words:
@@ -50,11 +51,11 @@ class SymbiFrameworkTester:
                 technical_score += 0.3
         
         # Check for numerical data
-        if re.search(r'\d+(\.\d+)?%?', content):
+        if self.re.search(r'\d+(\.\d+)?%?', content):
             technical_score += 1.0
         
         # Check for citations or references
-        if re.search(r'\[\d+\]|\(\d{4}\)|et al\.|paper|study', content):
+        if self.re.search(r'\[\d+\]|\(\d{4}\)|et al\.|paper|study', content):
             technical_score += 1.5
             
         technical_score = min(10.0, technical_score)
@@ -68,11 +69,11 @@ class SymbiFrameworkTester:
                 authenticity_score -= 0.5
         
         # Check for specific details
-        if re.search(r'\d{4}|\d{1,2}\/\d{1,2}\/\d{2,4}', content):
+        if self.re.search(r'\d{4}|\d{1,2}\/\d{1,2}\/\d{2,4}', content):
             authenticity_score += 1.0
         
         # Check for first-person perspective
-        if re.search(r'\b(i|we|our|my)\b', content_lower):
+        if self.re.search(r'\b(i|we|our|my)\b', content_lower):
             authenticity_score += 0.5
             
         authenticity_score = min(10.0, max(0.0, authenticity_score))
@@ -89,7 +90,7 @@ class SymbiFrameworkTester:
     
     def calculate_trust_protocol(self, content: str) -> Dict[str, str]:
         """Calculate Trust Protocol components"""
-        content_lower = content.lower()
+        content_lower = Document.of(content).lower
         
         # Verification methods
         verification_terms = ['verify', 'validate', 'confirm', 'check', 'evidence', 'proof', 'source', 'reference']
@@ -139,14 +140,12 @@ class SymbiFrameworkTester:
     
     def calculate_canvas_parity(self, content: str) -> Dict[str, int]:
         """Calculate Canvas Parity components"""
-        content_lower = content.lower()
+        tokens = Document.of(content).tokens
         
-        # Human agency
+        # Human agency (whole-word matches)
         human_terms = ['you', 'your', 'user', 'human', 'people', 'person', 'reader', 'understand', 'help']
         agency_score = 50
-        for term in human_terms:
-            if term in content_lower:
-                agency_score += 3
+        agency_score += 3 * tokens.count_present(human_terms)
         
         # Check for questions to reader
         if '?' in content:
@@ -157,21 +156,17 @@ class SymbiFrameworkTester:
         # AI contribution
         ai_terms = ['ai', 'model', 'algorithm', 'system', 'process', 'analysis', 'explain', 'understand']
         ai_score = 50
-        for term in ai_terms:
-            if term in content_lower:
-                ai_score += 3
+        ai_score += 3 * tokens.count_present(ai_terms)
         
         ai_score = min(100, ai_score)
         
         # Transparency
         transparency_terms = ['note', 'should', 'limitation', 'simplified', 'explain', 'clarify', 'understand']
         transparency_score = 50
-        for term in transparency_terms:
-            if term in content_lower:
-                transparency_score += 3
+        transparency_score += 3 * tokens.count_present(transparency_terms)
         
         # Check for explicit acknowledgments
-        if any(phrase in content_lower for phrase in ['i should note', 'limitations', 'simplified', 'acknowledge']):
+        if tokens.present(['i should note', 'limitations', 'simplified', 'acknowledge']).any():
             transparency_score += 10
             
         transparency_score = min(100, transparency_score)
@@ -179,9 +174,7 @@ class SymbiFrameworkTester:
         # Collaboration quality
         collab_terms = ['help', 'understand', 'explain', 'clarify', 'question', 'ask', 'discuss']
         collab_score = 50
-        for term in collab_terms:
-            if term in content_lower:
-                collab_score += 3
+        collab_score += 3 * tokens.count_present(collab_terms)
         
         # Check for interactive elements
         if '?' in content:
@@ -199,28 +192,43 @@ class SymbiFrameworkTester:
             'collaboration_quality': collab_score
         }
     
-    def test_response(self, content: str, model_name: str) -> Dict:
-        """Test a response and return all scores"""
-        print(f"\n=== Testing {model_name} Response ===")
-        
-        reality_index = self.calculate_reality_index(content)
-        trust_protocol = self.calculate_trust_protocol(content)
-        canvas_parity = self.calculate_canvas_parity(content)
+    def calculate_overall_score(self, reality_score, trust_status, canvas_score):
+        """Calculate overall score (simplified)"""
+        # Convert reality score to 0-100 scale
+        reality_score_100 = reality_score * 10
+        trust_score = 100 if trust_status == 'PASS' else 50 if trust_status == 'PARTIAL' else 0
         
-        # Calculate overall score (simplified)
-        reality_score = reality_index['overall'] * 10  # Convert to 0-100 scale
-        trust_score = 100 if trust_protocol['overall'] == 'PASS' else 50 if trust_protocol['overall'] == 'PARTIAL' else 0
-        canvas_score = canvas_parity['overall']
-        
-        overall_score = round((reality_score * 0.4 + trust_score * 0.3 + canvas_score * 0.3))
+        return round((reality_score_100 * 0.4 + trust_score * 0.3 + canvas_score * 0.3))
+    
+    def score_response(self, content: str) -> Dict:
+        """Score a response across all dimensions without printing"""
+        with Document.scope(content):
+            reality_index = self.calculate_reality_index(content)
+            trust_protocol = self.calculate_trust_protocol(content)
+            canvas_parity = self.calculate_canvas_parity(content)
+        
+        overall_score = self.calculate_overall_score(
+            reality_index['overall'],
+            trust_protocol['overall'],
+            canvas_parity['overall']
+        )
         
-        results = {
-            'model': model_name,
+        return {
             'overall_score': overall_score,
             'reality_index': reality_index,
             'trust_protocol': trust_protocol,
             'canvas_parity': canvas_parity
         }
+    
+    def test_response(self, content: str, model_name: str) -> Dict:
+        """Test a response and return all scores"""
+        print(f"\n=== Testing {model_name} Response ===")
+        
+        results = {'model': model_name, **self.score_response(content)}
+        overall_score = results['overall_score']
+        reality_index = results['reality_index']
+        trust_protocol = results['trust_protocol']
+        canvas_parity = results['canvas_parity']
         
         # Print results
         print(f"Overall Score: {overall_score}/100")